@@ -0,0 +1,183 @@
+"""Shows the query plans and timings of the hot lookups with and without the performance indexes.
+
+The script seeds the configured database with a large synthetic data set (1M orders by
+default) and then, for every lookup, runs `EXPLAIN (ANALYZE, BUFFERS)` twice: once inside a
+transaction that drops the indexes added by the `9e4f2a61c3d8` migration (and rolls the drop
+back), and once with the indexes in place.
+
+Seeding is skipped when the database already holds the requested number of orders. Point it at
+a disposable database, the test suite wipes every table before each test:
+
+    DB_NAME=tech_challenge_bench alembic upgrade head
+    DB_NAME=tech_challenge_bench python -m benchmarks.explain_indexes --orders 1000000
+"""
+
+import argparse
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Connection, text
+
+from src.infra.database.config.database import engine
+
+INDEXES = (
+    "ix_order_items_order_id",
+    "ix_order_items_product_id",
+    "ix_payments_order_id",
+    "ix_orders_customer_id",
+    "ix_products_category",
+    "ix_products_lower_name",
+)
+"""The indexes whose effect is measured."""
+
+CUSTOMERS = 10_000
+PRODUCTS = 200
+ITEMS_PER_ORDER = 3
+
+
+@dataclass(frozen=True)
+class Lookup:
+    """A query issued by the application that one of the indexes is meant to serve."""
+
+    name: str
+    sql: str
+    params: Dict[str, object]
+
+
+LOOKUPS = (
+    Lookup(
+        "items of an order",
+        "SELECT * FROM order_items WHERE order_id = :order_id",
+        {"order_id": 500_000},
+    ),
+    Lookup(
+        "items of a product",
+        "SELECT count(*) FROM order_items WHERE product_id = :product_id",
+        {"product_id": 42},
+    ),
+    Lookup(
+        "payment of an order",
+        "SELECT * FROM payments WHERE order_id = :order_id",
+        {"order_id": 500_000},
+    ),
+    Lookup(
+        "orders of a customer",
+        "SELECT * FROM orders WHERE customer_id = :customer_id",
+        {"customer_id": 4_242},
+    ),
+    Lookup(
+        "products of a category",
+        "SELECT * FROM products WHERE category = 'BEBIDA'",
+        {},
+    ),
+    Lookup(
+        "product by name",
+        "SELECT * FROM products WHERE lower(name) = lower(:name)",
+        {"name": "PRODUCT 42"},
+    ),
+)
+
+SEED_STATEMENTS = (
+    """
+    INSERT INTO customers (uuid, name, cpf, email)
+    SELECT gen_random_uuid(), 'Customer ' || i, lpad(i::text, 11, '0'), 'customer' || i || '@example.com'
+    FROM generate_series(1, :customers) AS i
+    """,
+    """
+    INSERT INTO products (uuid, name, category, price, description, images)
+    SELECT gen_random_uuid(), 'Product ' || i,
+           (enum_range(NULL::category))[1 + i % 4], 10 + i % 50, 'Product ' || i, '{}'
+    FROM generate_series(1, :products) AS i
+    """,
+    # 90% of the orders are completed, the rest is spread across the active statuses.
+    """
+    INSERT INTO orders (uuid, customer_id, total_value, status, created_at, updated_at)
+    SELECT gen_random_uuid(), 1 + i % :customers, 30,
+           CASE WHEN i % 10 = 0 THEN (enum_range(NULL::order_status))[1 + i / 10 % 4]
+                ELSE 'COMPLETED' END::order_status,
+           now() - i * interval '1 second', now() - i * interval '1 second'
+    FROM generate_series(1, :orders) AS i
+    """,
+    """
+    INSERT INTO order_items (uuid, order_id, product_id, quantity, unit_price)
+    SELECT gen_random_uuid(), o.id, 1 + (o.id + n) % :products, 1, 10
+    FROM orders AS o CROSS JOIN generate_series(1, :items_per_order) AS n
+    """,
+    """
+    INSERT INTO payments (uuid, order_id, status, details)
+    SELECT gen_random_uuid(), o.id, 'APPROVED', '{}'
+    FROM orders AS o
+    """,
+)
+
+
+def seed(connection: Connection, orders: int) -> None:
+    """Fills empty tables with the synthetic data set, restarting every id sequence at 1."""
+    if connection.scalar(text("SELECT count(*) FROM orders")) >= orders:
+        print(f"Database already seeded with at least {orders:,} orders.")
+        # Ends the transaction the count began, so the lookups can begin their own.
+        connection.rollback()
+        return
+
+    print(f"Seeding {orders:,} orders, this takes a few minutes...")
+    connection.execute(
+        text("TRUNCATE payments, order_items, orders, products, customers RESTART IDENTITY CASCADE")
+    )
+    params = {
+        "customers": CUSTOMERS,
+        "products": PRODUCTS,
+        "orders": orders,
+        "items_per_order": ITEMS_PER_ORDER,
+    }
+    for statement in SEED_STATEMENTS:
+        connection.execute(text(statement), params)
+    connection.execute(text("ANALYZE"))
+    connection.commit()
+
+
+def explain(connection: Connection, lookup: Lookup) -> Tuple[List[str], float]:
+    """Runs the lookup under `EXPLAIN ANALYZE` and returns its plan and execution time (ms)."""
+    plan = list(connection.scalars(text(f"EXPLAIN (ANALYZE, BUFFERS) {lookup.sql}"), lookup.params))
+    execution_time = next(
+        float(match.group(1))
+        for line in plan
+        if (match := re.match(r"Execution Time: ([\d.]+) ms", line))
+    )
+    return plan, execution_time
+
+
+def run(orders: int) -> None:
+    """Seeds the database and prints the before/after comparison of every lookup."""
+    with engine.connect() as connection:
+        seed(connection, orders)
+
+        for lookup in LOOKUPS:
+            # DDL is transactional in PostgreSQL, so the indexes come back on rollback.
+            transaction = connection.begin()
+            try:
+                for index in INDEXES:
+                    connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+                plan_before, time_before = explain(connection, lookup)
+            finally:
+                transaction.rollback()
+
+            with connection.begin():
+                plan_after, time_after = explain(connection, lookup)
+
+            print(f"\n=== {lookup.name}: {time_before:.3f} ms -> {time_after:.3f} ms")
+            print("--- without indexes")
+            print("\n".join(plan_before))
+            print("--- with indexes")
+            print("\n".join(plan_after))
+
+
+def main() -> None:
+    """Parses the command line arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=1_000_000, help="Number of orders to seed")
+    run(parser.parse_args().orders)
+
+
+if __name__ == "__main__":
+    main()
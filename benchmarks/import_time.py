@@ -0,0 +1,86 @@
+"""Measures the cold start of the application, as reported by `python -X importtime`.
+
+Every run happens in a fresh interpreter, so nothing is cached in `sys.modules`; the bytecode
+cache is used if it was written, as it is in the image. Two steps are measured:
+
+- import: `import src.api`, what a process serving or testing the API pays first.
+- build: importing `src.api` and building the application with `create_app()`, which imports
+  the routers and everything they depend on. The database engines are only created once the
+  application starts, so neither step opens a connection.
+
+For each step the script prints its median latency, measured inside the interpreter, the
+number of modules it imported and the slowest of them in its last run.
+
+    python -m benchmarks.import_time --repeat 10
+"""
+
+import argparse
+import re
+import statistics
+import subprocess  # noqa: S404
+import sys
+from operator import itemgetter
+from typing import Dict, List, Tuple
+
+STEPS: Dict[str, str] = {
+    "import": "import src.api",
+    "build": "import src.api; src.api.create_app()",
+}
+
+_TIMED = "import time; start = time.perf_counter(); {}; print(time.perf_counter() - start)"
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)")
+
+
+def run_step(code: str) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """Runs the code in a fresh interpreter, with `-X importtime`.
+
+    Returns:
+        How long the code took, in milliseconds, and for each imported module its name, its
+        own and its cumulative import time in microseconds.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _TIMED.format(code)],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = [
+        (match[3], int(match[1]), int(match[2]))
+        for match in map(_LINE.match, completed.stderr.splitlines())
+        if match
+    ]
+    return float(completed.stdout) * 1000, modules
+
+
+def run(repeat: int, top: int) -> None:
+    """Measures every step, then prints its median time and its slowest imports."""
+    print(f"{'step':<8} {'median ms':>10} {'min ms':>8} {'modules':>8}")
+    slowest: Dict[str, List[Tuple[str, int, int]]] = {}
+    for name, code in STEPS.items():
+        timings: List[float] = []
+        for _ in range(repeat):
+            elapsed, modules = run_step(code)
+            timings.append(elapsed)
+        slowest[name] = sorted(modules, key=itemgetter(1), reverse=True)[:top]
+        print(
+            f"{name:<8} {statistics.median(timings):>10.1f} {min(timings):>8.1f} "
+            f"{len(modules):>8}"
+        )
+
+    for name, modules in slowest.items():
+        print(f"\nslowest modules of {name} (self ms, cumulative ms)")
+        for module, own, cumulative in modules:
+            print(f"  {own / 1000:>7.1f} {cumulative / 1000:>8.1f}  {module}")
+
+
+def main() -> None:
+    """Parses the command line arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Number of runs of each step")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest modules shown")
+    args = parser.parse_args()
+    run(args.repeat, args.top)
+
+
+if __name__ == "__main__":
+    main()
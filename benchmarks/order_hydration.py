@@ -0,0 +1,185 @@
+"""Compares the hydration and listing of orders with and without copying their items.
+
+The orders are hydrated from persistent models built in memory, as a query would load them,
+and then turned into the results of a listing; no database is involved. The script prints the
+latency of each step for the whole batch and per order:
+
+- previous: `Order.items` deep-copies the items, and the product graph of each of them, on
+  every read, as it used to (validation alone reads them twice).
+- current: `Order.items` returns the tuple the order keeps, without copying it.
+
+    python -m benchmarks.order_hydration --orders 1000 --items 3
+"""
+
+import argparse
+import copy
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, ContextManager, Dict, Iterator, List, Tuple
+from uuid import uuid4
+
+from src.core.domain.entities import Order, OrderItem
+from src.core.domain.value_objects import Category, OrderStatus
+from src.core.use_cases.order.list.order_page import to_order_result
+from src.infra.database.persistent_models import (
+    CustomerPersistentModel,
+    OrderItemPersistentModel,
+    OrderPersistentModel,
+    ProductPersistentModel,
+)
+
+STEPS = ("hydration", "listing")
+
+CURRENT_ITEMS = Order.items
+
+
+def _copied_items(self: Order) -> Tuple[OrderItem, ...]:
+    return copy.deepcopy(self._items)
+
+
+@contextmanager
+def previous_items() -> Iterator[None]:
+    """Makes `Order.items` deep-copy the items on every read, as it used to."""
+    Order.items = property(_copied_items)
+    try:
+        yield
+    finally:
+        Order.items = CURRENT_ITEMS
+
+
+@contextmanager
+def current_items() -> Iterator[None]:
+    """Leaves `Order.items` as it is."""
+    yield
+
+
+PATHS: Dict[str, Callable[[], ContextManager[None]]] = {
+    "previous": previous_items,
+    "current": current_items,
+}
+
+
+def valid_cpf(index: int) -> str:
+    """Returns a valid CPF, distinct for each index, whose base number is the index."""
+    digits = [int(digit) for digit in f"{index + 1:09d}"]
+    for length in (9, 10):
+        remainder = sum(d * w for d, w in zip(digits, range(length + 1, 1, -1))) * 10 % 11
+        digits.append(remainder % 10)
+    return "".join(map(str, digits))
+
+
+def build_models(
+    orders: int, items: int, products: int | None = None, customers: int = 1
+) -> List[OrderPersistentModel]:
+    """Builds the persistent models of orders placed by a few customers from a menu of products.
+
+    Args:
+        orders: The number of orders.
+        items: The number of items of each order, each of a different product.
+        products: The number of products of the menu, `items` by default.
+        customers: The number of customers, who take turns placing the orders.
+    """
+    now = datetime.now(timezone.utc)
+    buyers = [
+        CustomerPersistentModel(
+            id=index,
+            uuid=uuid4(),
+            name=f"Customer {index}",
+            email=f"customer{index}@example.com",
+            cpf=valid_cpf(index),
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(customers)
+    ]
+    menu = [
+        ProductPersistentModel(
+            id=index,
+            uuid=uuid4(),
+            name=f"Product {index}",
+            category=Category.LANCHE,
+            price=6.25,
+            description="A product of the benchmark",
+            images=[f"https://example.com/{index}/{image}.png" for image in range(5)],
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(max(products or items, items))
+    ]
+    return [
+        OrderPersistentModel(
+            id=order,
+            uuid=uuid4(),
+            customer=buyers[order % customers],
+            status=OrderStatus.RECEIVED,
+            total_value=12.5 * items,
+            created_at=now,
+            updated_at=now,
+            items=[
+                OrderItemPersistentModel(
+                    id=order * items + index,
+                    uuid=uuid4(),
+                    product=menu[(order + index) % len(menu)],
+                    quantity=2,
+                    unit_price=6.25,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for index in range(items)
+            ],
+        )
+        for order in range(orders)
+    ]
+
+
+def measure(models: List[OrderPersistentModel], repeat: int) -> Dict[str, List[float]]:
+    """Hydrates and lists the orders `repeat` times, returning the timings of each step."""
+    timings: Dict[str, List[float]] = {step: [] for step in STEPS}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        orders = [model.to_entity() for model in models]
+        hydrated = time.perf_counter()
+        [to_order_result(order) for order in orders]
+        listed = time.perf_counter()
+        timings["hydration"].append((hydrated - start) * 1000)
+        timings["listing"].append((listed - hydrated) * 1000)
+    return timings
+
+
+def run(orders: int, items: int, repeat: int) -> None:
+    """Measures every path on the same models, checking that they list the same results."""
+    models = build_models(orders, items)
+    results = {}
+    for name, path in PATHS.items():
+        with path():
+            results[name] = [to_order_result(model.to_entity()) for model in models]
+    if results["previous"] != results["current"]:
+        print("The paths list different results")
+        raise SystemExit(1)
+
+    print(f"{'path':<10} {'step':<10} {'mean ms':>9} {'p50 ms':>9} {'per order us':>13}")
+    for name, path in PATHS.items():
+        with path():
+            timings = measure(models, repeat)
+        for step in STEPS:
+            median = statistics.median(timings[step])
+            print(
+                f"{name:<10} {step:<10} {statistics.mean(timings[step]):>9.2f} {median:>9.2f} "
+                f"{median * 1000 / orders:>13.2f}"
+            )
+
+
+def main() -> None:
+    """Parses the command line arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=1_000, help="Number of orders")
+    parser.add_argument("--items", type=int, default=3, help="Number of items of each order")
+    parser.add_argument("--repeat", type=int, default=10, help="Number of runs of each path")
+    args = parser.parse_args()
+    run(args.orders, args.items, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Compares the presentation of order lists with the path it replaced.
+
+Both paths turn the same in-memory page of `OrderResult`s, shaped like a listing of the given
+size, into the bytes of an HTTP response body; no database is involved. The script prints the
+latency of a whole page and per order:
+
+- previous: the presenter builds validated models, then FastAPI dumps them, validates them again
+  against `response_model` and encodes them with the standard library (`serialize_response`
+  and `JSONResponse`, as in a route that returns the model).
+- current: the presenter builds the models with `model_construct` and `TrustedJSONResponse`
+  serializes them with pydantic-core.
+
+    python -m benchmarks.order_list_presentation --orders 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.api.presenters import OrderDetailsPresenter
+from src.api.responses import TrustedJSONResponse
+from src.api.schemas import CustomerSummaryOut, OrderItemOut, OrderOut, OrderPageOut
+from src.api.types import CPFStr
+from src.core.domain.value_objects import OrderStatus
+from src.core.use_cases.order import (
+    CustomerSummaryResult,
+    OrderItemResult,
+    OrderPageResult,
+    OrderResult,
+)
+
+RESPONSE_FIELD = create_response_field(name="Response_list_orders", type_=OrderPageOut)
+
+
+def previous_present(data: OrderResult) -> OrderOut:
+    """Presents an order the way `OrderDetailsPresenter` used to, validating every model."""
+    return OrderOut(
+        number=data.uuid,
+        customer=CustomerSummaryOut(
+            name=data.customer.name, email=data.customer.email, cpf=CPFStr(data.customer.cpf)
+        ),
+        status=data.status,
+        total_value=data.total_value,
+        created_at=data.created_at,
+        updated_at=data.updated_at,
+        items=[
+            OrderItemOut(
+                product_name=item.product_name, quantity=item.quantity, unit_price=item.unit_price
+            )
+            for item in data.items
+        ],
+    )
+
+
+def previous_path(page: OrderPageResult) -> bytes:
+    """Builds the response body of a page the way the listing routes used to."""
+    content = OrderPageOut(
+        items=[previous_present(order) for order in page.items], next_cursor=page.next_cursor
+    )
+    serialized = asyncio.run(serialize_response(field=RESPONSE_FIELD, response_content=content))
+    return JSONResponse(serialized).body
+
+
+def current_path(page: OrderPageResult) -> bytes:
+    """Builds the response body of a page with the presenter and the trusted response."""
+    content = OrderPageOut(
+        items=OrderDetailsPresenter().present_many(page.items), next_cursor=page.next_cursor
+    )
+    return TrustedJSONResponse(content, OrderPageOut).body
+
+
+PATHS: Dict[str, Callable[[OrderPageResult], bytes]] = {
+    "previous": previous_path,
+    "current": current_path,
+}
+
+
+def build_page(orders: int) -> OrderPageResult:
+    """Builds a page of orders of three items each, as the listing use cases return them."""
+    now = datetime.now(timezone.utc)
+    customer = CustomerSummaryResult(
+        name="Benchmark", email="benchmark@example.com", cpf="52998224725"
+    )
+    return OrderPageResult(
+        items=[
+            OrderResult(
+                uuid=uuid4(),
+                created_at=now,
+                updated_at=now,
+                status=OrderStatus.RECEIVED,
+                total_value=37.5,
+                customer=customer,
+                items=[
+                    OrderItemResult(product_name=f"Product {item}", quantity=2, unit_price=6.25)
+                    for item in range(3)
+                ],
+            )
+            for _ in range(orders)
+        ],
+        next_cursor="benchmark",
+    )
+
+
+def run(orders: int, repeat: int) -> None:
+    """Measures every path on the same page, checking that they build the same body."""
+    page = build_page(orders)
+    if previous_path(page) != current_path(page):
+        print("The paths build different bodies")
+        raise SystemExit(1)
+
+    print(f"{'path':<10} {'mean ms':>9} {'p50 ms':>9} {'per order us':>13}")
+    for name, path in PATHS.items():
+        timings: List[float] = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            path(page)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        median = statistics.median(timings)
+        print(
+            f"{name:<10} {statistics.mean(timings):>9.2f} {median:>9.2f} "
+            f"{median * 1000 / orders:>13.2f}"
+        )
+
+
+def main() -> None:
+    """Parses the command line arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=10_000, help="Number of orders in the page")
+    parser.add_argument("--repeat", type=int, default=10, help="Number of pages built by each path")
+    args = parser.parse_args()
+    run(args.orders, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measures the memory held by hydrated orders and by the results listing them.
+
+The orders are hydrated from persistent models built in memory, as a query would load them,
+and then turned into the results of a listing; no database is involved. `tracemalloc` traces
+the memory allocated by each step and still held once it is done, and the script prints it in
+total and per order. The persistent models themselves are built before tracing starts.
+
+The orders are hydrated in two ways:
+
+- per row: every order builds its own customer and the products of its items, as each
+  `to_entity` call does on its own.
+- per query: each distinct customer and product is built once and shared by the orders of the
+  result, as the repositories do with `OrderPersistentModel.to_entities`.
+
+Run it on two commits to compare the representations of the entities and results:
+
+    python -m benchmarks.order_memory --orders 10000 --items 3 --products 50 --customers 200
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.order_hydration import build_models
+from src.core.domain.entities import Order
+from src.core.use_cases.order.list.order_page import to_order_result
+from src.infra.database.persistent_models import OrderPersistentModel
+
+PATHS: Dict[str, Callable[[List[OrderPersistentModel]], List[Order]]] = {
+    "per row": lambda models: [model.to_entity() for model in models],
+    "per query": OrderPersistentModel.to_entities,
+}
+
+
+def traced(step: Callable[[], object]) -> Tuple[object, int, int]:
+    """Runs a step, returning its output and the bytes and blocks it allocated and still holds."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        output = step()
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(statistic.count for statistic in snapshot.statistics("filename"))
+    return output, size, blocks
+
+
+def run(orders: int, items: int, products: int, customers: int) -> None:
+    """Hydrates and lists the orders, printing the memory held by the output of each step."""
+    models = build_models(orders, items, products, customers)
+
+    print(f"{'path':<10} {'step':<10} {'held KiB':>10} {'per order B':>12} {'blocks':>9}")
+    for name, hydrate in PATHS.items():
+        entities, hydration_bytes, hydration_blocks = traced(lambda: hydrate(models))  # noqa: B023
+        results, listing_bytes, listing_blocks = traced(
+            lambda: [to_order_result(order) for order in entities]  # noqa: B023
+        )
+        if len(results) != orders:
+            print("Some orders were not listed")
+            raise SystemExit(1)
+
+        for step, size, blocks in (
+            ("hydration", hydration_bytes, hydration_blocks),
+            ("listing", listing_bytes, listing_blocks),
+        ):
+            print(f"{name:<10} {step:<10} {size / 1024:>10.1f} {size / orders:>12.0f} {blocks:>9}")
+
+
+def main() -> None:
+    """Parses the command line arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=10_000, help="Number of orders")
+    parser.add_argument("--items", type=int, default=3, help="Number of items of each order")
+    parser.add_argument("--products", type=int, default=50, help="Number of distinct products")
+    parser.add_argument("--customers", type=int, default=200, help="Number of distinct customers")
+    args = parser.parse_args()
+    run(args.orders, args.items, args.products, args.customers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Compares the payment confirmation flow with the one it replaced.
+
+Each flow confirms (approves) its own batch of freshly created pending payments, one session per
+confirmation as a webhook request would, and the script prints the number of statements and the
+latency of a confirmation.
+
+The previous flow is rebuilt from the repository calls it made: load the payment with its whole
+order graph, update the payment, load the order graph again, update the order and load the
+payment graph once more to return it. Its order update is the current single-statement one, so
+the measured gap is a lower bound.
+
+The orders belong to a dedicated customer and products, created on first run. Point it at a
+disposable database, the test suite wipes every table before each test. A large data set, such
+as the one seeded by `explain_indexes`, gives more realistic index lookups:
+
+    DB_NAME=tech_challenge_bench alembic upgrade head
+    DB_NAME=tech_challenge_bench python -m benchmarks.payment_confirmation --payments 2000
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, Dict, List
+from uuid import UUID
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from src.core.domain.entities.payment import PaymentStatus
+from src.core.domain.value_objects import OrderStatus
+from src.core.use_cases import PaymentConfirmationUseCase
+from src.infra.database.config.database import SessionLocal, engine
+from src.infra.database.persistent_models.payment_persistent_model import PaymentPersistentModel
+from src.infra.database.repositories import (
+    SQLAlchemyOrderRepository,
+    SQLAlchemyPaymentRepository,
+)
+
+CREATE_CATALOG = (
+    # The seeded data set is meant for query plans: its CPFs and products would not hydrate.
+    """
+    INSERT INTO customers (uuid, name, cpf, email)
+    VALUES (gen_random_uuid(), 'Benchmark', '52998224725', 'benchmark@example.com')
+    ON CONFLICT (cpf) DO UPDATE SET name = excluded.name
+    RETURNING id
+    """,
+    """
+    INSERT INTO products (uuid, name, category, price, description, images)
+    SELECT gen_random_uuid(), 'Benchmark ' || i, 'LANCHE', 10, 'Benchmark product',
+           ARRAY['https://example.com/benchmark.png']
+    FROM generate_series(1, 3) AS i
+    ON CONFLICT (name) DO UPDATE SET price = excluded.price
+    RETURNING id
+    """,
+)
+
+CREATE_PENDING_PAYMENTS = """
+    WITH new_orders AS (
+        INSERT INTO orders (uuid, customer_id, total_value, status)
+        SELECT gen_random_uuid(), :customer_id, 30, 'PAYMENT_PENDING'
+        FROM generate_series(1, :payments)
+        RETURNING id
+    ), new_items AS (
+        INSERT INTO order_items (uuid, order_id, product_id, quantity, unit_price)
+        SELECT gen_random_uuid(), o.id, p.id, 1, 10
+        FROM new_orders AS o CROSS JOIN unnest(CAST(:product_ids AS integer[])) AS p(id)
+    )
+    INSERT INTO payments (uuid, order_id, status, details)
+    SELECT gen_random_uuid(), id, 'PENDING', '{"id": "benchmark"}'
+    FROM new_orders
+    RETURNING uuid
+"""
+
+
+def previous_confirmation(session: Session, payment_uuid: UUID) -> None:
+    """Confirms a payment the way `PaymentConfirmationUseCase` used to."""
+    payments = SQLAlchemyPaymentRepository(session)
+    orders = SQLAlchemyOrderRepository(session)
+
+    payment = payments.get_by_uuid(payment_uuid)
+    payment.update_status(PaymentStatus.APPROVED)
+    # The repository update it used is gone, this is its body.
+    db_payment = session.query(PaymentPersistentModel).filter_by(id=payment.id).first()
+    db_payment.status = PaymentStatus.APPROVED
+    session.commit()
+    session.refresh(db_payment)
+    db_payment.to_entity()
+
+    order = orders.get_by_uuid(payment.order.uuid)
+    order.status = OrderStatus.RECEIVED
+    orders.update_status(order.uuid, OrderStatus.RECEIVED, OrderStatus.RECEIVED.allowed_sources())
+
+    payments.get_by_uuid(payment_uuid)
+
+
+def current_confirmation(session: Session, payment_uuid: UUID) -> None:
+    """Confirms a payment with `PaymentConfirmationUseCase`."""
+    use_case = PaymentConfirmationUseCase(SQLAlchemyPaymentRepository(session))
+    use_case.execute(payment_uuid, PaymentStatus.APPROVED)
+
+
+FLOWS: Dict[str, Callable[[Session, UUID], None]] = {
+    "previous": previous_confirmation,
+    "current": current_confirmation,
+}
+
+
+def create_pending_payments(payments: int) -> List[UUID]:
+    """Creates pending payments, each with its own order awaiting payment."""
+    with engine.begin() as connection:
+        customers, products = (
+            list(connection.scalars(text(statement))) for statement in CREATE_CATALOG
+        )
+        return list(
+            connection.scalars(
+                text(CREATE_PENDING_PAYMENTS),
+                {"payments": payments, "customer_id": customers[0], "product_ids": products},
+            )
+        )
+
+
+def measure(name: str, flow: Callable[[Session, UUID], None], payment_uuids: List[UUID]) -> None:
+    """Confirms every payment with the given flow and prints the statements and latencies."""
+    statements: List[str] = []
+
+    def _on_execute(*args: object) -> None:
+        statements.append(args[2])
+
+    timings: List[float] = []
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    try:
+        for payment_uuid in payment_uuids:
+            start = time.perf_counter()
+            with SessionLocal() as session:
+                flow(session, payment_uuid)
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", _on_execute)
+
+    percentiles = statistics.quantiles(timings, n=100)
+    print(
+        f"{name:<10} {len(statements) / len(payment_uuids):>10.1f} "
+        f"{statistics.mean(timings):>9.3f} {percentiles[49]:>9.3f} {percentiles[94]:>9.3f}"
+    )
+
+
+def run(payments: int) -> None:
+    """Measures every flow, each one on its own batch of pending payments."""
+    print(f"{'flow':<10} {'statements':>10} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, flow in FLOWS.items():
+        measure(name, flow, create_pending_payments(payments))
+
+
+def main() -> None:
+    """Parses the command line arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--payments", type=int, default=1_000, help="Number of payments confirmed by each flow"
+    )
+    run(parser.parse_args().payments)
+
+
+if __name__ == "__main__":
+    main()
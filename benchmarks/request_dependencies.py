@@ -0,0 +1,107 @@
+"""Measures the cost of resolving the dependencies of a request.
+
+Each simulated request opens the request scope, resolves the controller of an endpoint and the
+use case the endpoint calls, as a route does, and closes the scope again. No query is sent, so
+the sessions never connect. The script prints, for each endpoint, the latency per request and
+the number of provider calls, i.e. objects the injector built:
+
+    python -m benchmarks.request_dependencies --requests 2000
+
+Run it on two commits to compare dependency graphs.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from injector import CallableProvider
+
+from src.api.controllers import (
+    AsyncOrderController,
+    CustomerController,
+    OrderController,
+    ProductController,
+)
+from src.api.dependencies import injector
+from src.api.request_scope import request_scope
+from src.core.use_cases import (
+    AsyncListOrdersUseCase,
+    CheckoutUseCase,
+    GetCustomerByCpfUseCase,
+    GetProductsByCategoryUseCase,
+    ListOrdersUseCase,
+)
+
+ENDPOINTS: List[Tuple[str, type, type]] = [
+    ("GET /api/orders", OrderController, ListOrdersUseCase),
+    ("POST /api/orders/checkout", OrderController, CheckoutUseCase),
+    ("GET /api/products", ProductController, GetProductsByCategoryUseCase),
+    ("GET /api/customer/{cpf}", CustomerController, GetCustomerByCpfUseCase),
+    ("GET /api/orders (async)", AsyncOrderController, AsyncListOrdersUseCase),
+]
+"""The endpoints measured, with the controller and use case their route resolves.
+
+The async routes share the paths of the synchronous ones and replace them when
+`ASYNC_ENDPOINTS` is set.
+"""
+
+
+@contextmanager
+def count_provider_calls() -> Iterator[List[int]]:
+    """Counts the calls of the `@provider` methods while the context is open."""
+    calls = [0]
+    original = CallableProvider.get
+
+    def get(self: CallableProvider, injector_: object) -> object:
+        calls[0] += 1
+        return original(self, injector_)
+
+    CallableProvider.get = get
+    try:
+        yield calls
+    finally:
+        CallableProvider.get = original
+
+
+async def handle(endpoint: str, controller: type, use_case: type) -> None:
+    """Resolves the dependencies of one request to the endpoint."""
+    async with request_scope(endpoint, read_only=endpoint.startswith("GET")):
+        injector.get(controller)
+        injector.get(use_case)
+
+
+async def run(requests: int) -> None:
+    """Measures every endpoint, after a warm-up request that builds the singletons."""
+    print(f"{'endpoint':<28} {'mean us':>9} {'p50 us':>9} {'built':>6}")
+    for endpoint, controller, use_case in ENDPOINTS:
+        await handle(endpoint, controller, use_case)
+        with count_provider_calls() as calls:
+            await handle(endpoint, controller, use_case)
+
+        timings: List[float] = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            await handle(endpoint, controller, use_case)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+
+        print(
+            f"{endpoint:<28} {statistics.mean(timings):>9.1f} "
+            f"{statistics.median(timings):>9.1f} {calls[0]:>6}"
+        )
+
+
+def main() -> None:
+    """Parses the command line arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--requests", type=int, default=2_000, help="Number of requests to each endpoint"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Compares the hydration of orders through the validating constructors and the trusted path.
+
+The orders are hydrated from persistent models built in memory, as a query would load them;
+no database is involved. The script prints the latency of hydrating every order and per order:
+
+- validated: the entities and value objects are built with their public constructors, as
+  `to_entity` used to: every CPF and email is checked again, every entity validated and the
+  total of every order recalculated.
+- trusted: `to_entity` restores the stored state as is.
+
+    python -m benchmarks.trusted_hydration --orders 10000 --items 3
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.order_hydration import build_models
+from src.core.domain.entities import Customer, Order, OrderItem, Product
+from src.core.domain.value_objects import CPF, Email
+from src.infra.database.persistent_models import OrderPersistentModel
+
+
+def validated_entity(model: OrderPersistentModel) -> Order:
+    """Hydrates an order with the public constructors, validating everything again."""
+    customer = model.customer
+    return Order(
+        _id=model.id,
+        _items=[
+            OrderItem(
+                _id=item.id,
+                uuid=item.uuid,
+                product=Product(
+                    _id=item.product.id,
+                    name=item.product.name,
+                    category=item.product.category,
+                    price=item.product.price,
+                    description=item.product.description,
+                    images=item.product.images,
+                    uuid=item.product.uuid,
+                    created_at=item.product.created_at,
+                    updated_at=item.product.updated_at,
+                ),
+                quantity=item.quantity,
+                unit_price=item.unit_price,
+                created_at=item.created_at,
+                updated_at=item.updated_at,
+            )
+            for item in model.items
+        ],
+        _total_value=model.total_value,
+        _status=model.status,
+        _customer=Customer(
+            _id=customer.id,
+            uuid=customer.uuid,
+            name=customer.name,
+            cpf=CPF(customer.cpf),
+            email=Email(customer.email),
+            created_at=customer.created_at,
+            updated_at=customer.updated_at,
+        ),
+        uuid=model.uuid,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+PATHS: Dict[str, Callable[[OrderPersistentModel], Order]] = {
+    "validated": validated_entity,
+    "trusted": OrderPersistentModel.to_entity,
+}
+
+
+def run(orders: int, items: int, repeat: int) -> None:
+    """Measures every path on the same models, checking that they hydrate the same orders."""
+    models = build_models(orders, items)
+    if [validated_entity(model) for model in models] != [model.to_entity() for model in models]:
+        print("The paths hydrate different orders")
+        raise SystemExit(1)
+
+    print(f"{'path':<10} {'mean ms':>9} {'p50 ms':>9} {'per order us':>13}")
+    for name, path in PATHS.items():
+        timings: List[float] = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            [path(model) for model in models]
+            timings.append((time.perf_counter() - start) * 1000)
+
+        median = statistics.median(timings)
+        print(
+            f"{name:<10} {statistics.mean(timings):>9.2f} {median:>9.2f} "
+            f"{median * 1000 / orders:>13.2f}"
+        )
+
+
+def main() -> None:
+    """Parses the command line arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=10_000, help="Number of orders")
+    parser.add_argument("--items", type=int, default=3, help="Number of items of each order")
+    parser.add_argument("--repeat", type=int, default=10, help="Number of runs of each path")
+    args = parser.parse_args()
+    run(args.orders, args.items, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
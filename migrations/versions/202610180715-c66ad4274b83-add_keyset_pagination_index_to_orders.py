@@ -0,0 +1,27 @@
+"""Add keyset pagination index to orders.
+
+Revision ID: c66ad4274b83
+Revises: 76f4b0ebfcae
+Create Date: 2026-10-18 07:15:17.973087
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c66ad4274b83"
+down_revision: Union[str, None] = "76f4b0ebfcae"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Perform the upgrade migration."""
+    op.create_index("ix_orders_created_at_id", "orders", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Revert the upgrade migration."""
+    op.drop_index("ix_orders_created_at_id", table_name="orders")
@@ -0,0 +1,38 @@
+"""Add kitchen queue index to orders.
+
+Revision ID: 5b1e9d3c7a20
+Revises: c66ad4274b83
+Create Date: 2026-10-18 07:40:02.418337
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e9d3c7a20"
+down_revision: Union[str, None] = "c66ad4274b83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Perform the upgrade migration."""
+    op.create_index(
+        "ix_orders_kitchen_queue",
+        "orders",
+        ["status", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('RECEIVED', 'PROCESSING', 'READY')"),
+    )
+
+
+def downgrade() -> None:
+    """Revert the upgrade migration."""
+    op.drop_index(
+        "ix_orders_kitchen_queue",
+        table_name="orders",
+        postgresql_where=sa.text("status IN ('RECEIVED', 'PROCESSING', 'READY')"),
+    )
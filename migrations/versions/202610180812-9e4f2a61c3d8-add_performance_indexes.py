@@ -0,0 +1,38 @@
+"""Add indexes on foreign keys and frequently filtered columns.
+
+Revision ID: 9e4f2a61c3d8
+Revises: 5b1e9d3c7a20
+Create Date: 2026-10-18 08:12:44.301925
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4f2a61c3d8"
+down_revision: Union[str, None] = "5b1e9d3c7a20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Perform the upgrade migration."""
+    op.create_index(op.f("ix_order_items_order_id"), "order_items", ["order_id"], unique=False)
+    op.create_index(op.f("ix_order_items_product_id"), "order_items", ["product_id"], unique=False)
+    op.create_index(op.f("ix_payments_order_id"), "payments", ["order_id"], unique=False)
+    op.create_index(op.f("ix_orders_customer_id"), "orders", ["customer_id"], unique=False)
+    op.create_index(op.f("ix_products_category"), "products", ["category"], unique=False)
+    op.create_index("ix_products_lower_name", "products", [sa.text("lower(name)")], unique=False)
+
+
+def downgrade() -> None:
+    """Revert the upgrade migration."""
+    op.drop_index("ix_products_lower_name", table_name="products")
+    op.drop_index(op.f("ix_products_category"), table_name="products")
+    op.drop_index(op.f("ix_orders_customer_id"), table_name="orders")
+    op.drop_index(op.f("ix_payments_order_id"), table_name="payments")
+    op.drop_index(op.f("ix_order_items_product_id"), table_name="order_items")
+    op.drop_index(op.f("ix_order_items_order_id"), table_name="order_items")
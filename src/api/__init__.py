@@ -1,3 +1,21 @@
-from .app import app
+from typing import Any
 
-__all__ = ["app"]
+from fastapi import FastAPI
+
+from .application import create_app
+
+app: FastAPI
+"""The application of the environment, e.g. for `uvicorn src.api:app`.
+
+It is only built when first asked for, so importing a module of this package does not build it.
+"""
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name == "app":
+        built = globals()["app"] = create_app()
+        return built
+    raise AttributeError(name)
+
+
+__all__ = ["app", "create_app"]
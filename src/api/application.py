@@ -0,0 +1,199 @@
+import traceback
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from typing import AsyncIterator, Callable, Coroutine
+
+from anyio import to_thread
+from fastapi import FastAPI, Request, Response
+from starlette.responses import JSONResponse
+
+from src import config
+from src.core.domain.exceptions import DomainError, NotFoundError
+
+
+async def _exception_middleware(
+    request: Request, call_next: Callable[[Request], Coroutine[None, None, Response]]
+) -> Response:
+    """Asynchronous middleware function to handle exceptions in the FastAPI application.
+
+    This function catches exceptions raised during the processing of a request and
+    returns an appropriate HTTP response.
+
+    Args:
+        request: The FastAPI Request object representing the incoming request.
+        call_next: A coroutine function that, when awaited, will call the next middleware or
+         endpoint.
+
+    Returns:
+        A Response object containing the HTTP response to be sent back to the client.
+    """
+    try:
+        return await call_next(request)
+    except Exception as e:
+        return handle_error(e)
+
+
+_READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+"""The HTTP methods whose requests never write, so they may read from the read replica."""
+
+
+def handle_error(e: Exception) -> Response:
+    """Handle exceptions that are raised during the processing of a request.
+
+    This function checks if the exception is an instance of `DomainError`.
+    If it is, it returns a JSON response with a
+    status code of `BAD_REQUEST` and a detail message from the exception.
+
+    If the exception is not a `DomainError`, it returns a JSON response with a status code of
+    `INTERNAL_SERVER_ERROR` and a generic detail message.
+
+    Args:
+        e (Exception): The exception that was raised.
+
+    Returns:
+        Response:
+        A FastAPI Response object containing the HTTP response to be sent back to the client.
+    """
+    if isinstance(e, NotFoundError):
+        return JSONResponse(
+            status_code=HTTPStatus.NOT_FOUND,
+            content={"detail": e.message},
+        )
+
+    if isinstance(e, DomainError):
+        return JSONResponse(
+            status_code=HTTPStatus.BAD_REQUEST,
+            content={"detail": e.message},
+        )
+
+    traceback.print_exc()
+    return JSONResponse(
+        status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error."},
+    )
+
+
+def root() -> dict[str, str]:
+    """Health check endpoint."""
+    return {"status": "OK"}
+
+
+def create_app(settings: config.Settings | None = None) -> FastAPI:
+    """Builds the application.
+
+    Importing this module is cheap: the routers, which pull in every controller, use case,
+    schema and the dependency graph, are only imported here, and the database engines are only
+    created when the application starts.
+
+    The settings reach the routes through `app.state.settings`. Some resources are shared by
+    the whole process, whatever application uses them:
+
+    - The database engines, synchronous and asyncio, are created from the settings of the
+      first application to start; another one with different database settings fails to start.
+    - The in-process caches are sized by the last application to start.
+    - The dependency graph follows the environment settings.
+
+    Args:
+        settings: The settings of the application, those of the environment if None.
+
+    Returns:
+        The application, ready to be served.
+    """
+    settings = settings if settings is not None else config.settings
+
+    from src.infra.cache import configure_caches
+    from src.infra.database.config import (
+        dispose_async_engine,
+        dispose_engines,
+        init_async_engines,
+        init_engines,
+    )
+
+    from .read_your_writes import reads_from_primary, remember_write
+    from .request_scope import request_scope
+    from .routers import (
+        async_customer_router,
+        async_order_router,
+        async_payment_router,
+        async_product_router,
+        customer_router,
+        metrics_router,
+        order_router,
+        payment_router,
+        product_router,
+    )
+    from .routers.webhooks import payment_router as webhook_payment_router
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        """Creates the database engines and sizes the thread pool and the caches.
+
+        The asyncio engines are only configured here, and created once an async route runs.
+
+        The database pool is sized after `settings.WORKER_THREADS` by default, so both must
+        agree. On shutdown, the pooled connections are closed: those of the asyncio engine are
+        bound to the event loop that is going away.
+        """
+        to_thread.current_default_thread_limiter().total_tokens = settings.WORKER_THREADS
+        init_engines(settings)
+        init_async_engines(settings)
+        configure_caches(settings)
+        yield
+        await dispose_async_engine()
+        await to_thread.run_sync(dispose_engines)
+
+    async def request_scope_middleware(
+        request: Request, call_next: Callable[[Request], Coroutine[None, None, Response]]
+    ) -> Response:
+        """Opens a request scope around the handling of each request.
+
+        Read-only requests may read from the replica, unless the client wrote within the last
+        `settings.DB_READ_YOUR_WRITES_WINDOW` seconds; successful writes open that window.
+        """
+        window = settings.DB_READ_YOUR_WRITES_WINDOW
+        writes = request.method not in _READ_ONLY_METHODS
+        async with request_scope(
+            f"{request.method} {request.url.path}",
+            read_only=not writes and not (window > 0 and reads_from_primary(request.cookies)),
+        ):
+            response = await call_next(request)
+
+        if writes and window > 0 and response.status_code < HTTPStatus.BAD_REQUEST:
+            remember_write(response, window)
+        return response
+
+    app = FastAPI(
+        lifespan=lifespan,
+        docs_url=settings.DOCS_URL,
+        redoc_url=settings.REDOC_URL,
+        title="Tech challenge API",
+    )
+    app.state.settings = settings
+
+    if settings.ASYNC_ENDPOINTS:
+        # Registered first, so they take precedence over the synchronous routes with the same
+        # path. They share the contract of the routes they shadow, which keep documenting them.
+        for async_router in (
+            async_customer_router,
+            async_product_router,
+            async_order_router,
+            async_payment_router,
+        ):
+            app.include_router(async_router, prefix="/api", include_in_schema=False)
+
+    app.include_router(customer_router, prefix="/api")
+    app.include_router(product_router, prefix="/api")
+    app.include_router(order_router, prefix="/api")
+    app.include_router(payment_router, prefix="/api")
+
+    app.include_router(webhook_payment_router.router, prefix="/webhooks")
+    app.include_router(metrics_router)
+
+    app.middleware("http")(_exception_middleware)
+    app.middleware("http")(request_scope_middleware)
+
+    app.get("/", tags=["Health Check"])(root)
+    return app
+
+
+__all__ = ["create_app", "handle_error"]
@@ -0,0 +1,106 @@
+"""Validators and conditional responses (`304 Not Modified`) for the cacheable listings."""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Generic, Iterable, Mapping, TypeVar
+
+from fastapi import Response, status
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Validators:
+    """The validators of a listing: a strong entity tag and the time it was last modified.
+
+    Attributes:
+        etag: The quoted entity tag. It changes whenever an item of the listing is added,
+         updated or removed.
+        last_modified: When the most recently updated item was updated, None for an empty
+         listing.
+    """
+
+    etag: str
+    last_modified: datetime | None
+
+    @classmethod
+    def of_listing(cls, updated_at: Iterable[datetime | None]) -> "Validators":
+        """Derives the validators of a listing from the update times of its items.
+
+        The tag combines the number of items with the latest update time: an update bumps the
+        latter, a removal lowers the former, and an addition does both.
+        """
+        count = 0
+        last_modified = None
+        for timestamp in updated_at:
+            count += 1
+            if timestamp is not None and (last_modified is None or timestamp > last_modified):
+                last_modified = timestamp
+
+        version = round(last_modified.timestamp() * 1_000_000) if last_modified else 0
+        return cls(etag=f'"{count:x}-{version:x}"', last_modified=last_modified)
+
+    def is_not_modified(self, headers: Mapping[str, str]) -> bool:
+        """Tells whether the client copy is current, according to the request headers.
+
+        `If-None-Match` takes precedence over `If-Modified-Since`, which is only compared to the
+        second, as HTTP dates are; an unparseable date is ignored.
+        """
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag in tags
+
+        if_modified_since = headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+        if since.tzinfo is None:
+            return False
+
+        return self.last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+
+    def headers(self, cache_control: str) -> Dict[str, str]:
+        """Returns the headers that carry the validators and the given caching policy."""
+        headers = {"ETag": self.etag, "Cache-Control": cache_control}
+        if self.last_modified is not None:
+            # HTTP dates are in GMT, whatever the time zone of the database session.
+            last_modified = self.last_modified.astimezone(timezone.utc)
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+        return headers
+
+
+@dataclass(frozen=True)
+class Conditional(Generic[T]):
+    """The outcome of a conditional read.
+
+    Attributes:
+        validators: The validators of the current representation.
+        content: The current representation, None when the client copy is still current and
+         the content was neither built nor presented.
+    """
+
+    validators: Validators
+    content: T | None
+
+
+def cache_control(max_age: int) -> str:
+    """Returns the `Cache-Control` policy of a public listing cached for `max_age` seconds.
+
+    With 0, shared caches keep the listing but revalidate it on every request.
+    """
+    return f"public, max-age={max_age}" if max_age > 0 else "public, no-cache"
+
+
+def not_modified(validators: Validators, policy: str) -> Response:
+    """Builds an empty `304 Not Modified` response carrying the validators."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers(policy))
+
+
+__all__ = ["Conditional", "Validators", "cache_control", "not_modified"]
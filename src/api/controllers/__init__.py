@@ -1,3 +1,7 @@
+from .async_customer_controller import AsyncCustomerController
+from .async_order_controller import AsyncOrderController
+from .async_payment_controller import AsyncPaymentController
+from .async_product_controller import AsyncProductController
 from .customer_controller import CustomerController
 from .order_controller import OrderController
 from .payment_controller import PaymentController
@@ -5,6 +9,10 @@ from .product_controller import ProductController
 from .webhooks import PaymentConfirmationController
 
 __all__ = [
+    "AsyncCustomerController",
+    "AsyncOrderController",
+    "AsyncPaymentController",
+    "AsyncProductController",
     "CustomerController",
     "OrderController",
     "PaymentConfirmationController",
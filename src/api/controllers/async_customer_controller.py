@@ -0,0 +1,34 @@
+from typing import Callable
+
+from src.core.use_cases import AsyncGetCustomerByCpfUseCase
+
+from ...core.use_cases.customer import CustomerResult
+from ..presenters import Presenter
+from ..schemas import CustomerDetailsOut
+
+
+class AsyncCustomerController:
+    """Asyncio counterpart of `CustomerController`, for the customer read endpoints."""
+
+    def __init__(
+        self,
+        get_customer_by_cpf_use_case: Callable[[], AsyncGetCustomerByCpfUseCase],
+        customer_details_presenter: Presenter[CustomerDetailsOut, CustomerResult],
+    ) -> None:
+        self._get_customer_by_cpf_use_case = get_customer_by_cpf_use_case
+        self._customer_details_presenter = customer_details_presenter
+
+    async def get_by_cpf(self, cpf: str) -> CustomerDetailsOut:
+        """Retrieves a customer from the system using their CPF.
+
+        Args:
+            cpf (str): The customer's CPF to find the matching customer.
+
+        Returns:
+            CustomerDetailsOut: The schema of the customer found.
+        """
+        customer = await self._get_customer_by_cpf_use_case().execute(cpf)
+        return self._customer_details_presenter.present(customer)
+
+
+__all__ = ["AsyncCustomerController"]
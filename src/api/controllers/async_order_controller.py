@@ -0,0 +1,44 @@
+from typing import Callable
+
+from src.core.use_cases import AsyncListOrdersByStatusUseCase, AsyncListOrdersUseCase
+
+from ...core.use_cases.order import OrderResult
+from ..presenters import Presenter
+from ..schemas.order_schema import OrderOut, OrderPageOut
+
+
+class AsyncOrderController:
+    """Asyncio counterpart of `OrderController`, for the order read endpoints."""
+
+    def __init__(
+        self,
+        list_orders_use_case: Callable[[], AsyncListOrdersUseCase],
+        list_orders_sorted_by_status_use_case: Callable[[], AsyncListOrdersByStatusUseCase],
+        order_details_presenter: Presenter[OrderOut, OrderResult],
+    ) -> None:
+        self._list_orders_use_case = list_orders_use_case
+        self._list_orders_sorted_by_status_use_case = list_orders_sorted_by_status_use_case
+        self._order_details_presenter = order_details_presenter
+
+    async def list_orders(self, page_size: int, cursor: str | None = None) -> OrderPageOut:
+        """Get a page of orders in the system."""
+        page = await self._list_orders_use_case().list_orders(page_size, cursor)
+        return OrderPageOut(
+            items=self._order_details_presenter.present_many(page.items),
+            next_cursor=page.next_cursor,
+        )
+
+    async def list_orders_sorted_by_status(
+        self, page_size: int, cursor: str | None = None
+    ) -> OrderPageOut:
+        """Gets a page of orders by specific statuses."""
+        page = await self._list_orders_sorted_by_status_use_case().list_orders_sorted_by_status(
+            page_size, cursor
+        )
+        return OrderPageOut(
+            items=self._order_details_presenter.present_many(page.items),
+            next_cursor=page.next_cursor,
+        )
+
+
+__all__ = ["AsyncOrderController"]
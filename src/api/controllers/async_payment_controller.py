@@ -0,0 +1,27 @@
+from typing import Callable
+from uuid import UUID
+
+from src.api.presenters import Presenter
+from src.api.schemas import PaymentSummaryOut
+from src.core.use_cases import AsyncGetPaymentStatusUseCase
+from src.core.use_cases.payment.shared_dtos import PaymentResult
+
+
+class AsyncPaymentController:
+    """Asyncio counterpart of `PaymentController`, for the payment read endpoints."""
+
+    def __init__(
+        self,
+        get_payment_status_use_case: Callable[[], AsyncGetPaymentStatusUseCase],
+        payment_summary_presenter: Presenter[PaymentSummaryOut, PaymentResult],
+    ) -> None:
+        self._get_payment_status_use_case = get_payment_status_use_case
+        self._payment_summary_presenter = payment_summary_presenter
+
+    async def get_payment_status(self, order_uuid: UUID) -> PaymentSummaryOut:
+        """Get the status of a payment in the system from the provided order ID."""
+        payment = await self._get_payment_status_use_case().execute(order_uuid)
+        return self._payment_summary_presenter.present(payment)
+
+
+__all__ = ["AsyncPaymentController"]
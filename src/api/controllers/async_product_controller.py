@@ -0,0 +1,36 @@
+from typing import Callable, Iterable, Mapping
+
+from ...core.domain.value_objects import Category
+from ...core.use_cases.product import AsyncGetProductsByCategoryUseCase, ProductResult
+from ..conditional_requests import Conditional, Validators
+from ..presenters import Presenter
+from ..schemas import ProductOut
+
+
+class AsyncProductController:
+    """Asyncio counterpart of `ProductController`, for the product read endpoints."""
+
+    def __init__(
+        self,
+        get_products_by_category_use_case: Callable[[], AsyncGetProductsByCategoryUseCase],
+        product_details_presenter: Presenter[ProductOut, ProductResult],
+    ) -> None:
+        self._get_products_by_category_use_case = get_products_by_category_use_case
+        self._product_details_presenter = product_details_presenter
+
+    async def get_products_by_category(
+        self, category: Category, headers: Mapping[str, str]
+    ) -> Conditional[Iterable[ProductOut]]:
+        """Get a list of products in the system from the provided product category.
+
+        See `ProductController.get_products_by_category`.
+        """
+        products = await self._get_products_by_category_use_case().execute(category)
+        validators = Validators.of_listing(product.updated_at for product in products)
+        if validators.is_not_modified(headers):
+            return Conditional(validators, None)
+
+        return Conditional(validators, self._product_details_presenter.present_many(products))
+
+
+__all__ = ["AsyncProductController"]
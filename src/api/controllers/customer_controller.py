@@ -1,3 +1,5 @@
+from typing import Callable
+
 from src.core.use_cases import CreateCustomerUseCase, GetCustomerByCpfUseCase
 
 from ...core.use_cases.customer import CustomerResult
@@ -11,15 +13,18 @@ class CustomerController:
     The class acts as the intersection between the API and the business logic,
     handling HTTP requests related to customer data.
 
+    It is stateless and shared by every request: each action builds only the use case it
+    calls, through its factory, when it is called.
+
     Attributes:
-        _customer_use_case (CustomerUseCase): An instance of the CustomerUseCase class for
-        performing operations related to customers.
+        _customer_use_case (Callable[[], CreateCustomerUseCase]): The factory of the use case
+        that registers customers.
     """
 
     def __init__(
         self,
-        create_customer_use_case: CreateCustomerUseCase,
-        get_customer_by_cpf_use_case: GetCustomerByCpfUseCase,
+        create_customer_use_case: Callable[[], CreateCustomerUseCase],
+        get_customer_by_cpf_use_case: Callable[[], GetCustomerByCpfUseCase],
         customer_details_presenter: Presenter[CustomerDetailsOut, CustomerResult],
     ) -> None:
         self._customer_use_case = create_customer_use_case
@@ -39,7 +44,7 @@ class CustomerController:
         Raises:
             HTTPException: If there's any business rule violation defined in DomainError.
         """
-        created_customer = self._customer_use_case.execute(customer.to_customer_creation_data())
+        created_customer = self._customer_use_case().execute(customer.to_customer_creation_data())
         return self._customer_details_presenter.present(created_customer)
 
     def get_by_cpf(self, cpf: str) -> CustomerDetailsOut:
@@ -55,7 +60,7 @@ class CustomerController:
             HTTPException: If a customer with the provided CPF could not be found or there's any
             business rule violation defined in DomainError.
         """
-        customer = self._get_customer_by_cpf_use_case.execute(cpf)
+        customer = self._get_customer_by_cpf_use_case().execute(cpf)
         return self._customer_details_presenter.present(customer)
 
 
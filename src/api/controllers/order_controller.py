@@ -1,10 +1,12 @@
-from typing import Iterable
+from typing import Callable, ContextManager, Iterator
 from uuid import UUID
 
 from src.core.use_cases import (
+    BatchUpdateOrderStatusUseCase,
     CheckoutUseCase,
     ListOrdersByStatusUseCase,
     ListOrdersUseCase,
+    StreamOrdersUseCase,
     UpdateOrderStatusUseCase,
 )
 
@@ -14,6 +16,10 @@ from ..schemas.order_schema import (
     OrderCreationOut,
     OrderIn,
     OrderOut,
+    OrderPageOut,
+    OrderStatusBatchOut,
+    OrderStatusBatchUpdateIn,
+    OrderStatusRejectionOut,
     OrderStatusUpdateIn,
 )
 
@@ -23,16 +29,21 @@ class OrderController:
 
     The class acts as the intersection between the API and the business logic,
     handling HTTP requests related to order data.
+
+    It is stateless and shared by every request: each action builds only the use case it
+    calls, through its factory, when it is called.
     """
 
     def __init__(
         self,
-        checkout_use_case: CheckoutUseCase,
-        list_orders_use_case: ListOrdersUseCase,
-        update_order_status_use_case: UpdateOrderStatusUseCase,
+        checkout_use_case: Callable[[], CheckoutUseCase],
+        list_orders_use_case: Callable[[], ListOrdersUseCase],
+        update_order_status_use_case: Callable[[], UpdateOrderStatusUseCase],
         order_created_presenter: Presenter[OrderCreationOut, OrderResult],
         order_details_presenter: Presenter[OrderOut, OrderResult],
-        list_orders_sorted_by_status_use_case: ListOrdersByStatusUseCase,
+        list_orders_sorted_by_status_use_case: Callable[[], ListOrdersByStatusUseCase],
+        batch_update_order_status_use_case: Callable[[], BatchUpdateOrderStatusUseCase],
+        open_order_stream: Callable[[], ContextManager[StreamOrdersUseCase]],
     ) -> None:
         self._checkout_use_case = checkout_use_case
         self._update_order_status_use_case = update_order_status_use_case
@@ -40,26 +51,62 @@ class OrderController:
         self._order_details_presenter = order_details_presenter
         self._list_orders_use_case = list_orders_use_case
         self._list_orders_sorted_by_status_use_case = list_orders_sorted_by_status_use_case
+        self._batch_update_order_status_use_case = batch_update_order_status_use_case
+        self._open_order_stream = open_order_stream
 
     def checkout(self, order_in: OrderIn) -> OrderCreationOut:
         """Registers a new order in the system from the provided order data."""
-        order = self._checkout_use_case.checkout(order_in.to_checkout_request())
+        order = self._checkout_use_case().checkout(order_in.to_checkout_request())
         return self._order_created_presenter.present(order)
 
-    def list_orders(self) -> Iterable[OrderOut]:
-        """Get a list of orders in the system."""
-        orders = self._list_orders_use_case.list_orders()
-        return self._order_details_presenter.present_many(orders)
+    def list_orders(self, page_size: int, cursor: str | None = None) -> OrderPageOut:
+        """Get a page of orders in the system."""
+        page = self._list_orders_use_case().list_orders(page_size, cursor)
+        return OrderPageOut(
+            items=self._order_details_presenter.present_many(page.items),
+            next_cursor=page.next_cursor,
+        )
+
+    def list_orders_sorted_by_status(
+        self, page_size: int, cursor: str | None = None
+    ) -> OrderPageOut:
+        """Gets a page of orders by specific statuses."""
+        page = self._list_orders_sorted_by_status_use_case().list_orders_sorted_by_status(
+            page_size, cursor
+        )
+        return OrderPageOut(
+            items=self._order_details_presenter.present_many(page.items),
+            next_cursor=page.next_cursor,
+        )
 
-    def list_orders_sorted_by_status(self) -> Iterable[OrderOut]:
-        """Gets a list of orders by specific statuses."""
-        orders = self._list_orders_sorted_by_status_use_case.list_orders_sorted_by_status()
-        return self._order_details_presenter.present_many(orders)
+    def stream_orders(self) -> Iterator[OrderOut]:
+        """Streams every order in the system, oldest first.
+
+        The stream is consumed after the request scope closed the request session, so it opens
+        a use case of its own, on its own session, on the first item and closes it once
+        exhausted or closed.
+        """
+        with self._open_order_stream() as use_case:
+            yield from self._order_details_presenter.present_each(use_case.stream_orders())
 
     def update_status(self, order_uuid: UUID, status_update: OrderStatusUpdateIn) -> OrderOut:
         """Update the status of an order in the system from the provided order ID and status."""
-        order = self._update_order_status_use_case.update_status(order_uuid, status_update.status)
+        order = self._update_order_status_use_case().update_status(order_uuid, status_update.status)
         return self._order_details_presenter.present(order)
 
+    def update_statuses(self, batch_update: OrderStatusBatchUpdateIn) -> OrderStatusBatchOut:
+        """Moves many orders to the same status, reporting the ones that could not be moved."""
+        result = self._batch_update_order_status_use_case().update_statuses(
+            batch_update.order_uuids, batch_update.status
+        )
+        return OrderStatusBatchOut(
+            status=result.status,
+            updated=result.updated,
+            rejected=[
+                OrderStatusRejectionOut(uuid=rejection.uuid, reason=rejection.reason)
+                for rejection in result.rejected
+            ],
+        )
+
 
 __all__ = ["OrderController"]
@@ -1,3 +1,4 @@
+from typing import Callable
 from uuid import UUID
 
 from src.api.presenters import Presenter
@@ -15,7 +16,7 @@ class PaymentController:
 
     def __init__(
         self,
-        get_payment_status_use_case: GetPaymentStatusUseCase,
+        get_payment_status_use_case: Callable[[], GetPaymentStatusUseCase],
         payment_summary_presenter: Presenter[PaymentSummaryOut, PaymentResult],
     ) -> None:
         self._get_payment_status_use_case = get_payment_status_use_case
@@ -23,7 +24,7 @@ class PaymentController:
 
     def get_payment_status(self, order_uuid: UUID) -> PaymentSummaryOut:
         """Get the status of a payment in the system from the provided order ID."""
-        payment = self._get_payment_status_use_case.execute(order_uuid)
+        payment = self._get_payment_status_use_case().execute(order_uuid)
         return self._payment_summary_presenter.present(payment)
 
 
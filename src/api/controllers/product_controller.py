@@ -1,17 +1,29 @@
-from typing import Iterable
+from typing import Any, Callable, Dict, Iterable, List, Mapping
 from uuid import UUID
 
+from pydantic import ValidationError
+
 from src.core.use_cases import ProductCreationUseCase
 
 from ...core.domain.value_objects import Category
 from ...core.use_cases.product import (
+    CategoryPriceChangeUseCase,
     GetProductsByCategoryUseCase,
+    ProductImportRow,
+    ProductImportUseCase,
     ProductResult,
     ProductUpdateUseCase,
 )
 from ...core.use_cases.product.delete import ProductDeleteUseCase
+from ..conditional_requests import Conditional, Validators
 from ..presenters import Presenter
-from ..schemas import ProductCreationIn, ProductOut
+from ..schemas import (
+    CategoryPriceChangeIn,
+    ProductCreationIn,
+    ProductImportErrorOut,
+    ProductImportOut,
+    ProductOut,
+)
 from ..schemas.product_schema import ProductUpdateIn
 
 
@@ -20,43 +32,105 @@ class ProductController:
 
     The class acts as the intersection between the API and the business logic,
     handling HTTP requests related to product data.
+
+    It is stateless and shared by every request: each action builds only the use case it
+    calls, through its factory, when it is called.
     """
 
     def __init__(
         self,
-        product_creation_use_case: ProductCreationUseCase,
-        product_update_use_case: ProductUpdateUseCase,
-        product_delete_use_case: ProductDeleteUseCase,
-        get_products_by_category_use_case: GetProductsByCategoryUseCase,
+        product_creation_use_case: Callable[[], ProductCreationUseCase],
+        product_update_use_case: Callable[[], ProductUpdateUseCase],
+        product_delete_use_case: Callable[[], ProductDeleteUseCase],
+        get_products_by_category_use_case: Callable[[], GetProductsByCategoryUseCase],
         product_details_presenter: Presenter[ProductOut, ProductResult],
+        product_import_use_case: Callable[[], ProductImportUseCase],
+        category_price_change_use_case: Callable[[], CategoryPriceChangeUseCase],
     ) -> None:
         self._product_creation_use_case = product_creation_use_case
         self._product_update_use_case = product_update_use_case
         self._product_delete_use_case = product_delete_use_case
         self._get_products_by_category_use_case = get_products_by_category_use_case
         self._product_details_presenter = product_details_presenter
+        self._product_import_use_case = product_import_use_case
+        self._category_price_change_use_case = category_price_change_use_case
 
     def create_product(self, product_in: ProductCreationIn) -> ProductOut:
         """Registers a new product in the system from the provided product data."""
-        created_product = self._product_creation_use_case.execute(
+        created_product = self._product_creation_use_case().execute(
             product_in.to_product_creation_dto()
         )
         return self._product_details_presenter.present(created_product)
 
     def update_product(self, product_uuid: UUID, product_in: ProductUpdateIn) -> ProductOut:
         """Update a product in the system from the provided product data and id."""
-        updated_product = self._product_update_use_case.execute(
+        updated_product = self._product_update_use_case().execute(
             product_uuid, product_in.to_product_update_dto()
         )
         return self._product_details_presenter.present(updated_product)
 
     def delete_product(self, product_uuid: UUID) -> None:
         """Delete a product in the system from the provided product uuid."""
-        self._product_delete_use_case.execute(product_uuid)
+        self._product_delete_use_case().execute(product_uuid)
+
+    def get_products_by_category(
+        self, category: Category, headers: Mapping[str, str]
+    ) -> Conditional[Iterable[ProductOut]]:
+        """Get a list of products in the system from the provided product category.
+
+        Args:
+            category: The category of the products.
+            headers: The request headers, whose conditions spare presenting an unchanged list.
+        """
+        products = self._get_products_by_category_use_case().execute(category)
+        validators = Validators.of_listing(product.updated_at for product in products)
+        if validators.is_not_modified(headers):
+            return Conditional(validators, None)
+
+        return Conditional(validators, self._product_details_presenter.present_many(products))
+
+    def import_products(self, rows: List[Dict[str, Any]]) -> ProductImportOut:
+        """Creates or updates the products of an import, reporting the rejected rows.
+
+        Args:
+            rows: The raw rows of the import, validated here one by one so an invalid row does
+             not reject the whole import.
+
+        Returns:
+            ProductImportOut: The stored products and the errors of the rejected rows.
+        """
+        import_rows: List[ProductImportRow] = []
+        errors: List[ProductImportErrorOut] = []
+
+        for number, row in enumerate(rows, start=1):
+            try:
+                product_in = ProductCreationIn.model_validate(row)
+            except ValidationError as e:
+                detail = "; ".join(
+                    f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()
+                )
+                errors.append(ProductImportErrorOut(row=number, detail=detail))
+                continue
+
+            import_rows.append(
+                ProductImportRow(row=number, product=product_in.to_product_creation_dto())
+            )
+
+        result = self._product_import_use_case().execute(import_rows)
+        errors.extend(
+            ProductImportErrorOut(row=error.row, detail=error.message) for error in result.errors
+        )
+
+        return ProductImportOut(
+            products=self._product_details_presenter.present_many(result.products),
+            errors=sorted(errors, key=lambda error: error.row),
+        )
 
-    def get_products_by_category(self, category: Category) -> Iterable[ProductOut]:
-        """Get a list of products in the system from the provided product category."""
-        products = self._get_products_by_category_use_case.execute(category)
+    def change_category_prices(
+        self, category: Category, price_change: CategoryPriceChangeIn
+    ) -> Iterable[ProductOut]:
+        """Changes the prices of every product in a category by a percentage."""
+        products = self._category_price_change_use_case().execute(category, price_change.percentage)
         return self._product_details_presenter.present_many(products)
 
 
@@ -1,3 +1,4 @@
+from typing import Callable
 from uuid import UUID
 
 from src.api.schemas import PaymentConfirmationIn
@@ -13,7 +14,7 @@ class PaymentConfirmationController:
 
     def __init__(
         self,
-        use_case: PaymentConfirmationUseCase,
+        use_case: Callable[[], PaymentConfirmationUseCase],
     ) -> None:
         self._use_case = use_case
 
@@ -21,7 +22,7 @@ class PaymentConfirmationController:
         self, payment_id: UUID, data: PaymentConfirmationIn
     ) -> None:
         # Here we would need to convert the incoming data.
-        self._use_case.execute(payment_id, PaymentStatus(data.status))
+        self._use_case().execute(payment_id, PaymentStatus(data.status))
 
 
 __all__ = ["PaymentConfirmationController"]
@@ -1,20 +1,39 @@
+from contextlib import contextmanager
+from typing import Iterator, Mapping
+
 from fastapi import Depends
-from injector import Injector, Module, provider
+from injector import Injector, Module, ProviderOf, provider, singleton
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.api.controllers import (
+    AsyncCustomerController,
+    AsyncOrderController,
+    AsyncPaymentController,
+    AsyncProductController,
     CustomerController,
     OrderController,
     PaymentConfirmationController,
     PaymentController,
 )
 from src.core.domain.repositories import (
+    AsyncCustomerRepository,
+    AsyncOrderRepository,
+    AsyncPaymentRepository,
+    AsyncProductRepository,
     CustomerRepository,
     OrderRepository,
     PaymentRepository,
     ProductRepository,
 )
 from src.core.use_cases import (
+    AsyncGetCustomerByCpfUseCase,
+    AsyncGetPaymentStatusUseCase,
+    AsyncGetProductsByCategoryUseCase,
+    AsyncListOrdersByStatusUseCase,
+    AsyncListOrdersUseCase,
+    BatchUpdateOrderStatusUseCase,
+    CategoryPriceChangeUseCase,
     CheckoutUseCase,
     CreateCustomerUseCase,
     CustomerResult,
@@ -28,12 +47,28 @@ from src.core.use_cases import (
     PaymentProcessingUseCase,
     ProductCreationUseCase,
     ProductDeleteUseCase,
+    ProductImportUseCase,
     ProductResult,
     ProductUpdateUseCase,
+    StreamOrdersUseCase,
     UpdateOrderStatusUseCase,
 )
-from src.infra.database.config import get_db_session
+from src.infra.cache import CacheStats, customer_cache, product_cache
+from src.infra.database.config import (
+    PoolMetricsSnapshot,
+    SessionLocal,
+    get_async_sessionmaker,
+    leak_detector,
+)
 from src.infra.database.repositories import (
+    AsyncCachedCustomerRepository,
+    AsyncCachedProductRepository,
+    AsyncSQLAlchemyCustomerRepository,
+    AsyncSQLAlchemyOrderRepository,
+    AsyncSQLAlchemyPaymentRepository,
+    AsyncSQLAlchemyProductRepository,
+    CachedCustomerRepository,
+    CachedProductRepository,
     SQlAlchemyCustomerRepository,
     SQLAlchemyOrderRepository,
     SQLAlchemyPaymentRepository,
@@ -44,38 +79,78 @@ from ..core.use_cases.payment.shared_dtos import PaymentResult
 from ..payment import IPaymentGateway, MercadoPagoGateway
 from .controllers import ProductController
 from .presenters import (
+    CacheMetricsPresenter,
     CustomerDetailsPresenter,
     OrderCreatedPresenter,
     OrderDetailsPresenter,
+    PoolMetricsPresenter,
     Presenter,
     ProductDetailsPresenter,
 )
 from .presenters.payment.payment_summary_presenter import PaymentSummaryPresenter
+from .request_scope import RequestContext, current_request, request
 from .schemas import CustomerDetailsOut, OrderCreationOut, OrderOut, PaymentSummaryOut, ProductOut
 
 
+@contextmanager
+def open_order_stream() -> Iterator[StreamOrdersUseCase]:
+    """Opens a StreamOrdersUseCase on a session of its own, closed on exit.
+
+    Streamed bodies are sent after `request_scope` closed the request session, so the stream
+    cannot share it. The stream holds one connection of the primary database for as long as it
+    is consumed; its checkout is tracked by the connection leak detector as its own owner, which
+    is reported once the session is closed.
+    """
+    session = SessionLocal(primary=True)
+    owner = RequestContext("order stream", read_only=True)
+    try:
+        # Each chunk of a streamed body may be produced by another thread, so the connection is
+        # checked out right away, while the stream is being tracked.
+        with leak_detector.track(owner):
+            session.connection()
+        yield StreamOrdersUseCase(SQLAlchemyOrderRepository(session))
+    finally:
+        session.close()
+        leak_detector.report(owner)
+
+
 class AppModule(Module):
     """AppModule is a class that provides the dependencies for the application.
 
     It uses the provider decorator from the injector package to specify how to provide each
      dependency.
+
+    Dependencies are bound to the narrowest scope their state allows:
+
+    - the session, and the repositories that use it, are request scoped;
+    - use cases are built on demand, by the factory (`ProviderOf`) their controller calls, so a
+      request only builds the use case of the action it performs;
+    - presenters, gateways and controllers are stateless singletons.
     """
 
+    @request
     @provider
     def provide_session(self) -> Session:
-        """Provides an SQLAlchemy session using the get_db_session function."""
-        return next(get_db_session())
+        """Provides the SQLAlchemy session of the current request.
 
+        Every repository resolved while handling a request shares the same session, which is
+        closed by `request_scope` once the request is done. Only read-only requests may send
+        queries to the read replica; the others are a write unit pinned to the primary.
+        """
+        return SessionLocal(primary=not current_request().read_only)
+
+    @request
     @provider
     def provide_customer_repository(
         self,
         session: Session = Depends(),  # noqa: B008
     ) -> CustomerRepository:
-        """Provides a CustomerRepository instance.
+        """Provides the CustomerRepository of the current request.
 
         It depends on an SQLAlchemy session, which is injected by FastAPI's "Depends" mechanism.
+        The lookups are served from the process-wide customer cache.
         """
-        return SQlAlchemyCustomerRepository(session)
+        return CachedCustomerRepository(SQlAlchemyCustomerRepository(session), customer_cache)
 
     @provider
     def provide_create_customer_use_case(
@@ -99,35 +174,37 @@ class AppModule(Module):
         """
         return GetCustomerByCpfUseCase(customer_repository)
 
+    @singleton
     @provider
     def provide_customer_controller(
         self,
-        create_customer_use_case: CreateCustomerUseCase = Depends(),  # noqa: B008
-        get_customer_by_cpf_use_case: GetCustomerByCpfUseCase = Depends(),  # noqa: B008
-        customer_details_presenter: CustomerDetailsPresenter = Depends(),  # noqa: B008
+        create_customer_use_case: ProviderOf[CreateCustomerUseCase] = Depends(),  # noqa: B008
+        get_customer_by_cpf_use_case: ProviderOf[GetCustomerByCpfUseCase] = Depends(),  # noqa: B008
+        customer_details_presenter: Presenter[CustomerDetailsOut, CustomerResult] = Depends(),  # noqa: B008
     ) -> CustomerController:
-        """Provides a CustomerController instance.
-
-        It depends on a CustomerUseCase, which is injected by FastAPI's "Depends" mechanism.
-        """
+        """Provides the CustomerController, which builds its use cases on demand."""
         return CustomerController(
-            create_customer_use_case, get_customer_by_cpf_use_case, customer_details_presenter
+            create_customer_use_case.get,
+            get_customer_by_cpf_use_case.get,
+            customer_details_presenter,
         )
 
+    @singleton
     @provider
     def provide_customer_details_presenter(self) -> Presenter[CustomerDetailsOut, CustomerResult]:
         return CustomerDetailsPresenter()
 
+    @request
     @provider
     def provide_product_repository(
         self,
         session: Session = Depends(),  # noqa: B008
     ) -> ProductRepository:
-        """Provides a ProductRepository instance.
+        """Provides the ProductRepository of the current request.
 
         It depends on an SQLAlchemy session, which is injected by FastAPI's "Depends" mechanism.
         """
-        return SQLAlchemyProductRepository(session)
+        return CachedProductRepository(SQLAlchemyProductRepository(session), product_cache)
 
     @provider
     def provide_product_creation_use_case(
@@ -173,31 +250,51 @@ class AppModule(Module):
         """
         return GetProductsByCategoryUseCase(product_repository)
 
+    @provider
+    def provide_product_import_use_case(
+        self,
+        product_repository: ProductRepository = Depends(),  # noqa: B008
+    ) -> ProductImportUseCase:
+        """Provides a ProductImportUseCase instance."""
+        return ProductImportUseCase(product_repository)
+
+    @provider
+    def provide_category_price_change_use_case(
+        self,
+        product_repository: ProductRepository = Depends(),  # noqa: B008
+    ) -> CategoryPriceChangeUseCase:
+        """Provides a CategoryPriceChangeUseCase instance."""
+        return CategoryPriceChangeUseCase(product_repository)
+
+    @singleton
     @provider
     def provide_product_details_presenter(self) -> Presenter[ProductOut, ProductResult]:
         return ProductDetailsPresenter()
 
+    @singleton
     @provider
     def provide_product_controller(
         self,
-        get_products_by_category_use_case: GetProductsByCategoryUseCase = Depends(),  # noqa: B008
-        product_creation_use_case: ProductCreationUseCase = Depends(),  # noqa: B008
-        product_update_use_case: ProductUpdateUseCase = Depends(),  # noqa: B008
-        product_delete_use_case: ProductDeleteUseCase = Depends(),  # noqa: B008
+        get_products_by_category_use_case: ProviderOf[GetProductsByCategoryUseCase] = Depends(),  # noqa: B008
+        product_creation_use_case: ProviderOf[ProductCreationUseCase] = Depends(),  # noqa: B008
+        product_update_use_case: ProviderOf[ProductUpdateUseCase] = Depends(),  # noqa: B008
+        product_delete_use_case: ProviderOf[ProductDeleteUseCase] = Depends(),  # noqa: B008
         product_details_presenter: Presenter[ProductOut, ProductResult] = Depends(),  # noqa: B008
+        product_import_use_case: ProviderOf[ProductImportUseCase] = Depends(),  # noqa: B008
+        category_price_change_use_case: ProviderOf[CategoryPriceChangeUseCase] = Depends(),  # noqa: B008
     ) -> ProductController:
-        """Provides a ProductController instance.
-
-        It depends on a ProductUseCase, which is injected by FastAPI's "Depends" mechanism.
-        """
+        """Provides the ProductController, which builds its use cases on demand."""
         return ProductController(
-            product_creation_use_case,
-            product_update_use_case,
-            product_delete_use_case,
-            get_products_by_category_use_case,
+            product_creation_use_case.get,
+            product_update_use_case.get,
+            product_delete_use_case.get,
+            get_products_by_category_use_case.get,
             product_details_presenter,
+            product_import_use_case.get,
+            category_price_change_use_case.get,
         )
 
+    @request
     @provider
     def provide_order_repository(
         self,
@@ -205,6 +302,7 @@ class AppModule(Module):
     ) -> OrderRepository:
         return SQLAlchemyOrderRepository(session)
 
+    @request
     @provider
     def provide_payment_repository(
         self,
@@ -212,6 +310,7 @@ class AppModule(Module):
     ) -> PaymentRepository:
         return SQLAlchemyPaymentRepository(session)
 
+    @singleton
     @provider
     def provide_payment_gateway(self) -> IPaymentGateway:
         return MercadoPagoGateway()
@@ -264,59 +363,74 @@ class AppModule(Module):
         """Provides an UpdateOrderStatusUseCase instance."""
         return UpdateOrderStatusUseCase(order_repository)
 
+    @provider
+    def provide_batch_update_order_status_use_case(
+        self,
+        order_repository: OrderRepository = Depends(),  # noqa: B008
+    ) -> BatchUpdateOrderStatusUseCase:
+        """Provides a BatchUpdateOrderStatusUseCase instance."""
+        return BatchUpdateOrderStatusUseCase(order_repository)
+
+    @singleton
     @provider
     def provide_order_created_presenter(self) -> Presenter[OrderCreationOut, OrderResult]:
-        """Provides an OrderCreatedPresenter instance."""
+        """Provides the OrderCreatedPresenter."""
         return OrderCreatedPresenter()
 
+    @singleton
     @provider
     def provide_order_details_presenter(self) -> Presenter[OrderOut, OrderResult]:
-        """Provides an OrderDetailsPresenter instance."""
+        """Provides the OrderDetailsPresenter."""
         return OrderDetailsPresenter()
 
+    @singleton
     @provider
     def provide_order_controller(
         self,
-        checkout_use_case: CheckoutUseCase = Depends(),  # noqa: B008
-        list_orders_use_case: ListOrdersUseCase = Depends(),  # noqa: B008
-        update_order_status_use_case: UpdateOrderStatusUseCase = Depends(),  # noqa: B008
+        checkout_use_case: ProviderOf[CheckoutUseCase] = Depends(),  # noqa: B008
+        list_orders_use_case: ProviderOf[ListOrdersUseCase] = Depends(),  # noqa: B008
+        update_order_status_use_case: ProviderOf[UpdateOrderStatusUseCase] = Depends(),  # noqa: B008
         order_created_presenter: Presenter[OrderCreationOut, OrderResult] = Depends(),  # noqa: B008
         order_details_presenter: Presenter[OrderOut, OrderResult] = Depends(),  # noqa: B008
-        list_orders_sorted_by_status_use_case: ListOrdersByStatusUseCase = Depends(),  # noqa: B008
+        list_orders_sorted_by_status_use_case: ProviderOf[ListOrdersByStatusUseCase] = Depends(),  # noqa: B008
+        batch_update_order_status_use_case: ProviderOf[BatchUpdateOrderStatusUseCase] = Depends(),  # noqa: B008
     ) -> OrderController:
-        """Provides an OrderController instance."""
+        """Provides the OrderController, which builds its use cases on demand."""
         return OrderController(
-            checkout_use_case,
-            list_orders_use_case,
-            update_order_status_use_case,
+            checkout_use_case.get,
+            list_orders_use_case.get,
+            update_order_status_use_case.get,
             order_created_presenter,
             order_details_presenter,
-            list_orders_sorted_by_status_use_case,
+            list_orders_sorted_by_status_use_case.get,
+            batch_update_order_status_use_case.get,
+            open_order_stream,
         )
 
     @provider
     def provide_payment_confirmation_use_case(
         self,
         payment_repository: PaymentRepository = Depends(),  # noqa: B008
-        update_order_status_use_case: UpdateOrderStatusUseCase = Depends(),  # noqa: B008
     ) -> PaymentConfirmationUseCase:
-        return PaymentConfirmationUseCase(payment_repository, update_order_status_use_case)
+        return PaymentConfirmationUseCase(payment_repository)
 
+    @singleton
     @provider
     def provide_payment_confirmation_controller(
         self,
-        payment_confirmation_use_case: PaymentConfirmationUseCase = Depends(),  # noqa: B008
+        payment_confirmation_use_case: ProviderOf[PaymentConfirmationUseCase] = Depends(),  # noqa: B008
     ) -> PaymentConfirmationController:
-        return PaymentConfirmationController(payment_confirmation_use_case)
+        return PaymentConfirmationController(payment_confirmation_use_case.get)
 
+    @singleton
     @provider
     def provide_payment_controller(
         self,
-        get_payment_status_use_case: GetPaymentStatusUseCase = Depends(),  # noqa: B008
+        get_payment_status_use_case: ProviderOf[GetPaymentStatusUseCase] = Depends(),  # noqa: B008
         payment_summary_presenter: Presenter[PaymentSummaryOut, PaymentResult] = Depends(),  # noqa: B008
     ) -> PaymentController:
         return PaymentController(
-            get_payment_status_use_case,
+            get_payment_status_use_case.get,
             payment_summary_presenter,
         )
 
@@ -327,18 +441,161 @@ class AppModule(Module):
     ) -> GetPaymentStatusUseCase:
         return GetPaymentStatusUseCase(payment_repository)
 
+    @singleton
     @provider
     def provide_payment_summary_presenter(self) -> Presenter[PaymentSummaryOut, PaymentResult]:
-        """Provides a PaymentSummaryPresenter instance."""
+        """Provides the PaymentSummaryPresenter."""
         return PaymentSummaryPresenter()
 
+    @singleton
+    @provider
+    def provide_pool_metrics_presenter(self) -> Presenter[str, PoolMetricsSnapshot]:
+        """Provides the PoolMetricsPresenter."""
+        return PoolMetricsPresenter()
+
+    @singleton
+    @provider
+    def provide_cache_metrics_presenter(self) -> Presenter[str, Mapping[str, CacheStats]]:
+        """Provides the CacheMetricsPresenter."""
+        return CacheMetricsPresenter()
+
+
+class AsyncAppModule(Module):
+    """Provides the dependencies of the asyncio endpoints.
+
+    Presenters are shared with `AppModule`; only the session, repositories, use cases and
+    controllers of the read endpoints have asyncio counterparts. They are scoped like their
+    synchronous counterparts.
+    """
+
+    @request
+    @provider
+    def provide_async_session(self) -> AsyncSession:
+        """Provides the asyncio SQLAlchemy session of the current request.
+
+        Like the synchronous session, it is shared by the whole request and closed by
+        `request_scope` once the request is done.
+        """
+        return get_async_sessionmaker()(primary=not current_request().read_only)
+
+    @request
+    @provider
+    def provide_customer_repository(self, session: AsyncSession) -> AsyncCustomerRepository:
+        """Provides the AsyncCustomerRepository of the current request, backed by the cache."""
+        return AsyncCachedCustomerRepository(
+            AsyncSQLAlchemyCustomerRepository(session), customer_cache
+        )
+
+    @request
+    @provider
+    def provide_product_repository(self, session: AsyncSession) -> AsyncProductRepository:
+        """Provides the AsyncProductRepository of the current request."""
+        return AsyncCachedProductRepository(
+            AsyncSQLAlchemyProductRepository(session), product_cache
+        )
+
+    @request
+    @provider
+    def provide_order_repository(self, session: AsyncSession) -> AsyncOrderRepository:
+        """Provides the AsyncOrderRepository of the current request."""
+        return AsyncSQLAlchemyOrderRepository(session)
+
+    @request
+    @provider
+    def provide_payment_repository(self, session: AsyncSession) -> AsyncPaymentRepository:
+        """Provides the AsyncPaymentRepository of the current request."""
+        return AsyncSQLAlchemyPaymentRepository(session)
+
+    @provider
+    def provide_get_customer_by_cpf_use_case(
+        self, customer_repository: AsyncCustomerRepository
+    ) -> AsyncGetCustomerByCpfUseCase:
+        """Provides an AsyncGetCustomerByCpfUseCase instance."""
+        return AsyncGetCustomerByCpfUseCase(customer_repository)
+
+    @provider
+    def provide_get_products_by_category_use_case(
+        self, product_repository: AsyncProductRepository
+    ) -> AsyncGetProductsByCategoryUseCase:
+        """Provides an AsyncGetProductsByCategoryUseCase instance."""
+        return AsyncGetProductsByCategoryUseCase(product_repository)
+
+    @provider
+    def provide_list_orders_use_case(
+        self, order_repository: AsyncOrderRepository
+    ) -> AsyncListOrdersUseCase:
+        """Provides an AsyncListOrdersUseCase instance."""
+        return AsyncListOrdersUseCase(order_repository)
+
+    @provider
+    def provide_list_orders_sorted_by_status_use_case(
+        self, order_repository: AsyncOrderRepository
+    ) -> AsyncListOrdersByStatusUseCase:
+        """Provides an AsyncListOrdersByStatusUseCase instance."""
+        return AsyncListOrdersByStatusUseCase(order_repository)
+
+    @provider
+    def provide_get_payment_status_use_case(
+        self, payment_repository: AsyncPaymentRepository
+    ) -> AsyncGetPaymentStatusUseCase:
+        """Provides an AsyncGetPaymentStatusUseCase instance."""
+        return AsyncGetPaymentStatusUseCase(payment_repository)
+
+    @singleton
+    @provider
+    def provide_customer_controller(
+        self,
+        get_customer_by_cpf_use_case: ProviderOf[AsyncGetCustomerByCpfUseCase],
+        customer_details_presenter: Presenter[CustomerDetailsOut, CustomerResult],
+    ) -> AsyncCustomerController:
+        """Provides the AsyncCustomerController, which builds its use case on demand."""
+        return AsyncCustomerController(get_customer_by_cpf_use_case.get, customer_details_presenter)
+
+    @singleton
+    @provider
+    def provide_product_controller(
+        self,
+        get_products_by_category_use_case: ProviderOf[AsyncGetProductsByCategoryUseCase],
+        product_details_presenter: Presenter[ProductOut, ProductResult],
+    ) -> AsyncProductController:
+        """Provides the AsyncProductController, which builds its use case on demand."""
+        return AsyncProductController(
+            get_products_by_category_use_case.get, product_details_presenter
+        )
+
+    @singleton
+    @provider
+    def provide_order_controller(
+        self,
+        list_orders_use_case: ProviderOf[AsyncListOrdersUseCase],
+        list_orders_sorted_by_status_use_case: ProviderOf[AsyncListOrdersByStatusUseCase],
+        order_details_presenter: Presenter[OrderOut, OrderResult],
+    ) -> AsyncOrderController:
+        """Provides the AsyncOrderController, which builds its use cases on demand."""
+        return AsyncOrderController(
+            list_orders_use_case.get,
+            list_orders_sorted_by_status_use_case.get,
+            order_details_presenter,
+        )
+
+    @singleton
+    @provider
+    def provide_payment_controller(
+        self,
+        get_payment_status_use_case: ProviderOf[AsyncGetPaymentStatusUseCase],
+        payment_summary_presenter: Presenter[PaymentSummaryOut, PaymentResult],
+    ) -> AsyncPaymentController:
+        """Provides the AsyncPaymentController, which builds its use case on demand."""
+        return AsyncPaymentController(get_payment_status_use_case.get, payment_summary_presenter)
+
 
 def configure_injector(binder) -> None:  # noqa: ANN001
-    """Configures the injector by installing the AppModule."""
+    """Configures the injector by installing the AppModule and the AsyncAppModule."""
     binder.install(AppModule())
+    binder.install(AsyncAppModule())
 
 
 # Create an instance of Injector with the configure_injector function.
 injector = Injector([configure_injector])
 
-__all__ = ["injector"]
+__all__ = ["injector", "open_order_stream"]
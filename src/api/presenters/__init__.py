@@ -1,12 +1,15 @@
 from .customer import CustomerDetailsPresenter
+from .metrics import CacheMetricsPresenter, PoolMetricsPresenter
 from .order import OrderCreatedPresenter, OrderDetailsPresenter
 from .presenter import Presenter
 from .product import ProductDetailsPresenter
 
 __all__ = [
+    "CacheMetricsPresenter",
     "CustomerDetailsPresenter",
     "OrderCreatedPresenter",
     "OrderDetailsPresenter",
+    "PoolMetricsPresenter",
     "Presenter",
     "ProductDetailsPresenter",
 ]
@@ -12,8 +12,8 @@ class CustomerDetailsPresenter(Presenter[CustomerDetailsOut, CustomerResult]):
         """Converts the CustomerResult instance into a CustomerDetailsOut instance."""
         return CustomerDetailsOut(
             name=data.name,
-            cpf=CPFStr(data.cpf.number),
-            email=str(data.email),
+            cpf=CPFStr(data.cpf),
+            email=data.email,
             uuid=data.uuid,
             created_at=data.created_at,
             updated_at=data.updated_at,
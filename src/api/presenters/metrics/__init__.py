@@ -0,0 +1,4 @@
+from .cache_metrics_presenter import CacheMetricsPresenter
+from .pool_metrics_presenter import PoolMetricsPresenter
+
+__all__ = ["CacheMetricsPresenter", "PoolMetricsPresenter"]
@@ -0,0 +1,37 @@
+from typing import Mapping
+
+from src.infra.cache import CacheStats
+
+from ..presenter import Presenter
+
+
+class CacheMetricsPresenter(Presenter[str, Mapping[str, CacheStats]]):
+    """Presenter for the counters of the in-process caches, in the Prometheus text format."""
+
+    def present(self, data: Mapping[str, CacheStats]) -> str:
+        """Converts the CacheStats of each cache into Prometheus exposition lines."""
+        metrics = (
+            ("cache_size", "gauge", "Entries held by the cache.", "size"),
+            ("cache_max_size", "gauge", "Entries the cache holds before evicting.", "max_size"),
+            ("cache_hits_total", "counter", "Lookups answered by the cache.", "hits"),
+            ("cache_misses_total", "counter", "Lookups that found no live entry.", "misses"),
+            ("cache_evictions_total", "counter", "Entries evicted to make room.", "evictions"),
+            ("cache_expirations_total", "counter", "Entries found expired.", "expirations"),
+            (
+                "cache_coalesced_total",
+                "counter",
+                "Misses that waited for the load of another caller.",
+                "coalesced",
+            ),
+        )
+        lines = []
+        for name, kind, help_text, field in metrics:
+            lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"])
+            lines.extend(
+                f'{name}{{cache="{cache}"}} {getattr(stats, field)}'
+                for cache, stats in data.items()
+            )
+        return "\n".join(lines) + "\n"
+
+
+__all__ = ["CacheMetricsPresenter"]
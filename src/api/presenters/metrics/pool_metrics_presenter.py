@@ -0,0 +1,42 @@
+from src.infra.database.config.pool_metrics import CHECKOUT_WAIT_BUCKETS, PoolMetricsSnapshot
+
+from ..presenter import Presenter
+
+
+class PoolMetricsPresenter(Presenter[str, PoolMetricsSnapshot]):
+    """Presenter for the database connection pool metrics, in the Prometheus text format."""
+
+    def present(self, data: PoolMetricsSnapshot) -> str:
+        """Converts the PoolMetricsSnapshot instance into Prometheus exposition lines."""
+        lines = [
+            "# HELP db_pool_size Connections kept open by the pool.",
+            "# TYPE db_pool_size gauge",
+            f"db_pool_size {data.size}",
+            "# HELP db_pool_capacity Connections the pool may hand out at once, overflow included.",
+            "# TYPE db_pool_capacity gauge",
+            f"db_pool_capacity {data.capacity}",
+            "# HELP db_pool_checked_out Connections currently in use.",
+            "# TYPE db_pool_checked_out gauge",
+            f"db_pool_checked_out {data.checked_out}",
+            "# HELP db_pool_saturation Fraction of the pool capacity in use.",
+            "# TYPE db_pool_saturation gauge",
+            f"db_pool_saturation {data.saturation}",
+            "# HELP db_pool_checkout_timeouts_total Checkouts that gave up waiting for a connection.",
+            "# TYPE db_pool_checkout_timeouts_total counter",
+            f"db_pool_checkout_timeouts_total {data.timeouts}",
+            "# HELP db_pool_checkout_wait_seconds Time spent waiting for a pooled connection.",
+            "# TYPE db_pool_checkout_wait_seconds histogram",
+        ]
+        lines.extend(
+            f'db_pool_checkout_wait_seconds_bucket{{le="{bound}"}} {count}'
+            for bound, count in zip(CHECKOUT_WAIT_BUCKETS, data.wait_buckets, strict=True)
+        )
+        lines.extend([
+            f'db_pool_checkout_wait_seconds_bucket{{le="+Inf"}} {data.checkouts}',
+            f"db_pool_checkout_wait_seconds_sum {data.wait_seconds_sum}",
+            f"db_pool_checkout_wait_seconds_count {data.checkouts}",
+        ])
+        return "\n".join(lines) + "\n"
+
+
+__all__ = ["PoolMetricsPresenter"]
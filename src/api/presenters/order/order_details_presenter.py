@@ -1,34 +1,52 @@
-from src.api.schemas import CustomerSummaryOut, OrderItemOut, OrderOut
-from src.api.types import CPFStr
-from src.core.use_cases.order import OrderResult
+from typing import Dict, Iterable, List
+
+from src.api.responses import type_adapter
+from src.api.schemas import CustomerSummaryOut, OrderOut
+from src.core.use_cases.order import CustomerSummaryResult, OrderResult
 
 from ..presenter import Presenter
 
 
 class OrderDetailsPresenter(Presenter[OrderOut, OrderResult]):
-    """Presenter for the OrderDetailsResult use case."""
+    """Presenter for the OrderDetailsResult use case.
+
+    Listing pages present thousands of orders, so `present_many` builds them in one batched
+    validation of `List[OrderOut]` instead of one model at a time. Order results come from
+    stored orders, whose customer data was validated when registered: customers are built with
+    `model_construct`, skipping the costly email and CPF validators, and once per customer.
+    """
 
     def present(self, data: OrderResult) -> OrderOut:
         """Converts the OrderDetailsResult instance into an OrderOut instance."""
-        return OrderOut(
-            number=data.uuid,
-            customer=CustomerSummaryOut(
-                name=data.customer.name,
-                email=data.customer.email,
-                cpf=CPFStr(data.customer.cpf),
-            ),
-            status=data.status,
-            total_value=data.total_value,
-            created_at=data.created_at,
-            updated_at=data.updated_at,
-            items=[
-                OrderItemOut(
-                    product_name=item.product_name,
-                    quantity=item.quantity,
-                    unit_price=item.unit_price,
+        return self.present_many([data])[0]
+
+    def present_many(self, data: Iterable[OrderResult]) -> List[OrderOut]:
+        """Converts the OrderDetailsResult instances into OrderOut instances, all at once."""
+        customers: Dict[str, CustomerSummaryOut] = {}
+
+        def _customer(customer: CustomerSummaryResult) -> CustomerSummaryOut:
+            summary = customers.get(customer.cpf)
+            if summary is None:
+                summary = customers[customer.cpf] = CustomerSummaryOut.model_construct(
+                    name=customer.name, email=customer.email, cpf=customer.cpf
                 )
-                for item in data.items
+            return summary
+
+        return type_adapter(List[OrderOut]).validate_python(
+            [
+                {
+                    "number": order.uuid,
+                    "customer": _customer(order.customer),
+                    # Read by attribute: OrderItemResult has the fields of OrderItemOut.
+                    "items": order.items,
+                    "status": order.status,
+                    "created_at": order.created_at,
+                    "updated_at": order.updated_at,
+                    "total_value": order.total_value,
+                }
+                for order in data
             ],
+            from_attributes=True,
         )
 
 
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from itertools import batched
+from typing import Iterable, Iterator
 
 
 class Presenter[OutputModel, InputData](ABC):
@@ -43,5 +44,23 @@ class Presenter[OutputModel, InputData](ABC):
         """
         return [self.present(item) for item in data]
 
+    def present_each(
+        self, data: Iterable[InputData], batch_size: int = 500
+    ) -> Iterator[OutputModel]:
+        """Presents a stream of input data lazily, as it is consumed.
+
+        The items are presented with `present_many`, `batch_size` at a time, so presenting a
+        stream of any length only holds one batch.
+
+        Args:
+            data: An iterable collection of input data, usually a generator.
+            batch_size: The number of items presented at a time.
+
+        Yields:
+            OutputModel: The presented output models.
+        """
+        for batch in batched(data, batch_size):
+            yield from self.present_many(batch)
+
 
 __all__ = ["Presenter"]
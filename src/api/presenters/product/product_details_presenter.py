@@ -1,3 +1,6 @@
+from typing import Iterable, List
+
+from src.api.responses import type_adapter
 from src.api.schemas import ProductOut
 from src.core.use_cases.product import ProductResult
 
@@ -5,20 +8,19 @@ from ..presenter import Presenter
 
 
 class ProductDetailsPresenter(Presenter[ProductOut, ProductResult]):
-    """Presenter for the product details."""
+    """Presenter for the product details.
+
+    ProductResult has the fields of ProductOut, so `present_many` builds every product in one
+    batched validation of `List[ProductOut]`, reading the results by attribute.
+    """
 
     def present(self, data: ProductResult) -> ProductOut:
-        """Converts the CustomerResult instance into a CustomerDetailsOut instance."""
-        return ProductOut(
-            uuid=data.uuid,
-            name=data.name,
-            category=data.category,
-            price=data.price,
-            description=data.description,
-            images=data.images,
-            created_at=data.created_at,
-            updated_at=data.updated_at,
-        )
+        """Converts the ProductResult instance into a ProductOut instance."""
+        return self.present_many([data])[0]
+
+    def present_many(self, data: Iterable[ProductResult]) -> List[ProductOut]:
+        """Converts the ProductResult instances into ProductOut instances, all at once."""
+        return type_adapter(List[ProductOut]).validate_python(data, from_attributes=True)
 
 
 __all__ = ["ProductDetailsPresenter"]
@@ -0,0 +1,44 @@
+"""A read-your-writes window, which keeps the reads of a client that just wrote off the replica."""
+
+import math
+import time
+from typing import Mapping
+
+from fastapi import Response
+
+PRIMARY_READS_COOKIE = "primary_reads_until"
+"""The cookie holding the Unix time until which the reads of the client run on the primary."""
+
+
+def reads_from_primary(cookies: Mapping[str, str], now: float | None = None) -> bool:
+    """Tells whether the client wrote recently, so its reads must not hit a lagging replica.
+
+    An unparseable cookie is ignored.
+    """
+    try:
+        until = float(cookies.get(PRIMARY_READS_COOKIE, ""))
+    except ValueError:
+        return False
+
+    return (time.time() if now is None else now) < until
+
+
+def remember_write(response: Response, window: float, now: float | None = None) -> None:
+    """Sets the cookie that sends the reads of the client to the primary for `window` seconds.
+
+    Args:
+        response: The response of the request that wrote.
+        window: How long the replica may lag behind the primary, in seconds.
+        now: The current Unix time, the system time if None.
+    """
+    until = (time.time() if now is None else now) + window
+    response.set_cookie(
+        PRIMARY_READS_COOKIE,
+        f"{until:.3f}",
+        max_age=math.ceil(window),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+__all__ = ["PRIMARY_READS_COOKIE", "reads_from_primary", "remember_write"]
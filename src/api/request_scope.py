@@ -0,0 +1,120 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Type, TypeVar
+
+from injector import InstanceProvider, Provider, Scope, ScopeDecorator
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from src.infra.database.config import leak_detector
+
+T = TypeVar("T")
+
+
+class OutsideRequestError(RuntimeError):
+    """Raised when a request scoped dependency is resolved while no request is being handled."""
+
+    def __init__(self, key: Type) -> None:
+        super().__init__(f"{key!r} is request scoped but no request is being handled.")
+
+
+class RequestContext:
+    """Holds the instances shared by everything resolved while handling one HTTP request.
+
+    Attributes:
+        name: A name that identifies the request, e.g. `GET /api/orders`.
+        read_only: Whether the request only reads, so its read-only queries may be served by a
+         read replica.
+        instances: The request scoped instances, keyed by type.
+    """
+
+    def __init__(self, name: str, read_only: bool = False) -> None:
+        self.name = name
+        self.read_only = read_only
+        self.instances: Dict[Type, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"request {self.name!r}"
+
+    async def close(self) -> None:
+        """Closes the request sessions, returning their connections to the pool.
+
+        Synchronous sessions are closed in the thread pool, so the event loop is never blocked.
+        """
+        for instance in self.instances.values():
+            if isinstance(instance, AsyncSession):
+                await instance.close()
+            elif isinstance(instance, Session):
+                await run_in_threadpool(instance.close)
+
+
+_current_context: ContextVar[RequestContext | None] = ContextVar("request_context", default=None)
+
+
+class RequestScope(Scope):
+    """A scope that provides one instance per HTTP request.
+
+    The instances live in the `RequestContext` opened by `request_scope`, so every dependency
+    resolved while handling a request (in any thread the request hops to) shares them.
+    """
+
+    def get(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
+        """Returns the instance of the current request, creating it on the first lookup.
+
+        Raises:
+            OutsideRequestError: If there is no request being handled.
+        """
+        context = _current_context.get()
+        if context is None:
+            raise OutsideRequestError(key)
+
+        if key not in context.instances:
+            context.instances[key] = provider.get(self.injector)
+
+        return InstanceProvider(context.instances[key])
+
+
+request = ScopeDecorator(RequestScope)
+"""Decorator that binds a provider to the `RequestScope`."""
+
+
+def current_request() -> RequestContext | None:
+    """Returns the context of the request being handled, None if there is none."""
+    return _current_context.get()
+
+
+@asynccontextmanager
+async def request_scope(name: str, read_only: bool = False) -> AsyncIterator[RequestContext]:
+    """Opens the request scope of an HTTP request.
+
+    On exit the request sessions are closed and any connection still checked out by the
+    request is reported by the connection leak detector.
+
+    Args:
+        name: A name that identifies the request in the leak reports, e.g. `GET /api/orders`.
+        read_only: Whether the request only reads. Requests that may write are a single write
+         unit, so all their queries run on the primary database.
+
+    Yields:
+        The context holding the request scoped instances.
+    """
+    context = RequestContext(name, read_only)
+    token = _current_context.set(context)
+    try:
+        with leak_detector.track(context):
+            yield context
+    finally:
+        _current_context.reset(token)
+        await context.close()
+        leak_detector.report(context)
+
+
+__all__ = [
+    "OutsideRequestError",
+    "RequestContext",
+    "RequestScope",
+    "current_request",
+    "request",
+    "request_scope",
+]
@@ -0,0 +1,117 @@
+"""Responses that serialize presenter output as is, without FastAPI's re-validation."""
+
+from enum import StrEnum
+from functools import cache
+from itertools import batched
+from typing import Iterable, Iterator, List, Mapping
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+
+@cache
+def type_adapter(schema: object) -> TypeAdapter:
+    """Returns the (cached) adapter that serializes instances of the given schema."""
+    return TypeAdapter(schema)
+
+
+class TrustedJSONResponse(Response):
+    """A JSON response for content a presenter built, serialized without being validated again.
+
+    When a route returns a model, FastAPI dumps it to Python objects, validates them against
+    the `response_model` and encodes the result with the standard library. Presenters already
+    build their output from trusted use case results, so this response skips all of that: it
+    serializes the content straight to JSON bytes with the pydantic-core encoder of `schema`.
+
+    Routes keep declaring `response_model=schema` so the OpenAPI document is unchanged.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: object,
+        schema: object,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Serializes the content.
+
+        Args:
+            content: The presented output, an instance of `schema`.
+            schema: The type of the content, e.g. a model or `List[ProductOut]`.
+            status_code: The status code of the response.
+            headers: Additional headers of the response.
+        """
+        super().__init__(type_adapter(schema).dump_json(content), status_code, headers)
+
+
+class StreamFormat(StrEnum):
+    """The formats a collection can be streamed in."""
+
+    JSON = "json"
+    """A single JSON array, as a non-streamed response would be."""
+
+    NDJSON = "ndjson"
+    """Newline-delimited JSON: one item per line, readable before the stream ends."""
+
+    @property
+    def media_type(self) -> str:
+        """The media type of a response in this format."""
+        return "application/json" if self is StreamFormat.JSON else "application/x-ndjson"
+
+
+class JSONStreamingResponse(StreamingResponse):
+    """A response that serializes a collection of presented items as it is consumed.
+
+    Items are serialized `chunk_size` at a time, like `TrustedJSONResponse` does, and each chunk
+    is sent as soon as it is ready, so the whole body is never held in memory.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[object],
+        schema: object,
+        stream_format: StreamFormat = StreamFormat.JSON,
+        chunk_size: int = 500,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Prepares the stream, nothing is consumed until the response is sent.
+
+        Args:
+            items: The presented items, instances of `schema`, usually a generator.
+            schema: The type of each item.
+            stream_format: Whether to send a JSON array or newline-delimited JSON.
+            chunk_size: The number of items serialized and sent at a time.
+            headers: Additional headers of the response.
+        """
+        chunks = batched(items, chunk_size)
+        body = (
+            _json_array(chunks, type_adapter(List[schema]))  # type: ignore[valid-type]
+            if stream_format is StreamFormat.JSON
+            else _ndjson(chunks, type_adapter(schema))
+        )
+        super().__init__(body, headers=headers, media_type=stream_format.media_type)
+
+
+def _json_array(chunks: Iterable[tuple], adapter: TypeAdapter) -> Iterator[bytes]:
+    separator = b"["
+    for chunk in chunks:
+        # Each chunk is serialized as an array, whose brackets are dropped.
+        yield separator + adapter.dump_json(list(chunk))[1:-1]
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+def _ndjson(chunks: Iterable[tuple], adapter: TypeAdapter) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield b"".join(adapter.dump_json(item) + b"\n" for item in chunk)
+
+
+__all__ = [
+    "JSONStreamingResponse",
+    "StreamFormat",
+    "TrustedJSONResponse",
+    "type_adapter",
+]
@@ -1,6 +1,21 @@
+from .async_customer_router import router as async_customer_router
+from .async_order_router import router as async_order_router
+from .async_payment_router import router as async_payment_router
+from .async_product_router import router as async_product_router
 from .customer_router import router as customer_router
+from .metrics_router import router as metrics_router
 from .order_router import router as order_router
 from .payment_router import router as payment_router
 from .product_router import router as product_router
 
-__all__ = ["customer_router", "order_router", "payment_router", "product_router"]
+__all__ = [
+    "async_customer_router",
+    "async_order_router",
+    "async_payment_router",
+    "async_product_router",
+    "customer_router",
+    "metrics_router",
+    "order_router",
+    "payment_router",
+    "product_router",
+]
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends
+
+from ..controllers import AsyncCustomerController
+from ..dependencies import injector
+from ..schemas import CustomerDetailsOut
+from ..schemas.http_error import HttpErrorOut
+from ..types import CPFStr
+
+router = APIRouter(tags=["Customer"], prefix="/customer")
+
+
+async def _controller() -> AsyncCustomerController:  # noqa: RUF029
+    """Resolves the controller on the event loop, instead of in the thread pool."""
+    return injector.get(AsyncCustomerController)
+
+
+@router.get(
+    "/{cpf}",
+    responses={404: {"model": HttpErrorOut}, 400: {"model": HttpErrorOut}},
+    description="Retrieves a customer from the system using their CPF. The CPF is passed as a path "
+    "parameter.",
+)
+async def get_by_cpf(
+    cpf: CPFStr,
+    controller: AsyncCustomerController = Depends(_controller),  # noqa: B008
+) -> CustomerDetailsOut:
+    return await controller.get_by_cpf(cpf)
+
+
+__all__ = ["router"]
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, Query, Response
+
+from src.core.use_cases.order.list.order_cursor import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+from ..controllers import AsyncOrderController
+from ..dependencies import injector
+from ..responses import TrustedJSONResponse
+from ..schemas.order_schema import OrderPageOut
+
+router = APIRouter(tags=["Order"], prefix="/orders")
+
+
+async def _controller() -> AsyncOrderController:  # noqa: RUF029
+    """Resolves the controller on the event loop, instead of in the thread pool."""
+    return injector.get(AsyncOrderController)
+
+
+@router.get("/", response_model=OrderPageOut)
+async def list_orders(
+    page_size: int = Query(  # noqa: B008
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="The number of orders per page"
+    ),
+    cursor: str | None = Query(  # noqa: B008
+        None, description="The `next_cursor` returned by the previous page"
+    ),
+    controller: AsyncOrderController = Depends(_controller),  # noqa: B008
+) -> Response:
+    """List orders, oldest first, one page at a time."""
+    return TrustedJSONResponse(await controller.list_orders(page_size, cursor), OrderPageOut)
+
+
+@router.get("/orders-sorted-by-status", response_model=OrderPageOut)
+async def list_orders_sorted_by_status(
+    page_size: int = Query(  # noqa: B008
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="The number of orders per page"
+    ),
+    cursor: str | None = Query(  # noqa: B008
+        None, description="The `next_cursor` returned by the previous page"
+    ),
+    controller: AsyncOrderController = Depends(_controller),  # noqa: B008
+) -> Response:
+    """List orders ordered by status, one page at a time."""
+    return TrustedJSONResponse(
+        await controller.list_orders_sorted_by_status(page_size, cursor), OrderPageOut
+    )
+
+
+__all__ = ["router"]
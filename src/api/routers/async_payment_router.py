@@ -0,0 +1,33 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+
+from ..controllers import AsyncPaymentController
+from ..dependencies import injector
+from ..schemas.http_error import HttpErrorOut
+from ..schemas.payment_schema import PaymentSummaryOut
+
+router = APIRouter(tags=["Payment"], prefix="/payment")
+
+
+async def _controller() -> AsyncPaymentController:  # noqa: RUF029
+    """Resolves the controller on the event loop, instead of in the thread pool."""
+    return injector.get(AsyncPaymentController)
+
+
+@router.get(
+    "/{payment}/status",
+    responses={404: {"model": HttpErrorOut}, 400: {"model": HttpErrorOut}},
+    description="Retrieves a payment status from the system using the payment_uuid."
+    "The payment_uuid is passed as a path "
+    "parameter.",
+)
+async def get_payment_status(
+    order_uuid: UUID,
+    controller: AsyncPaymentController = Depends(_controller),  # noqa: B008
+) -> PaymentSummaryOut:
+    """Retrieves a payment status from the system using the payment_uuid."""
+    return await controller.get_payment_status(order_uuid)
+
+
+__all__ = ["router"]
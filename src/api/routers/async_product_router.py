@@ -0,0 +1,40 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Request, Response
+
+from ...core.domain.value_objects import Category
+from ..conditional_requests import cache_control, not_modified
+from ..controllers import AsyncProductController
+from ..dependencies import injector
+from ..responses import TrustedJSONResponse
+from ..schemas.product_schema import ProductOut
+
+router = APIRouter(tags=["Product"])
+
+
+async def _controller() -> AsyncProductController:  # noqa: RUF029
+    """Resolves the controller on the event loop, instead of in the thread pool."""
+    return injector.get(AsyncProductController)
+
+
+@router.get(
+    "/products",
+    response_model=List[ProductOut],
+    responses={304: {"description": "The list did not change since the given validators."}},
+)
+async def get_products_by_category(
+    category: Category,
+    request: Request,
+    controller: AsyncProductController = Depends(_controller),  # noqa: B008
+) -> Response:
+    listing = await controller.get_products_by_category(category, request.headers)
+    policy = cache_control(request.app.state.settings.PRODUCT_LIST_MAX_AGE)
+    if listing.content is None:
+        return not_modified(listing.validators, policy)
+
+    return TrustedJSONResponse(
+        listing.content, List[ProductOut], headers=listing.validators.headers(policy)
+    )
+
+
+__all__ = ["router"]
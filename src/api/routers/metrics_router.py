@@ -0,0 +1,25 @@
+from typing import Mapping
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.infra.cache import CacheStats, get_cache_stats
+from src.infra.database.config import PoolMetricsSnapshot, get_pool_metrics
+
+from ..dependencies import injector
+from ..presenters import Presenter
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics(
+    presenter: Presenter[str, PoolMetricsSnapshot] = Depends(  # noqa: B008
+        lambda: injector.get(Presenter[str, PoolMetricsSnapshot])
+    ),
+    cache_presenter: Presenter[str, Mapping[str, CacheStats]] = Depends(  # noqa: B008
+        lambda: injector.get(Presenter[str, Mapping[str, CacheStats]])
+    ),
+) -> str:
+    """Expose the operational metrics of the service in the Prometheus text format."""
+    return presenter.present(get_pool_metrics()) + cache_presenter.present(get_cache_stats())
@@ -2,14 +2,20 @@ from http import HTTPStatus
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
+
+from src.core.use_cases.order.list.order_cursor import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 from ..controllers.order_controller import OrderController
 from ..dependencies import injector
+from ..responses import JSONStreamingResponse, StreamFormat, TrustedJSONResponse
 from ..schemas.order_schema import (
     OrderCreationOut,
     OrderIn,
     OrderOut,
+    OrderPageOut,
+    OrderStatusBatchOut,
+    OrderStatusBatchUpdateIn,
     OrderStatusUpdateIn,
 )
 
@@ -25,20 +31,67 @@ def checkout(
     return controller.checkout(order_in)
 
 
-@router.get("/", response_model=List[OrderOut])
+@router.get("/", response_model=OrderPageOut)
 def list_orders(
+    page_size: int = Query(  # noqa: B008
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="The number of orders per page"
+    ),
+    cursor: str | None = Query(  # noqa: B008
+        None, description="The `next_cursor` returned by the previous page"
+    ),
     controller: OrderController = Depends(lambda: injector.get(OrderController)),  # noqa: B008
-) -> List[OrderOut]:
-    """List all orders."""
-    return controller.list_orders()
+) -> Response:
+    """List orders, oldest first, one page at a time."""
+    return TrustedJSONResponse(controller.list_orders(page_size, cursor), OrderPageOut)
 
 
-@router.get("/orders-sorted-by-status", response_model=List[OrderOut])
+@router.get("/orders-sorted-by-status", response_model=OrderPageOut)
 def list_orders_sorted_by_status(
+    page_size: int = Query(  # noqa: B008
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="The number of orders per page"
+    ),
+    cursor: str | None = Query(  # noqa: B008
+        None, description="The `next_cursor` returned by the previous page"
+    ),
+    controller: OrderController = Depends(lambda: injector.get(OrderController)),  # noqa: B008
+) -> Response:
+    """List orders ordered by status, one page at a time."""
+    return TrustedJSONResponse(
+        controller.list_orders_sorted_by_status(page_size, cursor), OrderPageOut
+    )
+
+
+@router.get(
+    "/stream",
+    response_model=List[OrderOut],
+    responses={
+        HTTPStatus.OK: {
+            "content": {
+                StreamFormat.NDJSON.media_type: {
+                    "schema": {"$ref": "#/components/schemas/OrderOut"}
+                }
+            },
+            "description": "Every order, as a JSON array or as one JSON object per line.",
+        }
+    },
+)
+def stream_orders(
+    stream_format: StreamFormat = Query(  # noqa: B008
+        StreamFormat.JSON, alias="format", description="A JSON array or newline-delimited JSON"
+    ),
+    controller: OrderController = Depends(lambda: injector.get(OrderController)),  # noqa: B008
+) -> Response:
+    """Export every order, oldest first, streamed as it is read from the database."""
+    return JSONStreamingResponse(controller.stream_orders(), OrderOut, stream_format)
+
+
+@router.put("/status", response_model=OrderStatusBatchOut)
+def update_order_statuses(
+    batch_update: OrderStatusBatchUpdateIn,
     controller: OrderController = Depends(lambda: injector.get(OrderController)),  # noqa: B008
-) -> List[OrderOut]:
-    """List orders ordered by status."""
-    return controller.list_orders_sorted_by_status()
+) -> OrderStatusBatchOut:
+    """Move many orders to the same status at once, reporting the orders left untouched."""
+    return controller.update_statuses(batch_update)
 
 
 @router.put("/{order_uuid}/status", response_model=OrderOut)
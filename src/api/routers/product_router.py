@@ -1,11 +1,21 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
+from starlette.concurrency import run_in_threadpool
 
 from ...core.domain.value_objects import Category
+from ..conditional_requests import cache_control, not_modified
 from ..controllers import ProductController
 from ..dependencies import injector
+from ..responses import TrustedJSONResponse
+from ..schemas.http_error import HttpErrorOut
+from ..schemas.product_import_schema import (
+    CSV_CONTENT_TYPE,
+    CategoryPriceChangeIn,
+    ProductImportOut,
+    parse_product_import,
+)
 from ..schemas.product_schema import ProductCreationIn, ProductOut, ProductUpdateIn
 
 router = APIRouter(tags=["Product"])
@@ -36,12 +46,72 @@ def delete_product(
     controller.delete_product(product_uuid)
 
 
-@router.get("/products", response_model=List[ProductOut])
+@router.get(
+    "/products",
+    response_model=List[ProductOut],
+    responses={304: {"description": "The list did not change since the given validators."}},
+    description="Lists the products of a category. Responses carry an `ETag` and a "
+    "`Last-Modified` header; send them back in `If-None-Match` or `If-Modified-Since` to get an "
+    "empty `304` while the list is unchanged.",
+)
 def get_products_by_category(
     category: Category,
+    request: Request,
+    controller: ProductController = Depends(lambda: injector.get(ProductController)),  # noqa: B008
+) -> Response:
+    listing = controller.get_products_by_category(category, request.headers)
+    policy = cache_control(request.app.state.settings.PRODUCT_LIST_MAX_AGE)
+    if listing.content is None:
+        return not_modified(listing.validators, policy)
+
+    return TrustedJSONResponse(
+        listing.content, List[ProductOut], headers=listing.validators.headers(policy)
+    )
+
+
+@router.post(
+    "/products/bulk",
+    response_model=ProductImportOut,
+    responses={400: {"model": HttpErrorOut}},
+    description="Creates or updates many products at once, matching existing products by name. "
+    "Accepts a JSON array of products or a CSV file with a header row and the images of each "
+    "product separated by `|`. Valid rows are stored in a single transaction; the others are "
+    "reported by row number.",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/ProductCreationIn"},
+                    }
+                },
+                CSV_CONTENT_TYPE: {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_products(
+    request: Request,
+    controller: ProductController = Depends(lambda: injector.get(ProductController)),  # noqa: B008
+) -> ProductImportOut:
+    rows = parse_product_import(request.headers.get("content-type"), await request.body())
+    return await run_in_threadpool(controller.import_products, rows)
+
+
+@router.patch(
+    "/products/categories/{category}/prices",
+    response_model=List[ProductOut],
+    responses={400: {"model": HttpErrorOut}},
+    description="Raises or lowers the price of every product in a category by a percentage.",
+)
+def change_category_prices(
+    category: Category,
+    price_change: CategoryPriceChangeIn,
     controller: ProductController = Depends(lambda: injector.get(ProductController)),  # noqa: B008
 ) -> List[ProductOut]:
-    return controller.get_products_by_category(category)
+    return controller.change_category_prices(category, price_change)
 
 
 __all__ = ["router"]
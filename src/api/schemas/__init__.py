@@ -1,11 +1,13 @@
 from .customer_schema import CustomerCreationIn, CustomerDetailsOut, CustomerSummaryOut
 from .http_error import HttpErrorOut
 from .order_item_schema import OrderItemIn, OrderItemOut
-from .order_schema import OrderCreationOut, OrderIn, OrderOut
+from .order_schema import OrderCreationOut, OrderIn, OrderOut, OrderPageOut
 from .payment_schema import PaymentConfirmationIn, PaymentSummaryOut
+from .product_import_schema import CategoryPriceChangeIn, ProductImportErrorOut, ProductImportOut
 from .product_schema import ProductCreationIn, ProductOut
 
 __all__ = [
+    "CategoryPriceChangeIn",
     "CustomerCreationIn",
     "CustomerDetailsOut",
     "CustomerSummaryOut",
@@ -15,8 +17,11 @@ __all__ = [
     "OrderItemIn",
     "OrderItemOut",
     "OrderOut",
+    "OrderPageOut",
     "PaymentConfirmationIn",
     "PaymentSummaryOut",
     "ProductCreationIn",
+    "ProductImportErrorOut",
+    "ProductImportOut",
     "ProductOut",
 ]
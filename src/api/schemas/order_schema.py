@@ -50,15 +50,56 @@ class OrderOut(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True, arbitrary_types_allowed=True)
 
 
+class OrderPageOut(BaseModel):
+    """Schema for returning a page of orders."""
+
+    items: List[OrderOut] = Field(description="The orders of the page")
+    next_cursor: str | None = Field(
+        description="The cursor to retrieve the next page, null if this is the last one"
+    )
+
+
 class OrderStatusUpdateIn(BaseModel):
     """Schema for updating the status of an order."""
 
     status: OrderStatus = Field(description="The new status of the order")
 
 
+MAX_BATCH_STATUS_UPDATE = 500
+"""The maximum number of orders updated by a single batch status update."""
+
+
+class OrderStatusBatchUpdateIn(BaseModel):
+    """Schema for moving many orders to the same status."""
+
+    order_uuids: List[UUID] = Field(
+        description="The orders to update", min_length=1, max_length=MAX_BATCH_STATUS_UPDATE
+    )
+    status: OrderStatus = Field(description="The new status of the orders")
+
+
+class OrderStatusRejectionOut(BaseModel):
+    """Schema for an order left untouched by a batch status update."""
+
+    uuid: UUID = Field(description="The order identifier")
+    reason: str = Field(description="Why the order was not updated")
+
+
+class OrderStatusBatchOut(BaseModel):
+    """Schema for the outcome of a batch status update."""
+
+    status: OrderStatus = Field(description="The new status of the updated orders")
+    updated: List[UUID] = Field(description="The updated orders")
+    rejected: List[OrderStatusRejectionOut] = Field(description="The orders left untouched")
+
+
 __all__ = [
     "OrderCreationOut",
     "OrderIn",
     "OrderOut",
+    "OrderPageOut",
+    "OrderStatusBatchOut",
+    "OrderStatusBatchUpdateIn",
+    "OrderStatusRejectionOut",
     "OrderStatusUpdateIn",
 ]
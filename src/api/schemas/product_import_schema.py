@@ -0,0 +1,101 @@
+import csv
+import io
+import json
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+from src.core.domain.exceptions import InvalidImportError
+
+from .product_schema import ProductOut
+
+CSV_CONTENT_TYPE = "text/csv"
+"""The content type of CSV imports; any other content type is parsed as JSON."""
+
+CSV_IMAGES_SEPARATOR = "|"
+"""Separates the image URLs of a product in the `images` column of a CSV import."""
+
+_INVALID_CSV = "The import is not a valid CSV file."
+_INVALID_JSON = "The import is not a valid JSON array of products."
+
+
+def _parse_csv(body: bytes) -> List[Dict[str, Any]]:
+    """Parses a CSV import, splitting the `images` cell of each row into a list of URLs."""
+    try:
+        reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+        rows: List[Dict[str, Any]] = list(reader)
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise InvalidImportError(_INVALID_CSV, e) from e
+
+    for row in rows:
+        images = row.get("images") or ""
+        row["images"] = [url.strip() for url in images.split(CSV_IMAGES_SEPARATOR) if url]
+    return rows
+
+
+def _parse_json(body: bytes) -> List[Dict[str, Any]]:
+    """Parses a JSON import, which must be an array of objects."""
+    try:
+        rows = json.loads(body)
+    except ValueError as e:
+        raise InvalidImportError(_INVALID_JSON, e) from e
+
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise InvalidImportError(_INVALID_JSON)
+
+    return rows
+
+
+def parse_product_import(content_type: str | None, body: bytes) -> List[Dict[str, Any]]:
+    """Parses the body of a product import into one raw row per product.
+
+    A JSON import is an array of products, with the same fields as a single product creation. A
+    CSV import has a header row with those same fields, one product per line, and the image URLs
+    of each product in a single cell, separated by `CSV_IMAGES_SEPARATOR`.
+
+    Args:
+        content_type: The content type of the request.
+        body: The raw body of the request.
+
+    Returns:
+        The raw rows, not validated yet.
+
+    Raises:
+        InvalidImportError: If the body is not a JSON array or a CSV file.
+    """
+    if content_type and content_type.split(";")[0].strip() == CSV_CONTENT_TYPE:
+        return _parse_csv(body)
+
+    return _parse_json(body)
+
+
+class ProductImportErrorOut(BaseModel):
+    """Schema for a rejected row of a product import."""
+
+    row: int = Field(description="The position of the row in the import, starting at 1")
+    detail: str = Field(description="Why the row was rejected")
+
+
+class ProductImportOut(BaseModel):
+    """Schema for the outcome of a product import."""
+
+    products: List[ProductOut] = Field(description="The created or updated products")
+    errors: List[ProductImportErrorOut] = Field(description="The rejected rows")
+
+
+class CategoryPriceChangeIn(BaseModel):
+    """Schema for changing the prices of every product in a category."""
+
+    percentage: float = Field(
+        description="The change applied to each price, e.g. 10 for +10% or -5 for -5%", gt=-100
+    )
+
+
+__all__ = [
+    "CSV_CONTENT_TYPE",
+    "CSV_IMAGES_SEPARATOR",
+    "CategoryPriceChangeIn",
+    "ProductImportErrorOut",
+    "ProductImportOut",
+    "parse_product_import",
+]
@@ -4,6 +4,6 @@ This includes reading from .env files or system environment variables, and expos
 values for use in the application.
 """
 
-from .env_settings import settings
+from .env_settings import Settings, settings
 
-__all__ = ["settings"]
+__all__ = ["Settings", "settings"]
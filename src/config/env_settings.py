@@ -48,6 +48,78 @@ class Settings(BaseSettings):
     DB_DRIVER: str
     """The database driver."""
 
+    DB_READER_HOST: str | None = None
+    """The host of a read replica, e.g. an Aurora reader endpoint.
+
+    When set, the queries of read-only repository methods run on it, unless the request writes.
+    """
+
+    DB_READER_PORT: int | None = None
+    """The port of the read replica, defaults to `DB_PORT`."""
+
+    DB_READ_YOUR_WRITES_WINDOW: float = 5.0
+    """The number of seconds the reads of a client stay on the primary after it writes.
+
+    Successful writes set a cookie that keeps the following requests of the client off the read
+    replica, so they see the write even if the replica lags behind; 0 disables it.
+    """
+
+    DB_ASYNC_DRIVER: str = "postgresql+asyncpg"
+    """The database driver used by the asyncio engine."""
+
+    ASYNC_ENDPOINTS: bool = False
+    """Whether the read endpoints are served by the asyncio stack instead of the thread pool."""
+
+    WORKER_THREADS: int = 40
+    """The number of threads that run the synchronous endpoints of each process."""
+
+    DB_POOL_SIZE: int | None = None
+    """The number of connections kept open by the pool, defaults to `WORKER_THREADS`.
+
+    Each request handled by a worker thread holds at most one connection, so a pool as large as
+    the thread pool never makes a request wait for a connection.
+    """
+
+    DB_MAX_OVERFLOW: int = 10
+    """The number of connections that may be opened temporarily beyond `DB_POOL_SIZE`."""
+
+    DB_POOL_TIMEOUT: float = 30.0
+    """The number of seconds to wait for a connection before giving up."""
+
+    DB_POOL_RECYCLE: int = 1800
+    """The number of seconds after which a connection is replaced, -1 to never replace it."""
+
+    DB_POOL_PRE_PING: bool = True
+    """Whether to test connections on checkout, discarding the ones closed by the server."""
+
+    DB_CONNECT_INIT_SQL: str = ""
+    """SQL executed on every new connection, e.g. `SET statement_timeout = '5s'`."""
+
+    CUSTOMER_CACHE_SIZE: int = 10_000
+    """The number of customer lookups kept in memory by each process, 0 disables the cache."""
+
+    CUSTOMER_CACHE_TTL: float = 300.0
+    """The number of seconds a cached customer is served before being read again."""
+
+    CUSTOMER_CACHE_NEGATIVE_TTL: float = 5.0
+    """The number of seconds an unknown CPF or uuid is remembered as absent.
+
+    A customer added by another process is only seen once this expires, so keep it short.
+    """
+
+    PRODUCT_CACHE_TTL: float = 60.0
+    """The number of seconds each process serves the product catalog from memory, 0 disables it.
+
+    Writes made by a process are seen by it right away; other processes see them once this
+    expires.
+    """
+
+    PRODUCT_LIST_MAX_AGE: int = 5
+    """The number of seconds clients and shared caches may reuse a product list unvalidated.
+
+    With 0, they revalidate it on every request, getting a `304` while it is unchanged.
+    """
+
 
 class EnvFileSettings(BaseSettings):
     """Configuration class for loading application environment file settings."""
@@ -66,4 +138,4 @@ class EnvFileSettings(BaseSettings):
 
 settings: Settings = EnvFileSettings().load_settings()
 
-__all__ = ["settings"]
+__all__ = ["Environment", "Settings", "settings"]
@@ -1,6 +1,7 @@
 """Contains core classes that define the fundamental structures of the domain model.
 
-It includes `ValueObject`, `AggregateRoot`, `DomainError` and `AssertionConcern`.
+It includes `ValueObject`, `AggregateRoot`, `FrozenAggregateRoot`, `DomainError`,
+`AssertionConcern` and `InternCache`.
 It provides essential building blocks for defining domain entities,
 value objects, erros, and more.
 """
@@ -8,11 +9,15 @@ value objects, erros, and more.
 from .aggregate_root import AggregateRoot
 from .assertion_concern import AssertionConcern
 from .domain_error import DomainError
+from .frozen_aggregate_root import FrozenAggregateRoot
+from .intern_cache import InternCache
 from .value_object import ValueObject
 
 __all__ = [
     "AggregateRoot",
     "AssertionConcern",
     "DomainError",
+    "FrozenAggregateRoot",
+    "InternCache",
     "ValueObject",
 ]
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
+from functools import cache
+from typing import Any, Callable, Dict, Self
 from uuid import UUID
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AggregateRoot(ABC):
     """Base class for aggregate roots."""
 
@@ -30,5 +32,51 @@ class AggregateRoot(ABC):
         """The aggregate root's ID."""
         return self._id
 
+    @classmethod
+    def restore(cls, **attributes: Any) -> Self:  # noqa: ANN401
+        """Rebuilds an aggregate root from trusted state, e.g. a row it was stored as.
+
+        The state is assigned as is: neither `__post_init__` nor `validate` runs, so nothing is
+        checked or derived. It must only be used for state that was valid when it was stored;
+        everything else goes through the constructor.
+
+        Args:
+            attributes: The fields of the aggregate root, by name. The omitted ones take their
+             default.
+
+        Raises:
+            AttributeError: If an attribute is not a field.
+            KeyError: If a field without a default is omitted.
+        """
+        # Assigned with `object.__setattr__`, which a frozen aggregate root does not guard.
+        instance = cls.__new__(cls)
+        for name, value in attributes.items():
+            object.__setattr__(instance, name, value)
+
+        defaults = _defaults(cls)
+        if len(attributes) < len(defaults):
+            for name, default in defaults.items():
+                if name not in attributes:
+                    value = attributes[name] if default is None else default()
+                    object.__setattr__(instance, name, value)
+        return instance
+
+
+@cache
+def _defaults(cls: type) -> Dict[str, Callable[[], Any] | None]:
+    """Returns the factories of the default values of the fields of a dataclass, by name.
+
+    The factory is None for the fields without a default.
+    """
+    defaults: Dict[str, Callable[[], Any] | None] = {}
+    for attribute in fields(cls):
+        if attribute.default_factory is not MISSING:
+            defaults[attribute.name] = attribute.default_factory
+        elif attribute.default is not MISSING:
+            defaults[attribute.name] = lambda value=attribute.default: value
+        else:
+            defaults[attribute.name] = None
+    return defaults
+
 
 __all__ = ["AggregateRoot"]
@@ -0,0 +1,26 @@
+from dataclasses import FrozenInstanceError, dataclass
+
+from .aggregate_root import AggregateRoot
+
+
+@dataclass(kw_only=True, slots=True)
+class FrozenAggregateRoot(AggregateRoot):
+    """Base class for aggregate roots that never change once built, so they can be shared.
+
+    Each field is assigned once, by the constructor, `restore` or a copy; any later assignment
+    or deletion raises `FrozenInstanceError`, as with a frozen dataclass, which cannot extend
+    the mutable `AggregateRoot`. A changed entity is derived with `dataclasses.replace`.
+
+    Subclasses that normalize a field in `__post_init__` assign it with `object.__setattr__`.
+    """
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if hasattr(self, name):
+            raise FrozenInstanceError(name)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(name)
+
+
+__all__ = ["FrozenAggregateRoot"]
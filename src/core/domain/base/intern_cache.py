@@ -0,0 +1,59 @@
+from threading import Lock
+from typing import Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class InternCache(Generic[K, V]):
+    """A bounded table of interned values, so equal values are built once and shared.
+
+    Lookups are a single dictionary access, without locking. Once full, interning a new value
+    evicts the oldest one, which only costs a rebuild the next time it is needed.
+
+    Only immutable values may be interned, as every holder of a key shares the same instance.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: The maximum number of interned values, 0 to intern nothing.
+        """
+        self._max_size = max_size
+        self._values: Dict[K, V] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: K) -> V | None:
+        """Returns the value interned under the key, None if there is none."""
+        return self._values.get(key)
+
+    def intern(self, key: K, value: V) -> V:
+        """Interns a value under the key, unless another one was interned first.
+
+        Returns:
+            The value interned under the key, which callers should use instead of theirs.
+        """
+        if self._max_size <= 0:
+            return value
+
+        with self._lock:
+            interned = self._values.get(key)
+            if interned is not None:
+                return interned
+
+            if len(self._values) >= self._max_size:
+                del self._values[next(iter(self._values))]
+            self._values[key] = value
+            return value
+
+    def clear(self) -> None:
+        """Drops every interned value."""
+        with self._lock:
+            self._values.clear()
+
+
+__all__ = ["InternCache"]
@@ -9,8 +9,12 @@ class ValueObject(ABC):
     not their identity.
 
     They are typically used to represent domain concepts.
+
+    As they are immutable, their hash is computed once and cached.
     """
 
+    __slots__ = ("_hash",)
+
     @abstractmethod
     def _get_equality_components(self) -> Iterable:
         """Returns an iterable of components that define the value of this object.
@@ -19,13 +23,20 @@ class ValueObject(ABC):
         """
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if other is None or not isinstance(other, type(self)):
             return False
 
         return self._get_equality_components() == other._get_equality_components()
 
     def __hash__(self) -> int:
-        return hash(tuple(x for x in self._get_equality_components() if x is not None))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(tuple(x for x in self._get_equality_components() if x is not None))
+            return self._hash
 
 
 __all__ = ["ValueObject"]
@@ -1,13 +1,15 @@
 from dataclasses import dataclass, field
 
-from src.core.domain.base import AggregateRoot, AssertionConcern
+from src.core.domain.base import AssertionConcern, FrozenAggregateRoot
 from src.core.domain.value_objects import CPF, Email
 
 
-@dataclass(kw_only=True)
-class Customer(AggregateRoot):
+@dataclass(kw_only=True, slots=True)
+class Customer(FrozenAggregateRoot):
     """Represents a customer in the system.
 
+    A customer never changes once built, so the orders of a listing may share it.
+
     Attributes:
     name: The customer's name.
     cpf: The customer's CPF.
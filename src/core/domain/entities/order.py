@@ -1,6 +1,5 @@
-import copy
 from dataclasses import dataclass, field
-from typing import List
+from typing import Sequence, Tuple
 
 from ..base import AggregateRoot, AssertionConcern
 from ..exceptions import InvalidStatusTransitionError
@@ -9,17 +8,22 @@ from .customer import Customer
 from .order_item import OrderItem
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Order(AggregateRoot):
-    """Represents an order in the system."""
+    """Represents an order in the system.
+
+    The items given on creation, in any sequence, are kept in a tuple: the order owns its
+    collection of items, which can be read without being copied but never changed.
+    """
 
     _customer: Customer
-    _items: List[OrderItem] = field(default_factory=list)
+    _items: Sequence[OrderItem] = field(default_factory=tuple)
     _total_value: float = field(default=0.0)
     _status: OrderStatus = field(default_factory=lambda: OrderStatus.PAYMENT_PENDING)
 
     def __post_init__(self) -> None:
         self.validate()
+        self._items = tuple(self._items)
         self._recalculate_total_value()
 
     @property
@@ -31,9 +35,9 @@ class Order(AggregateRoot):
         return self._total_value
 
     @property
-    def items(self) -> List[OrderItem]:
-        """Returns a list of items in the order."""
-        return copy.deepcopy(self._items)
+    def items(self) -> Tuple[OrderItem, ...]:
+        """Returns the items in the order, as an immutable tuple."""
+        return self._items
 
     @property
     def customer(self) -> Customer:
@@ -1,14 +1,16 @@
 from dataclasses import dataclass
 
-from src.core.domain.base import AggregateRoot, AssertionConcern
+from src.core.domain.base import AssertionConcern, FrozenAggregateRoot
 
 from .product import Product
 
 
-@dataclass(kw_only=True)
-class OrderItem(AggregateRoot):
+@dataclass(kw_only=True, slots=True)
+class OrderItem(FrozenAggregateRoot):
     """Represents a product within an order.
 
+    An item never changes once built, so the total of its order can never go stale.
+
     Attributes:
     product_uuid: The UUID of the product.
     quantity: The quantity of the product.
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
-from typing import Dict, Iterable
+from types import MappingProxyType
+from typing import FrozenSet, Mapping
 
 from src.core.domain.base import AggregateRoot, AssertionConcern
 
@@ -17,26 +18,40 @@ class PaymentStatus(StrEnum):
     REJECTED = auto()  # Payment was rejected
     FAILED = auto()  # Payment failed for some reason
 
-    def get_allowed_transitions(self) -> Iterable["PaymentStatus"]:
+    def get_allowed_transitions(self) -> FrozenSet["PaymentStatus"]:
         """Returns the allowed transitions for the given status."""
-        _transitions: Dict["PaymentStatus", Iterable["PaymentStatus"]] = {
-            PaymentStatus.PENDING: [
-                PaymentStatus.PROCESSING,
-                PaymentStatus.APPROVED,
-                PaymentStatus.REJECTED,
-            ],
-            PaymentStatus.PROCESSING: [
-                PaymentStatus.APPROVED,
-                PaymentStatus.REJECTED,
-                PaymentStatus.FAILED,
-            ],
-            PaymentStatus.FAILED: [PaymentStatus.PROCESSING],
-        }
-
-        return _transitions.get(self, [])
-
-
-@dataclass(kw_only=True)
+        return _TRANSITIONS[self]
+
+    def allowed_sources(self) -> FrozenSet["PaymentStatus"]:
+        """Returns the statuses a payment may be moved to this status from."""
+        return _SOURCES[self]
+
+
+_TRANSITIONS: Mapping[PaymentStatus, FrozenSet[PaymentStatus]] = MappingProxyType({
+    PaymentStatus.PENDING: frozenset({
+        PaymentStatus.PROCESSING,
+        PaymentStatus.APPROVED,
+        PaymentStatus.REJECTED,
+    }),
+    PaymentStatus.PROCESSING: frozenset({
+        PaymentStatus.APPROVED,
+        PaymentStatus.REJECTED,
+        PaymentStatus.FAILED,
+    }),
+    PaymentStatus.APPROVED: frozenset(),
+    PaymentStatus.REJECTED: frozenset(),
+    PaymentStatus.FAILED: frozenset({PaymentStatus.PROCESSING}),
+})
+"""The allowed status transitions, keyed by the status they start from."""
+
+_SOURCES: Mapping[PaymentStatus, FrozenSet[PaymentStatus]] = MappingProxyType({
+    target: frozenset(source for source, targets in _TRANSITIONS.items() if target in targets)
+    for target in PaymentStatus
+})
+"""The allowed status transitions, keyed by the status they lead to."""
+
+
+@dataclass(kw_only=True, slots=True)
 class Payment(AggregateRoot):
     """Represents a payment in the system."""
 
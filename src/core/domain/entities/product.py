@@ -1,14 +1,18 @@
 from dataclasses import dataclass
+from typing import Tuple
 
-from src.core.domain.base import AggregateRoot, AssertionConcern
+from src.core.domain.base import AssertionConcern, FrozenAggregateRoot
 
 from ..value_objects import Category
 
 
-@dataclass(kw_only=True)
-class Product(AggregateRoot):
+@dataclass(kw_only=True, slots=True)
+class Product(FrozenAggregateRoot):
     """Represents a product in the system.
 
+    A product never changes once built, so the items of many orders may share it; its images,
+    given in any sequence, are kept in a tuple.
+
     Attributes:
     name: The product's name.
     category: The product's category.
@@ -21,7 +25,11 @@ class Product(AggregateRoot):
     category: Category
     price: float
     description: str
-    images: list[str]
+    images: Tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        self.validate()
+        object.__setattr__(self, "images", tuple(self.images))
 
     def validate(self) -> None:
         """Validates the product's attributes.
@@ -12,14 +12,16 @@ from src.core.domain.base import DomainError
 
 from .category_error import InvalidCategoryError
 from .cpf_error import InvalidCpfError
+from .cursor_error import InvalidCursorError
 from .customer_error import CustomerNotFoundError
 from .email_error import InvalidEmailError
+from .import_error import InvalidImportError
 from .not_found_error import NotFoundError
 from .order_error import EmptyOrderError, OrderCreationFailedDueToMissingProductsError
 from .order_not_found_error import OrderNotFoundError
 from .order_status_error import InvalidOrderStatusError
 from .payment_error import PaymentNotFoundError
-from .product_error import ProductNotFoundError
+from .product_error import InvalidPriceChangeError, ProductNotFoundError
 from .status_error import InvalidStatusTransitionError
 
 __all__ = [
@@ -28,8 +30,11 @@ __all__ = [
     "EmptyOrderError",
     "InvalidCategoryError",
     "InvalidCpfError",
+    "InvalidCursorError",
     "InvalidEmailError",
+    "InvalidImportError",
     "InvalidOrderStatusError",
+    "InvalidPriceChangeError",
     "InvalidStatusTransitionError",
     "NotFoundError",
     "OrderCreationFailedDueToMissingProductsError",
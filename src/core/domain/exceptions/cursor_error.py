@@ -0,0 +1,12 @@
+from src.core.domain.base import DomainError
+
+
+class InvalidCursorError(DomainError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str, message: str = "Invalid pagination cursor.") -> None:
+        super().__init__(message)
+        self.cursor = cursor
+
+
+__all__ = ["InvalidCursorError"]
@@ -0,0 +1,13 @@
+from src.core.domain.base import DomainError
+
+
+class InvalidImportError(DomainError):
+    """Raised when a bulk import cannot be parsed as a whole."""
+
+    def __init__(
+        self, message: str = "Invalid import file.", inner_error: Exception | None = None
+    ) -> None:
+        super().__init__(message, inner_error)
+
+
+__all__ = ["InvalidImportError"]
@@ -1,3 +1,5 @@
+from src.core.domain.base import DomainError
+
 from .not_found_error import NotFoundError
 
 
@@ -19,4 +21,12 @@ class ProductNotFoundError(NotFoundError):
         self.search_param = search_param
 
 
-__all__ = ["ProductNotFoundError"]
+class InvalidPriceChangeError(DomainError):
+    """Raised when a price change would leave a product without a positive price."""
+
+    def __init__(self, factor: float, message: str = "Price must be greater than zero.") -> None:
+        super().__init__(message)
+        self.factor = factor
+
+
+__all__ = ["InvalidPriceChangeError", "ProductNotFoundError"]
@@ -7,14 +7,26 @@ They offer methods for creating, reading, updating, and deleting domain entities
 clean separation of concerns and enhancing the maintainability of the codebase.
 """
 
+from .async_customer_repository import AsyncCustomerRepository
+from .async_order_repository import AsyncOrderRepository
+from .async_payment_repository import AsyncPaymentRepository
+from .async_product_repository import AsyncProductRepository
 from .customer_repository import CustomerRepository
-from .order_repository import OrderRepository
+from .order_repository import OrderPageCursor, OrderRepository
 from .payment_repository import PaymentRepository
 from .product_repository import ProductRepository
+from .views import CustomerView, PaymentStatusView
 
 __all__ = [
+    "AsyncCustomerRepository",
+    "AsyncOrderRepository",
+    "AsyncPaymentRepository",
+    "AsyncProductRepository",
     "CustomerRepository",
+    "CustomerView",
+    "OrderPageCursor",
     "OrderRepository",
     "PaymentRepository",
+    "PaymentStatusView",
     "ProductRepository",
 ]
@@ -0,0 +1,94 @@
+from abc import ABC, abstractmethod
+from typing import Collection, List, Sequence
+from uuid import UUID
+
+from src.core.domain.entities import Order
+from src.core.domain.value_objects import OrderStatus
+
+from .order_repository import OrderPageCursor
+
+
+class AsyncOrderRepository(ABC):
+    """Asyncio counterpart of `OrderRepository`, for order persistence operations."""
+
+    @abstractmethod
+    async def create(self, order: Order) -> Order:
+        """Persists a new order in the repository.
+
+        Args:
+            order (Order): The order to be created.
+
+        Returns:
+            Order: The created order with its uuid and other persistence details populated.
+        """
+
+    @abstractmethod
+    async def update_status(
+        self, order_uuid: UUID, status: OrderStatus, from_statuses: Collection[OrderStatus]
+    ) -> Order | None:
+        """Updates the status of an existing order, if its current status is one of `from_statuses`.
+
+        Args:
+            order_uuid (UUID): The uuid of the order to be updated.
+            status (OrderStatus): The new status for the order.
+            from_statuses (Collection[OrderStatus]): The statuses the order may be moved from.
+
+        Returns:
+            Order | None: The updated order, or None if the order does not exist or is in any
+             other status.
+        """
+
+    @abstractmethod
+    async def list_all(self) -> List[Order]:
+        """Retrieves all orders from the repository.
+
+        Returns:
+            List[Order]: A list of all orders.
+        """
+
+    @abstractmethod
+    async def list_page(self, page_size: int, after: OrderPageCursor | None = None) -> List[Order]:
+        """Retrieves a page of orders sorted by creation date, oldest first.
+
+        Args:
+            page_size (int): The maximum number of orders to return.
+            after (OrderPageCursor | None): The position of the last order of the previous page,
+             or None to retrieve the first page.
+
+        Returns:
+            List[Order]: Up to `page_size` orders placed after the given cursor.
+        """
+
+    @abstractmethod
+    async def get_by_uuid(self, order_uuid: UUID) -> Order | None:
+        """Retrieves an order by its uuid.
+
+        Args:
+            order_uuid (UUID): The uuid of the order to retrieve.
+
+        Returns:
+            Order: The order with the given uuid, None if not found.
+        """
+
+    @abstractmethod
+    async def list_orders_sorted_by_status(
+        self,
+        statuses: Sequence[OrderStatus],
+        page_size: int | None = None,
+        after: OrderPageCursor | None = None,
+    ) -> List[Order]:
+        """Retrieves orders by specific statuses, sorted by status and then by creation date.
+
+        Args:
+            statuses (Sequence[OrderStatus]): The statuses to filter by. Their position in the
+             sequence defines the order in which they are sorted.
+            page_size (int | None): The maximum number of orders to return, or None for all.
+            after (OrderPageCursor | None): The position of the last order of the previous page,
+             or None to retrieve the first page. Its status must be one of `statuses`.
+
+        Returns:
+            List[Order]: List of orders with the specified statuses.
+        """
+
+
+__all__ = ["AsyncOrderRepository"]
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.core.domain.entities import Payment
+
+from .views import PaymentStatusView
+
+
+class AsyncPaymentRepository(ABC):
+    """Asyncio counterpart of `PaymentRepository`, for handling payment persistence."""
+
+    @abstractmethod
+    async def get_by_uuid(self, uuid: UUID) -> Payment | None:
+        """Get a payment by its UUID.
+
+        Args:
+            uuid: The payment's UUID.
+
+        Returns:
+            Payment: The payment data if found, None otherwise.
+        """
+
+    @abstractmethod
+    async def get_status_view(self, order_uuid: UUID) -> PaymentStatusView | None:
+        """Get the status of the payment of an order, without loading the payment.
+
+        Args:
+            order_uuid: The order's UUID.
+
+        Returns:
+            PaymentStatusView if found, None otherwise.
+        """
+
+    @abstractmethod
+    async def add(self, payment: Payment) -> Payment:
+        """Add a new payment to the database.
+
+        Args:
+            payment: The payment data.
+
+        Returns:
+            Payment: The added payment data.
+        """
+
+
+__all__ = ["AsyncPaymentRepository"]
@@ -4,6 +4,8 @@ from uuid import UUID
 from src.core.domain.entities.customer import Customer
 from src.core.domain.value_objects import CPF, Email
 
+from .views import CustomerView
+
 
 class CustomerRepository(ABC):
     """Repository for handling customer persistence."""
@@ -31,6 +33,17 @@ class CustomerRepository(ABC):
             Customer: The customer data if found, None otherwise.
         """
 
+    @abstractmethod
+    def get_view_by_cpf(self, cpf: CPF) -> CustomerView | None:
+        """Get the stored data of a customer by their CPF, without building the entity.
+
+        Args:
+            cpf: The customer's CPF.
+
+        Returns:
+            CustomerView: The customer data if found, None otherwise.
+        """
+
     @abstractmethod
     def get_by_uuid(self, uuid: UUID) -> Customer | None:
         """Get a customer by their UUID.
@@ -1,11 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Collection, Dict, Iterator, List, Sequence
 from uuid import UUID
 
 from src.core.domain.entities import Order
 from src.core.domain.value_objects import OrderStatus
 
 
+@dataclass(frozen=True)
+class OrderPageCursor:
+    """The keyset position of the last order of a page.
+
+    Pages are sorted by `(created_at, id)`, so the next page starts right after this pair.
+
+    Attributes:
+        created_at: The creation date of the last order seen.
+        id: The id of the last order seen, used to break ties between equal creation dates.
+        status: The status of the last order seen, for listings sorted by status first.
+    """
+
+    created_at: datetime
+    id: int
+    status: OrderStatus
+
+
 class OrderRepository(ABC):
     """OrderRepository is an abstract base class that defines the contract for order persistence operations.
 
@@ -25,18 +44,57 @@ class OrderRepository(ABC):
         pass
 
     @abstractmethod
-    def update_status(self, order_uuid: UUID, status: OrderStatus) -> Order:
-        """Updates the status of an existing order in the repository.
+    def update_status(
+        self, order_uuid: UUID, status: OrderStatus, from_statuses: Collection[OrderStatus]
+    ) -> Order | None:
+        """Updates the status of an existing order, if its current status is one of `from_statuses`.
+
+        The check and the update are atomic: an order moved by someone else in the meantime is
+        never updated from a status it is no longer in.
 
         Args:
             order_uuid (UUID): The uuid of the order to be updated.
             status (OrderStatus): The new status for the order.
+            from_statuses (Collection[OrderStatus]): The statuses the order may be moved from.
 
         Returns:
-            Order: The updated order.
+            Order | None: The updated order, or None if the order does not exist or is in any
+             other status.
         """
         pass
 
+    @abstractmethod
+    def update_statuses(
+        self,
+        order_uuids: Sequence[UUID],
+        status: OrderStatus,
+        from_statuses: Sequence[OrderStatus],
+    ) -> List[UUID]:
+        """Sets the status of many orders at once, skipping the orders in any other status.
+
+        The check and the update are atomic, so an order that changes status concurrently is
+        never moved from a status outside `from_statuses`.
+
+        Args:
+            order_uuids (Sequence[UUID]): The uuids of the orders to be updated.
+            status (OrderStatus): The new status for the orders.
+            from_statuses (Sequence[OrderStatus]): The statuses an order may be moved from.
+
+        Returns:
+            List[UUID]: The uuids of the updated orders.
+        """
+
+    @abstractmethod
+    def get_statuses(self, order_uuids: Sequence[UUID]) -> Dict[UUID, OrderStatus]:
+        """Retrieves the current status of the given orders.
+
+        Args:
+            order_uuids (Sequence[UUID]): The uuids of the orders.
+
+        Returns:
+            Dict[UUID, OrderStatus]: The status of each order found, keyed by uuid.
+        """
+
     @abstractmethod
     def list_all(self) -> List[Order]:
         """Retrieves all orders from the repository.
@@ -46,6 +104,31 @@ class OrderRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> Iterator[Order]:
+        """Yields every order, oldest first, without loading them all at once.
+
+        Args:
+            batch_size (int): The number of orders read from the database at a time.
+
+        Returns:
+            Iterator[Order]: The orders, read lazily as the iterator is consumed.
+        """
+
+    @abstractmethod
+    def list_page(self, page_size: int, after: OrderPageCursor | None = None) -> List[Order]:
+        """Retrieves a page of orders sorted by creation date, oldest first.
+
+        Args:
+            page_size (int): The maximum number of orders to return.
+            after (OrderPageCursor | None): The position of the last order of the previous page,
+             or None to retrieve the first page.
+
+        Returns:
+            List[Order]: Up to `page_size` orders placed after the given cursor.
+        """
+        pass
+
     @abstractmethod
     def get_by_uuid(self, order_uuid: UUID) -> Order | None:
         """Retrieves an order by its uuid.
@@ -59,11 +142,20 @@ class OrderRepository(ABC):
         pass
 
     @abstractmethod
-    def list_orders_sorted_by_status(self, statuses: List[str]) -> List[Order]:
-        """Retrieves orders by specific statuses from the database.
+    def list_orders_sorted_by_status(
+        self,
+        statuses: Sequence[OrderStatus],
+        page_size: int | None = None,
+        after: OrderPageCursor | None = None,
+    ) -> List[Order]:
+        """Retrieves orders by specific statuses, sorted by status and then by creation date.
 
         Args:
-            statuses (List[str]): List of status strings to filter by.
+            statuses (Sequence[OrderStatus]): The statuses to filter by. Their position in the
+             sequence defines the order in which they are sorted.
+            page_size (int | None): The maximum number of orders to return, or None for all.
+            after (OrderPageCursor | None): The position of the last order of the previous page,
+             or None to retrieve the first page. Its status must be one of `statuses`.
 
         Returns:
             List[Order]: List of orders with the specified statuses.
@@ -71,4 +163,4 @@ class OrderRepository(ABC):
         pass
 
 
-__all__ = ["OrderRepository"]
+__all__ = ["OrderPageCursor", "OrderRepository"]
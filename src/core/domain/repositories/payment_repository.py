@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
+from typing import Collection, Tuple
 from uuid import UUID
 
 from src.core.domain.entities import Payment
 from src.core.domain.entities.payment import PaymentStatus
+from src.core.domain.value_objects import OrderStatus
+
+from .views import PaymentStatusView
 
 
 class PaymentRepository(ABC):
@@ -20,14 +24,14 @@ class PaymentRepository(ABC):
         """
 
     @abstractmethod
-    def get_payment_details(self, order_uuid: UUID) -> Payment | None:
-        """Get a payment by Order UUID.
+    def get_status_view(self, order_uuid: UUID) -> PaymentStatusView | None:
+        """Get the status of the payment of an order, without loading the payment.
 
         Args:
             order_uuid: The order's UUID.
 
         Returns:
-            Payment if found, None otherwise.
+            PaymentStatusView if found, None otherwise.
         """
 
     @abstractmethod
@@ -42,15 +46,40 @@ class PaymentRepository(ABC):
         """
 
     @abstractmethod
-    def update_status(self, payment_id: int, status: PaymentStatus) -> Payment | None:
-        """Update the status of an existing payment.
+    def confirm(
+        self,
+        uuid: UUID,
+        status: PaymentStatus,
+        from_statuses: Collection[PaymentStatus],
+        order_status: OrderStatus | None = None,
+        order_from_statuses: Collection[OrderStatus] = (),
+    ) -> bool:
+        """Sets the status of a payment and, optionally, the status of its order.
+
+        Both updates happen in one transaction and only if the current statuses allow them:
+        either both are applied or none is. Neither the payment nor the order is loaded.
 
         Args:
-            payment_id: The id of the payment to be updated.
+            uuid: The payment's UUID.
             status: The new status for the payment.
+            from_statuses: The statuses the payment may be moved from.
+            order_status: The new status for the order of the payment, None to leave it as is.
+            order_from_statuses: The statuses the order may be moved from.
+
+        Returns:
+            True if the statuses were updated, False if the payment does not exist or the
+            current statuses do not allow the updates.
+        """
+
+    @abstractmethod
+    def get_statuses(self, uuid: UUID) -> Tuple[PaymentStatus, OrderStatus] | None:
+        """Get the current status of a payment and the one of its order.
+
+        Args:
+            uuid: The payment's UUID.
 
         Returns:
-            Payment: The updated payment data if found, None otherwise.
+            The payment status and the order status if the payment is found, None otherwise.
         """
 
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Set
+from typing import List, Sequence, Set
 from uuid import UUID
 
 from src.core.domain.entities.product import Product
@@ -50,6 +50,14 @@ class ProductRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def list_all(self) -> List[Product]:
+        """Retrieves every product of the catalog.
+
+        Returns:
+            List[Product]: All the products, in the order they were created.
+        """
+
     @abstractmethod
     def get_by_category(self, category: Category) -> List[Product]:
         """Retrieves all products in a given category.
@@ -97,5 +105,37 @@ class ProductRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def upsert_by_name(self, products: Sequence[Product]) -> List[Product]:
+        """Creates the given products, or updates the existing ones with the same name.
+
+        Names are compared ignoring case, like `get_by_name`. All the products are written in a
+        single transaction.
+
+        Args:
+            products: The products to create or update. Their names must be unique, ignoring
+             case.
+
+        Returns:
+            List[Product]: The stored products, in the same order as `products`.
+        """
+
+    @abstractmethod
+    def change_prices_by_category(self, category: Category, factor: float) -> List[Product]:
+        """Multiplies the price of every product in a category by the given factor.
+
+        Args:
+            category: The category whose products are repriced.
+            factor: The factor applied to each price, e.g. 1.1 for a 10% increase. New prices are
+             rounded to cents.
+
+        Returns:
+            List[Product]: The repriced products.
+
+        Raises:
+            InvalidPriceChangeError: If a new price would round to zero or less, in which case no
+             price changes.
+        """
+
 
 __all__ = ["ProductRepository"]
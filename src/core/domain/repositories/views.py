@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from src.core.domain.entities.payment import PaymentStatus
+
+
+@dataclass(frozen=True)
+class CustomerView:
+    """The stored data of a customer, read as is for display.
+
+    Values come straight from the database, without building the entity or its value objects.
+
+    Attributes:
+        uuid: The unique identifier of the customer.
+        name: The name of the customer.
+        cpf: The digits of the customer CPF.
+        email: The email address of the customer.
+        created_at: The timestamp when the customer was created.
+        updated_at: The timestamp when the customer data was last updated.
+    """
+
+    uuid: UUID
+    name: str
+    cpf: str
+    email: str
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class PaymentStatusView:
+    """The status of a payment, read without loading the payment nor its order.
+
+    Attributes:
+        uuid: The unique identifier of the payment.
+        status: The current status of the payment.
+    """
+
+    uuid: UUID
+    status: PaymentStatus
+
+
+__all__ = ["CustomerView", "PaymentStatusView"]
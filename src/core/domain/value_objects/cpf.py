@@ -1,8 +1,14 @@
 import re
+from operator import mul
 
-from src.core.domain.base import ValueObject
+from src.core.domain.base import InternCache, ValueObject
 from src.core.domain.exceptions import InvalidCpfError
 
+_FORMAT = re.compile(r"(\d{3}\.\d{3}\.\d{3}-\d{2}|\d{11})")
+_NON_DIGITS = re.compile(r"\D")
+_FIRST_DIGIT_WEIGHTS = range(10, 1, -1)
+_SECOND_DIGIT_WEIGHTS = range(11, 1, -1)
+
 
 class CPF(ValueObject):
     """A Value Object that represents a Brazilian CPF (Cadastro de Pessoas Físicas).
@@ -10,12 +16,24 @@ class CPF(ValueObject):
     CPF is a unique number that identifies a taxpaying resident in Brazil. This class
     validates the CPF number using the official Brazilian algorithm.
 
+    CPFs are interned: building one from an input seen before, masked or not, returns the
+    instance built the first time, without validating it again. Restored CPFs are interned
+    apart, so the constructor never returns one that it did not validate.
+
     Attributes:
         _number: The CPF number.
     """
 
-    def __init__(self, cpf: str) -> None:
-        """Initializes a CPF object after validating the input CPF number.
+    __slots__ = ("_number",)
+
+    _interned: InternCache[str, "CPF"] = InternCache(max_size=10_000)
+    """The validated CPFs, keyed by the input they were built from and by their clean number."""
+
+    _restored: InternCache[str, "CPF"] = InternCache(max_size=10_000)
+    """The CPFs restored without validation, keyed by their clean number."""
+
+    def __new__(cls, cpf: str) -> "CPF":
+        """Builds a CPF object after validating the input CPF number.
 
         Args:
             cpf (str): The CPF number to be validated and stored.
@@ -23,10 +41,38 @@ class CPF(ValueObject):
         Raises:
             InvalidCpfError: If the input CPF number is invalid.
         """
-        if not self._is_valid(cpf):
+        interned = cls._interned.get(cpf)
+        if interned is not None:
+            return interned
+
+        if not cls._is_valid(cpf):
             raise InvalidCpfError(cpf=cpf)
 
-        self._number = self._clean_cpf(cpf)
+        number = cls._clean_cpf(cpf)
+        validated = cls._interned.intern(number, cls.restore(number))
+        return cls._interned.intern(cpf, validated)
+
+    @classmethod
+    def restore(cls, number: str) -> "CPF":
+        """Rebuilds a CPF from a clean number that was valid when it was stored.
+
+        The number is not validated again, so this must only be used for trusted data, e.g.
+        a CPF read from the database.
+
+        Args:
+            number (str): The clean CPF number.
+        """
+        for interned in (cls._interned.get(number), cls._restored.get(number)):
+            if interned is not None:
+                return interned
+
+        cpf = super().__new__(cls)
+        cpf._number = number
+        return cls._restored.intern(number, cpf)
+
+    def __reduce__(self) -> tuple:
+        """Copies and unpickles the CPF through `restore`, as its number is already valid."""
+        return type(self).restore, (self._number,)
 
     def _get_equality_components(self) -> tuple[str]:
         """Provides the components that define the value of this CPF object.
@@ -55,7 +101,7 @@ class CPF(ValueObject):
         Returns:
             bool: True if the CPF number is valid, False otherwise.
         """
-        if not re.match(r"(\d{3}\.\d{3}\.\d{3}-\d{2}|\d{11})", cpf):
+        if not _FORMAT.match(cpf):
             return False
 
         cpf = cls._clean_cpf(cpf)
@@ -64,12 +110,14 @@ class CPF(ValueObject):
         if cpf == cpf[0] * 11:
             return False
 
-        checksum = sum(int(cpf[i]) * (10 - i) for i in range(9))
+        digits = [int(digit) for digit in cpf[:10]]
+
+        checksum = sum(map(mul, digits, _FIRST_DIGIT_WEIGHTS))
         digit1 = 11 - (checksum % 11)
         digit1 = 0 if digit1 > 9 else digit1
 
         # Calculates the second check digit
-        checksum = sum(int(cpf[i]) * (11 - i) for i in range(10))
+        checksum = sum(map(mul, digits, _SECOND_DIGIT_WEIGHTS))
         digit2 = 11 - (checksum % 11)
         digit2 = 0 if digit2 > 9 else digit2
 
@@ -85,7 +133,7 @@ class CPF(ValueObject):
         Returns:
             str: The cleaned CPF number.
         """
-        return re.sub(r"\D", "", cpf)
+        return _NON_DIGITS.sub("", cpf)
 
     def __str__(self) -> str:
         """Returns the clean CPF number."""
@@ -1,20 +1,35 @@
 import re
 
-from src.core.domain.base import ValueObject
+from src.core.domain.base import InternCache, ValueObject
 from src.core.domain.exceptions import InvalidEmailError
 
+_PATTERN = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
 
 class Email(ValueObject):
     """A Value Object that represents an Email.
 
     This class validates the email using a simple regular expression.
 
+    Emails are interned: building one from an address seen before returns the instance built
+    the first time, without validating it again. Addresses are kept as given, so they are also
+    the key they are interned by. Restored emails are interned apart, so the constructor never
+    returns one that it did not validate.
+
     Attributes:
         _address: The email address.
     """
 
-    def __init__(self, email_address: str) -> None:
-        """Initializes an Email object after validating the input email.
+    __slots__ = ("_address",)
+
+    _interned: InternCache[str, "Email"] = InternCache(max_size=10_000)
+    """The validated emails, keyed by their address."""
+
+    _restored: InternCache[str, "Email"] = InternCache(max_size=10_000)
+    """The emails restored without validation, keyed by their address."""
+
+    def __new__(cls, email_address: str) -> "Email":
+        """Builds an Email object after validating the input email.
 
         Args:
             email_address (str): The email to be validated and stored.
@@ -22,10 +37,36 @@ class Email(ValueObject):
         Raises:
             InvalidEmailError: If the input email is invalid.
         """
-        if not self._is_valid(email_address):
+        interned = cls._interned.get(email_address)
+        if interned is not None:
+            return interned
+
+        if not cls._is_valid(email_address):
             raise InvalidEmailError(email_address)
 
-        self._address = email_address
+        return cls._interned.intern(email_address, cls.restore(email_address))
+
+    @classmethod
+    def restore(cls, email_address: str) -> "Email":
+        """Rebuilds an Email from an address that was valid when it was stored.
+
+        The address is not validated again, so this must only be used for trusted data, e.g.
+        an email read from the database.
+
+        Args:
+            email_address (str): The email address.
+        """
+        for interned in (cls._interned.get(email_address), cls._restored.get(email_address)):
+            if interned is not None:
+                return interned
+
+        email = super().__new__(cls)
+        email._address = email_address
+        return cls._restored.intern(email_address, email)
+
+    def __reduce__(self) -> tuple:
+        """Copies and unpickles the Email through `restore`, as its address is already valid."""
+        return type(self).restore, (self._address,)
 
     def _get_equality_components(self) -> tuple[str]:
         """Provides the components that define the value of this Email object.
@@ -54,7 +95,7 @@ class Email(ValueObject):
         Returns:
             bool: True if the email is valid, False otherwise.
         """
-        return bool(re.match(r"[^@]+@[^@]+\.[^@]+", email))
+        return bool(_PATTERN.match(email))
 
     def __str__(self) -> str:
         """Returns the email address as a string."""
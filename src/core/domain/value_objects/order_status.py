@@ -1,5 +1,6 @@
 from enum import StrEnum, auto
-from typing import Dict, Iterable
+from types import MappingProxyType
+from typing import FrozenSet, Iterable, Mapping, Tuple
 
 
 class OrderStatus(StrEnum):
@@ -16,16 +17,40 @@ class OrderStatus(StrEnum):
         """Return a list of OrderStatus values."""
         return [cls[member] for member in cls.__members__]
 
-    def get_allowed_transitions(self) -> Iterable["OrderStatus"]:
-        """Returns the allowed transitions for the given status."""
-        _transitions: Dict["OrderStatus", Iterable["OrderStatus"]] = {
-            OrderStatus.PAYMENT_PENDING: [OrderStatus.RECEIVED],
-            OrderStatus.RECEIVED: [OrderStatus.PROCESSING],
-            OrderStatus.PROCESSING: [OrderStatus.READY],
-            OrderStatus.READY: [OrderStatus.COMPLETED],
-        }
-
-        return _transitions.get(self, [])
-
+    @classmethod
+    def kitchen_queue(cls) -> Tuple["OrderStatus", ...]:
+        """Return the statuses shown on the kitchen display, in the order they are displayed.
+
+        Orders that are ready come first, then the ones being prepared and finally the ones
+        waiting to be prepared.
+        """
+        return cls.READY, cls.PROCESSING, cls.RECEIVED
+
+    def get_allowed_transitions(self) -> FrozenSet["OrderStatus"]:
+        """Returns the statuses an order in this status may be moved to."""
+        return _TRANSITIONS[self]
+
+    def allowed_sources(self) -> FrozenSet["OrderStatus"]:
+        """Returns the statuses an order may be moved to this status from."""
+        return _SOURCES[self]
+
+
+_TRANSITIONS: Mapping[OrderStatus, FrozenSet[OrderStatus]] = MappingProxyType({
+    OrderStatus.PAYMENT_PENDING: frozenset({OrderStatus.RECEIVED}),
+    OrderStatus.RECEIVED: frozenset({OrderStatus.PROCESSING}),
+    OrderStatus.PROCESSING: frozenset({OrderStatus.READY}),
+    OrderStatus.READY: frozenset({OrderStatus.COMPLETED}),
+    OrderStatus.COMPLETED: frozenset(),
+})
+"""The allowed status transitions, keyed by the status they start from."""
+
+_SOURCES: Mapping[OrderStatus, FrozenSet[OrderStatus]] = MappingProxyType({
+    target: frozenset(source for source, targets in _TRANSITIONS.items() if target in targets)
+    for target in OrderStatus
+})
+"""The allowed status transitions, keyed by the status they lead to.
+
+Lets a transition be checked by the database, e.g. `UPDATE ... WHERE status IN (sources)`.
+"""
 
 __all__ = ["OrderStatus"]
@@ -1,23 +1,45 @@
-from .customer import CreateCustomerUseCase, CustomerResult, GetCustomerByCpfUseCase
+from .customer import (
+    AsyncGetCustomerByCpfUseCase,
+    CreateCustomerUseCase,
+    CustomerResult,
+    GetCustomerByCpfUseCase,
+)
 from .order import (
+    AsyncListOrdersByStatusUseCase,
+    AsyncListOrdersUseCase,
+    BatchUpdateOrderStatusUseCase,
     CheckoutUseCase,
     ListOrdersByStatusUseCase,
     ListOrdersUseCase,
     OrderResult,
     PaymentConfirmationUseCase,
+    StreamOrdersUseCase,
     UpdateOrderStatusUseCase,
 )
-from .payment import PaymentProcessingUseCase
-from .payment.find.get_payment_status_use_case import GetPaymentStatusUseCase
+from .payment import (
+    AsyncGetPaymentStatusUseCase,
+    GetPaymentStatusUseCase,
+    PaymentProcessingUseCase,
+)
 from .product import (
+    AsyncGetProductsByCategoryUseCase,
+    CategoryPriceChangeUseCase,
     GetProductsByCategoryUseCase,
     ProductCreationUseCase,
     ProductDeleteUseCase,
+    ProductImportUseCase,
     ProductResult,
     ProductUpdateUseCase,
 )
 
 __all__ = [
+    "AsyncGetCustomerByCpfUseCase",
+    "AsyncGetPaymentStatusUseCase",
+    "AsyncGetProductsByCategoryUseCase",
+    "AsyncListOrdersByStatusUseCase",
+    "AsyncListOrdersUseCase",
+    "BatchUpdateOrderStatusUseCase",
+    "CategoryPriceChangeUseCase",
     "CheckoutUseCase",
     "CreateCustomerUseCase",
     "CustomerResult",
@@ -31,7 +53,9 @@ __all__ = [
     "PaymentProcessingUseCase",
     "ProductCreationUseCase",
     "ProductDeleteUseCase",
+    "ProductImportUseCase",
     "ProductResult",
     "ProductUpdateUseCase",
+    "StreamOrdersUseCase",
     "UpdateOrderStatusUseCase",
 ]
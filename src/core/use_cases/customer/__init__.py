@@ -1,8 +1,9 @@
 from .create import CreateCustomerUseCase, CustomerCreationData
-from .find import GetCustomerByCpfUseCase
+from .find import AsyncGetCustomerByCpfUseCase, GetCustomerByCpfUseCase
 from .shared_dtos import CustomerResult
 
 __all__ = [
+    "AsyncGetCustomerByCpfUseCase",
     "CreateCustomerUseCase",
     "CustomerCreationData",
     "CustomerResult",
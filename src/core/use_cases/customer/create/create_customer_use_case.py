@@ -33,8 +33,8 @@ class CreateCustomerUseCase:
         db_customer = self.customer_repository.add(customer)
         return CustomerResult(
             name=db_customer.name,
-            cpf=db_customer.cpf,
-            email=db_customer.email,
+            cpf=db_customer.cpf.number,
+            email=db_customer.email.address,
             created_at=db_customer.created_at,
             updated_at=db_customer.updated_at,
             uuid=db_customer.uuid,
@@ -1,3 +1,4 @@
+from .async_get_customer_by_cpf_use_case import AsyncGetCustomerByCpfUseCase
 from .get_customer_by_cpf_use_case import GetCustomerByCpfUseCase
 
-__all__ = ["GetCustomerByCpfUseCase"]
+__all__ = ["AsyncGetCustomerByCpfUseCase", "GetCustomerByCpfUseCase"]
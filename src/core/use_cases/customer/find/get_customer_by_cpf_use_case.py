@@ -23,7 +23,7 @@ class GetCustomerByCpfUseCase:
         Raises:
             CustomerNotFoundError: If the customer is not found.
         """
-        customer = self.customer_repository.get_by_cpf(CPF(cpf))
+        customer = self.customer_repository.get_view_by_cpf(CPF(cpf))
 
         if not customer:
             raise CustomerNotFoundError(search_params={"cpf": cpf})
@@ -2,16 +2,14 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-from src.core.domain.value_objects import CPF, Email
 
-
-@dataclass
+@dataclass(slots=True)
 class CustomerResult:
     """Data structure for holding data of a customer.
 
     Attributes:
         name: The name of the customer.
-        cpf: The CPF of the customer.
+        cpf: The digits of the customer CPF.
         email: The email address of the customer.
         uuid: The unique identifier of the customer.
         created_at: The timestamp when the customer was created.
@@ -19,8 +17,8 @@ class CustomerResult:
     """
 
     name: str
-    cpf: CPF
-    email: Email
+    cpf: str
+    email: str
     uuid: UUID
     created_at: datetime
     updated_at: datetime
@@ -1,9 +1,24 @@
 from .checkout import CheckoutItem, CheckoutOrder, CheckoutUseCase
-from .list import ListOrdersByStatusUseCase, ListOrdersUseCase
-from .shared_dtos import CustomerSummaryResult, OrderItemResult, OrderResult
-from .update import PaymentConfirmationUseCase, UpdateOrderStatusUseCase
+from .list import (
+    AsyncListOrdersByStatusUseCase,
+    AsyncListOrdersUseCase,
+    ListOrdersByStatusUseCase,
+    ListOrdersUseCase,
+    StreamOrdersUseCase,
+)
+from .shared_dtos import CustomerSummaryResult, OrderItemResult, OrderPageResult, OrderResult
+from .update import (
+    BatchUpdateOrderStatusUseCase,
+    OrderStatusBatchResult,
+    OrderStatusRejection,
+    PaymentConfirmationUseCase,
+    UpdateOrderStatusUseCase,
+)
 
 __all__ = [
+    "AsyncListOrdersByStatusUseCase",
+    "AsyncListOrdersUseCase",
+    "BatchUpdateOrderStatusUseCase",
     "CheckoutItem",
     "CheckoutOrder",
     "CheckoutUseCase",
@@ -11,7 +26,11 @@ __all__ = [
     "ListOrdersByStatusUseCase",
     "ListOrdersUseCase",
     "OrderItemResult",
+    "OrderPageResult",
     "OrderResult",
+    "OrderStatusBatchResult",
+    "OrderStatusRejection",
     "PaymentConfirmationUseCase",
+    "StreamOrdersUseCase",
     "UpdateOrderStatusUseCase",
 ]
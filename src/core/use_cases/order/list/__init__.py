@@ -1,4 +1,13 @@
+from .async_list_orders_by_status_use_case import AsyncListOrdersByStatusUseCase
+from .async_list_orders_use_case import AsyncListOrdersUseCase
 from .list_orders_by_status_use_case import ListOrdersByStatusUseCase
 from .list_orders_use_case import ListOrdersUseCase
+from .stream_orders_use_case import StreamOrdersUseCase
 
-__all__ = ["ListOrdersByStatusUseCase", "ListOrdersUseCase"]
+__all__ = [
+    "AsyncListOrdersByStatusUseCase",
+    "AsyncListOrdersUseCase",
+    "ListOrdersByStatusUseCase",
+    "ListOrdersUseCase",
+    "StreamOrdersUseCase",
+]
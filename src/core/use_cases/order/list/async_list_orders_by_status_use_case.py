@@ -0,0 +1,49 @@
+from src.core.domain.exceptions import InvalidCursorError
+from src.core.domain.repositories import AsyncOrderRepository
+from src.core.domain.value_objects import OrderStatus
+
+from ..shared_dtos import OrderPageResult
+from .order_cursor import DEFAULT_PAGE_SIZE, clamp_page_size, decode_cursor
+from .order_page import to_order_page
+
+
+class AsyncListOrdersByStatusUseCase:
+    """Asyncio counterpart of `ListOrdersByStatusUseCase`, for listing the kitchen queue."""
+
+    def __init__(self, repository: AsyncOrderRepository) -> None:
+        """Initializes a new instance of the AsyncListOrdersByStatusUseCase class.
+
+        Args:
+            repository (AsyncOrderRepository): The repository instance for order persistence
+             operations.
+        """
+        self.repository = repository
+
+    async def list_orders_sorted_by_status(
+        self, page_size: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> OrderPageResult:
+        """Retrieves orders sorted by status (READY, PROCESSING, RECEIVED) and creation date.
+
+        Args:
+            page_size: The maximum number of orders to return, capped at `MAX_PAGE_SIZE`.
+            cursor: The `next_cursor` of the previous page, or None for the first page.
+
+        Returns:
+            The page of orders and the cursor to the next one.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        page_size = clamp_page_size(page_size)
+        statuses = OrderStatus.kitchen_queue()
+        after = decode_cursor(cursor) if cursor else None
+
+        if after is not None and after.status not in statuses:
+            raise InvalidCursorError(cursor)
+
+        # Fetch one extra order to find out whether there is a next page.
+        orders = await self.repository.list_orders_sorted_by_status(statuses, page_size + 1, after)
+        return to_order_page(orders, page_size)
+
+
+__all__ = ["AsyncListOrdersByStatusUseCase"]
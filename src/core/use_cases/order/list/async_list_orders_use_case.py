@@ -0,0 +1,43 @@
+from src.core.domain.repositories import AsyncOrderRepository
+
+from ..shared_dtos import OrderPageResult
+from .order_cursor import DEFAULT_PAGE_SIZE, clamp_page_size, decode_cursor
+from .order_page import to_order_page
+
+
+class AsyncListOrdersUseCase:
+    """Asyncio counterpart of `ListOrdersUseCase`, for retrieving orders."""
+
+    def __init__(self, repository: AsyncOrderRepository) -> None:
+        """Initializes a new instance of the AsyncListOrdersUseCase class.
+
+        Args:
+            repository (AsyncOrderRepository): The repository instance for order persistence
+             operations.
+        """
+        self.repository = repository
+
+    async def list_orders(
+        self, page_size: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> OrderPageResult:
+        """Retrieves a page of orders, oldest first.
+
+        Args:
+            page_size: The maximum number of orders to return, capped at `MAX_PAGE_SIZE`.
+            cursor: The `next_cursor` of the previous page, or None for the first page.
+
+        Returns:
+            The page of orders and the cursor to the next one.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        page_size = clamp_page_size(page_size)
+        after = decode_cursor(cursor) if cursor else None
+
+        # Fetch one extra order to find out whether there is a next page.
+        orders = await self.repository.list_page(page_size + 1, after)
+        return to_order_page(orders, page_size)
+
+
+__all__ = ["AsyncListOrdersUseCase"]
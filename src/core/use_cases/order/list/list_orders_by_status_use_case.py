@@ -1,8 +1,10 @@
-from typing import Iterable
-
+from src.core.domain.exceptions import InvalidCursorError
 from src.core.domain.repositories.order_repository import OrderRepository
+from src.core.domain.value_objects import OrderStatus
 
-from ..shared_dtos import CustomerSummaryResult, OrderItemResult, OrderResult
+from ..shared_dtos import OrderPageResult
+from .order_cursor import DEFAULT_PAGE_SIZE, clamp_page_size, decode_cursor
+from .order_page import to_order_page
 
 
 class ListOrdersByStatusUseCase:
@@ -16,47 +18,31 @@ class ListOrdersByStatusUseCase:
         """
         self.repository = repository
 
-    def list_orders_sorted_by_status(self) -> Iterable[OrderResult]:
+    def list_orders_sorted_by_status(
+        self, page_size: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> OrderPageResult:
         """Retrieves orders sorted by a custom status order: READY, PROCESSING, RECEIVED and sorted py the creation date.
 
+        Args:
+            page_size: The maximum number of orders to return, capped at `MAX_PAGE_SIZE`.
+            cursor: The `next_cursor` of the previous page, or None for the first page.
+
         Returns:
-            List[Order]: List of orders sorted by custom status order and .
+            The page of orders and the cursor to the next one.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
         """
-        orders = self.repository.list_all()
-
-        status_order = {"ready": 1, "processing": 2, "received": 3}
-
-        # Filter orders to include only those with statuses READY, PROCESSING, RECEIVED
-        filtered_orders = [order for order in orders if order.status in status_order]
-
-        # Sort orders based on the defined order of statuses
-        sorted_orders = sorted(
-            filtered_orders, key=lambda order: (status_order[order.status], order.created_at)
-        )
-
-        return [
-            OrderResult(
-                uuid=order.uuid,
-                status=order.status,
-                total_value=order.total_value,
-                created_at=order.created_at,
-                updated_at=order.updated_at,
-                customer=CustomerSummaryResult(
-                    name=order.customer.name,
-                    email=str(order.customer.email),
-                    cpf=str(order.customer.cpf),
-                ),
-                items=[
-                    OrderItemResult(
-                        product_name=item.product.name,
-                        quantity=item.quantity,
-                        unit_price=item.unit_price,
-                    )
-                    for item in order.items
-                ],
-            )
-            for order in sorted_orders
-        ]
+        page_size = clamp_page_size(page_size)
+        statuses = OrderStatus.kitchen_queue()
+        after = decode_cursor(cursor) if cursor else None
+
+        if after is not None and after.status not in statuses:
+            raise InvalidCursorError(cursor)
+
+        # Fetch one extra order to find out whether there is a next page.
+        orders = self.repository.list_orders_sorted_by_status(statuses, page_size + 1, after)
+        return to_order_page(orders, page_size)
 
 
 __all__ = ["ListOrdersByStatusUseCase"]
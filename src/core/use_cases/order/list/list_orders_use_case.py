@@ -1,8 +1,8 @@
-from typing import Iterable
-
 from src.core.domain.repositories.order_repository import OrderRepository
 
-from ..shared_dtos import CustomerSummaryResult, OrderItemResult, OrderResult
+from ..shared_dtos import OrderPageResult
+from .order_cursor import DEFAULT_PAGE_SIZE, clamp_page_size, decode_cursor
+from .order_page import to_order_page
 
 
 class ListOrdersUseCase:
@@ -16,36 +16,27 @@ class ListOrdersUseCase:
         """
         self.repository = repository
 
-    def list_orders(self) -> Iterable[OrderResult]:
-        """Retrieves all orders.
+    def list_orders(
+        self, page_size: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> OrderPageResult:
+        """Retrieves a page of orders, oldest first.
+
+        Args:
+            page_size: The maximum number of orders to return, capped at `MAX_PAGE_SIZE`.
+            cursor: The `next_cursor` of the previous page, or None for the first page.
 
         Returns:
-            An iterable of all orders.
+            The page of orders and the cursor to the next one.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
         """
-        orders = self.repository.list_all()
-        return [
-            OrderResult(
-                uuid=order.uuid,
-                status=order.status,
-                total_value=order.total_value,
-                created_at=order.created_at,
-                updated_at=order.updated_at,
-                customer=CustomerSummaryResult(
-                    name=order.customer.name,
-                    email=str(order.customer.email),
-                    cpf=str(order.customer.cpf),
-                ),
-                items=[
-                    OrderItemResult(
-                        product_name=item.product.name,
-                        quantity=item.quantity,
-                        unit_price=item.unit_price,
-                    )
-                    for item in order.items
-                ],
-            )
-            for order in orders
-        ]
+        page_size = clamp_page_size(page_size)
+        after = decode_cursor(cursor) if cursor else None
+
+        # Fetch one extra order to find out whether there is a next page.
+        orders = self.repository.list_page(page_size + 1, after)
+        return to_order_page(orders, page_size)
 
 
 __all__ = ["ListOrdersUseCase"]
@@ -0,0 +1,66 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from src.core.domain.entities import Order
+from src.core.domain.exceptions import InvalidCursorError
+from src.core.domain.repositories import OrderPageCursor
+from src.core.domain.value_objects import OrderStatus
+
+DEFAULT_PAGE_SIZE = 50
+"""The number of orders returned per page when no page size is informed."""
+
+MAX_PAGE_SIZE = 200
+"""The largest page size a client may request."""
+
+
+def clamp_page_size(page_size: int) -> int:
+    """Restricts the given page size to the `[1, MAX_PAGE_SIZE]` range."""
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def encode_cursor(order: Order) -> str:
+    """Encodes the keyset position of the given order as an opaque, URL-safe token.
+
+    Args:
+        order: The last order of a page.
+
+    Returns:
+        The token to be sent back by the client to retrieve the next page.
+    """
+    payload = json.dumps([order.created_at.isoformat(), order.id, order.status.value])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> OrderPageCursor:
+    """Decodes a token produced by `encode_cursor`.
+
+    Args:
+        token: The opaque cursor informed by the client.
+
+    Returns:
+        The keyset position the token refers to.
+
+    Raises:
+        InvalidCursorError: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, order_id, status = json.loads(base64.urlsafe_b64decode(padded))
+        return OrderPageCursor(
+            created_at=datetime.fromisoformat(created_at),
+            id=int(order_id),
+            status=OrderStatus(status),
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+        raise InvalidCursorError(token) from error
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "clamp_page_size",
+    "decode_cursor",
+    "encode_cursor",
+]
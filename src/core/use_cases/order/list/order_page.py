@@ -0,0 +1,54 @@
+from typing import List
+
+from src.core.domain.entities import Order
+
+from ..shared_dtos import CustomerSummaryResult, OrderItemResult, OrderPageResult, OrderResult
+from .order_cursor import encode_cursor
+
+
+def to_order_result(order: Order) -> OrderResult:
+    """Builds the result of a listed order."""
+    return OrderResult(
+        uuid=order.uuid,
+        status=order.status,
+        total_value=order.total_value,
+        created_at=order.created_at,
+        updated_at=order.updated_at,
+        customer=CustomerSummaryResult(
+            name=order.customer.name,
+            email=str(order.customer.email),
+            cpf=str(order.customer.cpf),
+        ),
+        items=[
+            OrderItemResult(
+                product_name=item.product.name,
+                quantity=item.quantity,
+                unit_price=item.unit_price,
+            )
+            for item in order.items
+        ],
+    )
+
+
+def to_order_page(orders: List[Order], page_size: int) -> OrderPageResult:
+    """Builds a page of orders from a query that fetched up to `page_size + 1` orders.
+
+    The extra order is only used to find out whether there is a next page; it is not returned.
+
+    Args:
+        orders: The orders fetched for the page, plus the first order of the next page if any.
+        page_size: The number of orders in a page.
+
+    Returns:
+        The page of orders and the cursor to the next one.
+    """
+    has_next_page = len(orders) > page_size
+    orders = orders[:page_size]
+
+    return OrderPageResult(
+        items=[to_order_result(order) for order in orders],
+        next_cursor=encode_cursor(orders[-1]) if has_next_page else None,
+    )
+
+
+__all__ = ["to_order_page", "to_order_result"]
@@ -0,0 +1,39 @@
+from typing import Iterator
+
+from src.core.domain.repositories.order_repository import OrderRepository
+
+from ..shared_dtos import OrderResult
+from .order_page import to_order_result
+
+STREAM_BATCH_SIZE = 500
+"""The number of orders read from the repository at a time while streaming."""
+
+
+class StreamOrdersUseCase:
+    """StreamOrdersUseCase encapsulates the business logic for exporting every order."""
+
+    def __init__(self, repository: OrderRepository) -> None:
+        """Initializes a new instance of the StreamOrdersUseCase class.
+
+        Args:
+            repository (OrderRepository): The repository instance for order persistence operations.
+        """
+        self.repository = repository
+
+    def stream_orders(self, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[OrderResult]:
+        """Yields every order, oldest first, one at a time.
+
+        Orders are read `batch_size` at a time and turned into results as they are consumed,
+        so memory does not grow with the number of orders.
+
+        Args:
+            batch_size: The number of orders read from the repository at a time.
+
+        Yields:
+            The result of each order.
+        """
+        for order in self.repository.stream_all(batch_size):
+            yield to_order_result(order)
+
+
+__all__ = ["STREAM_BATCH_SIZE", "StreamOrdersUseCase"]
@@ -6,7 +6,7 @@ from uuid import UUID
 from src.core.domain.value_objects import OrderStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItemResult:
     """OrderItemResult represents the details of an order item."""
 
@@ -15,7 +15,7 @@ class OrderItemResult:
     unit_price: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerSummaryResult:
     """CustomerSummaryResult represents the details of a customer."""
 
@@ -24,7 +24,7 @@ class CustomerSummaryResult:
     cpf: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     """OrderDetails represents the details of an order."""
 
@@ -37,4 +37,17 @@ class OrderResult:
     customer: CustomerSummaryResult
 
 
-__all__ = ["CustomerSummaryResult", "OrderItemResult", "OrderResult"]
+@dataclass(slots=True)
+class OrderPageResult:
+    """OrderPageResult represents a page of orders.
+
+    Attributes:
+        items: The orders of the page.
+        next_cursor: The cursor to retrieve the next page, None if this is the last one.
+    """
+
+    items: Iterable[OrderResult]
+    next_cursor: str | None
+
+
+__all__ = ["CustomerSummaryResult", "OrderItemResult", "OrderPageResult", "OrderResult"]
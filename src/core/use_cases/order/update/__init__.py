@@ -1,4 +1,12 @@
+from .batch_update_order_status_use_case import BatchUpdateOrderStatusUseCase
+from .order_status_batch_dto import OrderStatusBatchResult, OrderStatusRejection
 from .update_order_status_use_case import UpdateOrderStatusUseCase
 from .update_payment_status_use_case import PaymentConfirmationUseCase
 
-__all__ = ["PaymentConfirmationUseCase", "UpdateOrderStatusUseCase"]
+__all__ = [
+    "BatchUpdateOrderStatusUseCase",
+    "OrderStatusBatchResult",
+    "OrderStatusRejection",
+    "PaymentConfirmationUseCase",
+    "UpdateOrderStatusUseCase",
+]
@@ -0,0 +1,66 @@
+from typing import List, Sequence
+from uuid import UUID
+
+from src.core.domain.exceptions import InvalidStatusTransitionError, OrderNotFoundError
+from src.core.domain.repositories.order_repository import OrderRepository
+from src.core.domain.value_objects.order_status import OrderStatus
+
+from .order_status_batch_dto import OrderStatusBatchResult, OrderStatusRejection
+
+
+class BatchUpdateOrderStatusUseCase:
+    """Moves many orders to the same status at once, e.g. from RECEIVED to PROCESSING."""
+
+    def __init__(self, repository: OrderRepository) -> None:
+        """Initializes a new instance of the BatchUpdateOrderStatusUseCase class.
+
+        Args:
+            repository (OrderRepository): The repository instance for order persistence operations.
+        """
+        self.repository = repository
+
+    def update_statuses(
+        self, order_uuids: Sequence[UUID], status: OrderStatus
+    ) -> OrderStatusBatchResult:
+        """Moves the given orders to a new status, following the allowed status transitions.
+
+        Every order whose current status allows the transition is updated by a single
+        statement. The others are left untouched and reported: either they do not exist or
+        their status does not allow the transition.
+
+        Args:
+            order_uuids: The uuids of the orders to be updated. Repeated uuids are ignored.
+            status: The new status for the orders.
+
+        Returns:
+            OrderStatusBatchResult: The updated orders and the rejected ones, with the reason.
+        """
+        order_uuids = list(dict.fromkeys(order_uuids))
+        from_statuses = list(status.allowed_sources())
+
+        updated = (
+            set(self.repository.update_statuses(order_uuids, status, from_statuses))
+            if from_statuses
+            else set()
+        )
+        not_updated = [order_uuid for order_uuid in order_uuids if order_uuid not in updated]
+        current_statuses = self.repository.get_statuses(not_updated) if not_updated else {}
+
+        rejected: List[OrderStatusRejection] = []
+        for order_uuid in not_updated:
+            current = current_statuses.get(order_uuid)
+            error = (
+                OrderNotFoundError(order_uuid)
+                if current is None
+                else InvalidStatusTransitionError(current, status)
+            )
+            rejected.append(OrderStatusRejection(uuid=order_uuid, reason=error.message))
+
+        return OrderStatusBatchResult(
+            status=status,
+            updated=[order_uuid for order_uuid in order_uuids if order_uuid in updated],
+            rejected=rejected,
+        )
+
+
+__all__ = ["BatchUpdateOrderStatusUseCase"]
@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import List
+from uuid import UUID
+
+from src.core.domain.value_objects import OrderStatus
+
+
+@dataclass
+class OrderStatusRejection:
+    """An order left untouched by a batch status update, and why."""
+
+    uuid: UUID
+    reason: str
+
+
+@dataclass
+class OrderStatusBatchResult:
+    """The outcome of a batch status update."""
+
+    status: OrderStatus
+    updated: List[UUID] = field(default_factory=list)
+    rejected: List[OrderStatusRejection] = field(default_factory=list)
+
+
+__all__ = ["OrderStatusBatchResult", "OrderStatusRejection"]
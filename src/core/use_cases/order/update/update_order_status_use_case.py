@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from src.core.domain.exceptions import OrderNotFoundError
+from src.core.domain.exceptions import InvalidStatusTransitionError, OrderNotFoundError
 from src.core.domain.repositories.order_repository import OrderRepository
 from src.core.domain.value_objects.order_status import OrderStatus
 
@@ -21,20 +21,31 @@ class UpdateOrderStatusUseCase:
     def update_status(self, order_uuid: UUID, status: OrderStatus) -> OrderResult:
         """Updates the status of an existing order.
 
+        The transition is checked by the repository while updating, against the statuses the
+        order may be moved from, so concurrent updates of the same order can never apply a
+        transition from a status the order already left. The current status is only read
+        when the update is rejected, to report why.
+
         Args:
             order_uuid: The uuid of the order to be updated.
             status: The new status for the order.
 
         Returns:
             Order: The updated order.
+
+        Raises:
+            OrderNotFoundError: If the order does not exist.
+            InvalidStatusTransitionError: If the current status of the order does not allow the
+             transition.
         """
-        order = self.repository.get_by_uuid(order_uuid)
+        order = self.repository.update_status(order_uuid, status, status.allowed_sources())
 
-        if not order:
-            raise OrderNotFoundError(order_uuid)
+        if order is None:
+            current = self.repository.get_statuses([order_uuid]).get(order_uuid)
+            if current is None:
+                raise OrderNotFoundError(order_uuid)
+            raise InvalidStatusTransitionError(current, status)
 
-        order.status = status
-        order = self.repository.update_status(order_uuid, status)
         return OrderResult(
             uuid=order.uuid,
             status=order.status,
@@ -1,50 +1,53 @@
 from uuid import UUID
 
-from src.core.domain.entities.payment import Payment, PaymentStatus
-from src.core.domain.exceptions import PaymentNotFoundError
+from src.core.domain.entities.payment import PaymentStatus
+from src.core.domain.exceptions import InvalidStatusTransitionError, PaymentNotFoundError
 from src.core.domain.repositories import PaymentRepository
 from src.core.domain.value_objects import OrderStatus
 
-from .update_order_status_use_case import UpdateOrderStatusUseCase
-
 
 class PaymentConfirmationUseCase:
     """Use-case for confirming payment status and updating order status accordingly."""
 
-    def __init__(
-        self,
-        payment_repo: PaymentRepository,
-        update_order_status_use_case: UpdateOrderStatusUseCase,
-    ) -> None:
+    def __init__(self, payment_repo: PaymentRepository) -> None:
         self._payment_repo = payment_repo
-        self._update_order_status_use_case = update_order_status_use_case
 
-    def execute(self, payment_uuid: UUID, payment_status: PaymentStatus) -> Payment:
+    def execute(self, payment_uuid: UUID, payment_status: PaymentStatus) -> None:
         """Executes the payment confirmation process.
 
+        The payment status and, for an approved payment, the order status are updated together
+        by the repository, which checks the allowed transitions while updating. Neither the
+        payment nor its order is loaded: the current statuses are only read when the update is
+        rejected, to report why.
+
         Args:
             payment_uuid: UUID of the payment to confirm.
             payment_status: New status of the payment.
 
-        Returns:
-            Updated payment entity.
-
         Raises:
              PaymentNotFoundError: If the payment does not exist.
+             InvalidStatusTransitionError: If the current status of the payment, or of its order
+              for an approved payment, does not allow the transition.
         """
-        payment = self._payment_repo.get_by_uuid(payment_uuid)
-        if not payment:
+        order_status = OrderStatus.RECEIVED if payment_status == PaymentStatus.APPROVED else None
+
+        if self._payment_repo.confirm(
+            payment_uuid,
+            payment_status,
+            payment_status.allowed_sources(),
+            order_status,
+            order_status.allowed_sources() if order_status else (),
+        ):
+            return
+
+        statuses = self._payment_repo.get_statuses(payment_uuid)
+        if statuses is None:
             raise PaymentNotFoundError(search_params={"uuid": payment_uuid})
 
-        payment.update_status(payment_status)
-        self._payment_repo.update_status(payment.id, payment_status)
-
-        if payment_status == PaymentStatus.APPROVED:
-            self._update_order_status_use_case.update_status(
-                payment.order.uuid, OrderStatus.RECEIVED
-            )
-
-        return self._payment_repo.get_by_uuid(payment_uuid)
+        current_payment_status, current_order_status = statuses
+        if current_payment_status not in payment_status.allowed_sources():
+            raise InvalidStatusTransitionError(current_payment_status, payment_status)
+        raise InvalidStatusTransitionError(current_order_status, order_status)
 
 
 __all__ = ["PaymentConfirmationUseCase"]
@@ -1,4 +1,8 @@
-from .find import GetPaymentStatusUseCase
+from .find import AsyncGetPaymentStatusUseCase, GetPaymentStatusUseCase
 from .process import PaymentProcessingUseCase
 
-__all__ = ["GetPaymentStatusUseCase", "PaymentProcessingUseCase"]
+__all__ = [
+    "AsyncGetPaymentStatusUseCase",
+    "GetPaymentStatusUseCase",
+    "PaymentProcessingUseCase",
+]
@@ -1,3 +1,4 @@
+from .async_get_payment_status_use_case import AsyncGetPaymentStatusUseCase
 from .get_payment_status_use_case import GetPaymentStatusUseCase
 
-__all__ = ["GetPaymentStatusUseCase"]
+__all__ = ["AsyncGetPaymentStatusUseCase", "GetPaymentStatusUseCase"]
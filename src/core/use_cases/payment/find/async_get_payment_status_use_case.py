@@ -0,0 +1,35 @@
+from uuid import UUID
+
+from src.core.domain.exceptions import PaymentNotFoundError
+from src.core.domain.repositories import AsyncPaymentRepository
+
+from ..shared_dtos import PaymentResult
+
+
+class AsyncGetPaymentStatusUseCase:
+    """Asyncio counterpart of `GetPaymentStatusUseCase`."""
+
+    def __init__(self, payment_repository: AsyncPaymentRepository) -> None:
+        self.payment_repository = payment_repository
+
+    async def execute(self, order_uuid: UUID) -> PaymentResult:
+        """Get a payment status by their Order UUID.
+
+        Args:
+            order_uuid: The order uuid.
+
+        Returns:
+            PaymentStatus: The payment status if found.
+
+        Raises:
+            PaymentNotFoundError: If the payment is not found.
+        """
+        payment = await self.payment_repository.get_status_view(order_uuid)
+
+        if not payment:
+            raise PaymentNotFoundError(search_params={"order_uuid": order_uuid})
+
+        return PaymentResult(payment.uuid, payment.status)
+
+
+__all__ = ["AsyncGetPaymentStatusUseCase"]
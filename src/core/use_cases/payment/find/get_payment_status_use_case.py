@@ -24,7 +24,7 @@ class GetPaymentStatusUseCase:
         Raises:
             PaymentStatusNotFoundError: If the customer is not found.
         """
-        payment = self.payment_repository.get_payment_details(order_uuid)
+        payment = self.payment_repository.get_status_view(order_uuid)
 
         if not payment:
             raise PaymentNotFoundError(search_params={"order_uuid": order_uuid})
@@ -4,7 +4,7 @@ from uuid import UUID
 from src.core.domain.entities.payment import PaymentStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentResult:
     """Data structure for holding data of a Payment status.
 
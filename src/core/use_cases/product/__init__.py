@@ -1,14 +1,27 @@
+from .bulk import (
+    CategoryPriceChangeUseCase,
+    ProductImportError,
+    ProductImportResult,
+    ProductImportRow,
+    ProductImportUseCase,
+)
 from .create import ProductCreation, ProductCreationUseCase
 from .delete import ProductDeleteUseCase
-from .list import GetProductsByCategoryUseCase
+from .list import AsyncGetProductsByCategoryUseCase, GetProductsByCategoryUseCase
 from .shared_dtos import ProductResult
 from .update import ProductUpdate, ProductUpdateUseCase
 
 __all__ = [
+    "AsyncGetProductsByCategoryUseCase",
+    "CategoryPriceChangeUseCase",
     "GetProductsByCategoryUseCase",
     "ProductCreation",
     "ProductCreationUseCase",
     "ProductDeleteUseCase",
+    "ProductImportError",
+    "ProductImportResult",
+    "ProductImportRow",
+    "ProductImportUseCase",
     "ProductResult",
     "ProductUpdate",
     "ProductUpdateUseCase",
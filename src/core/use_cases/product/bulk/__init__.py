@@ -0,0 +1,11 @@
+from .category_price_change_use_case import CategoryPriceChangeUseCase
+from .product_import_dto import ProductImportError, ProductImportResult, ProductImportRow
+from .product_import_use_case import ProductImportUseCase
+
+__all__ = [
+    "CategoryPriceChangeUseCase",
+    "ProductImportError",
+    "ProductImportResult",
+    "ProductImportRow",
+    "ProductImportUseCase",
+]
@@ -0,0 +1,57 @@
+from typing import List
+
+from src.core.domain.exceptions import InvalidPriceChangeError
+from src.core.domain.repositories import ProductRepository
+from src.core.domain.value_objects import Category
+
+from ..shared_dtos import ProductResult
+
+
+class CategoryPriceChangeUseCase:
+    """A use case for changing the prices of every product in a category at once."""
+
+    def __init__(self, repository: ProductRepository) -> None:
+        """Initializes the use case with a specific product repository.
+
+        Parameters:
+            repository: An instance of ProductRepository used for product data interactions.
+        """
+        self.repository = repository
+
+    def execute(self, category: Category, percentage: float) -> List[ProductResult]:
+        """Raises or lowers the prices of the products of a category by a percentage.
+
+        Parameters:
+            category: The category whose products are repriced.
+            percentage: The change applied to each price, e.g. 10 for a 10% increase or -5 for a
+             5% discount.
+
+        Returns:
+            List[ProductResult]: The repriced products.
+
+        Raises:
+            InvalidPriceChangeError: If the change would make any price of the category zero or
+             negative once rounded to cents, in which case no price changes.
+        """
+        factor = 1 + percentage / 100
+        if factor <= 0:
+            raise InvalidPriceChangeError(factor)
+
+        products = self.repository.change_prices_by_category(category, factor)
+
+        return [
+            ProductResult(
+                name=product.name,
+                category=product.category,
+                price=product.price,
+                description=product.description,
+                images=list(product.images),
+                created_at=product.created_at,
+                updated_at=product.updated_at,
+                uuid=product.uuid,
+            )
+            for product in products
+        ]
+
+
+__all__ = ["CategoryPriceChangeUseCase"]
@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from ..create import ProductCreation
+from ..shared_dtos import ProductResult
+
+
+@dataclass
+class ProductImportRow:
+    """A product to import, along with its position in the imported file."""
+
+    row: int
+    product: ProductCreation
+
+
+@dataclass
+class ProductImportError:
+    """Why a row of an import was rejected."""
+
+    row: int
+    message: str
+
+
+@dataclass
+class ProductImportResult:
+    """The outcome of an import: the stored products and the rejected rows."""
+
+    products: List[ProductResult] = field(default_factory=list)
+    errors: List[ProductImportError] = field(default_factory=list)
+
+
+__all__ = ["ProductImportError", "ProductImportResult", "ProductImportRow"]
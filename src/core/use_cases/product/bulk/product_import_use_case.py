@@ -0,0 +1,83 @@
+from typing import Dict, List, Sequence
+
+from src.core.domain.base import DomainError
+from src.core.domain.entities.product import Product
+from src.core.domain.repositories import ProductRepository
+
+from ..shared_dtos import ProductResult
+from .product_import_dto import ProductImportError, ProductImportResult, ProductImportRow
+
+
+class ProductImportUseCase:
+    """A use case for creating or updating many products at once, e.g. to load a new menu."""
+
+    def __init__(self, repository: ProductRepository) -> None:
+        """Initializes the use case with a specific product repository.
+
+        Parameters:
+            repository: An instance of ProductRepository used for product data interactions.
+        """
+        self.repository = repository
+
+    def execute(self, rows: Sequence[ProductImportRow]) -> ProductImportResult:
+        """Creates the products of the given rows, or updates the ones with the same name.
+
+        Each row is validated like a single product creation. Invalid rows, and rows repeating
+        the name of a previous one (ignoring case), are reported instead of stored; the valid
+        ones are all stored in a single transaction.
+
+        Parameters:
+            rows: The products to import.
+
+        Returns:
+            ProductImportResult: The stored products, in the order of `rows`, and the errors of
+             the rejected rows.
+        """
+        products: List[Product] = []
+        errors: List[ProductImportError] = []
+        first_row_by_name: Dict[str, int] = {}
+
+        for row in rows:
+            data = row.product
+            try:
+                product = Product(
+                    name=data.name,
+                    category=data.category,
+                    price=data.price,
+                    description=data.description or "No description",
+                    images=data.images or ["https://via.placeholder.com/150"],
+                )
+            except DomainError as e:
+                errors.append(ProductImportError(row=row.row, message=e.message))
+                continue
+
+            first_row = first_row_by_name.setdefault(product.name.lower(), row.row)
+            if first_row != row.row:
+                errors.append(
+                    ProductImportError(
+                        row=row.row, message=f"Product name already used by row {first_row}"
+                    )
+                )
+                continue
+
+            products.append(product)
+
+        return ProductImportResult(
+            products=[
+                ProductResult(
+                    name=product.name,
+                    category=product.category,
+                    price=product.price,
+                    description=product.description,
+                    images=list(product.images),
+                    created_at=product.created_at,
+                    updated_at=product.updated_at,
+                    uuid=product.uuid,
+                )
+                for product in self.repository.upsert_by_name(products)
+            ],
+            errors=errors,
+        )
+
+
+__all__ = ["ProductImportUseCase"]
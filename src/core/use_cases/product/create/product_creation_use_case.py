@@ -47,7 +47,7 @@ class ProductCreationUseCase:
             category=product.category,
             price=product.price,
             description=product.description,
-            images=product.images,
+            images=list(product.images),
             created_at=product.created_at,
             updated_at=product.updated_at,
             uuid=product.uuid,
@@ -1,3 +1,4 @@
+from .async_get_products_by_category_use_case import AsyncGetProductsByCategoryUseCase
 from .get_products_by_category_use_case import GetProductsByCategoryUseCase
 
-__all__ = ["GetProductsByCategoryUseCase"]
+__all__ = ["AsyncGetProductsByCategoryUseCase", "GetProductsByCategoryUseCase"]
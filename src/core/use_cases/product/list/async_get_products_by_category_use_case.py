@@ -0,0 +1,46 @@
+from typing import List
+
+from src.core.domain.repositories import AsyncProductRepository
+from src.core.domain.value_objects import Category
+
+from ..shared_dtos import ProductResult
+
+
+class AsyncGetProductsByCategoryUseCase:
+    """Asyncio counterpart of `GetProductsByCategoryUseCase`."""
+
+    def __init__(self, product_repository: AsyncProductRepository) -> None:
+        """Initializes the use case with a product repository.
+
+        Args:
+            product_repository (AsyncProductRepository): The repository for accessing product data.
+        """
+        self._product_repository = product_repository
+
+    async def execute(self, category: Category) -> List[ProductResult]:
+        """Executes the use case to get products by category.
+
+        Args:
+            category (Category): The category to filter products by.
+
+        Returns:
+            A list of `ProductResult` instances representing the products.
+        """
+        products = await self._product_repository.get_by_category(category)
+
+        return [
+            ProductResult(
+                uuid=product.uuid,
+                name=product.name,
+                category=product.category,
+                price=product.price,
+                description=product.description,
+                images=list(product.images),
+                created_at=product.created_at,
+                updated_at=product.updated_at,
+            )
+            for product in products
+        ]
+
+
+__all__ = ["AsyncGetProductsByCategoryUseCase"]
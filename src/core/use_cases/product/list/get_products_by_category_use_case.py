@@ -35,7 +35,7 @@ class GetProductsByCategoryUseCase:
                 category=product.category,
                 price=product.price,
                 description=product.description,
-                images=product.images,
+                images=list(product.images),
                 created_at=product.created_at,
                 updated_at=product.updated_at,
             )
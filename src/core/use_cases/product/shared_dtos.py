@@ -5,7 +5,7 @@ from uuid import UUID
 from src.core.domain.value_objects import Category
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductResult:
     """Data structure for holding product data."""
 
@@ -58,7 +58,7 @@ class ProductUpdateUseCase:
             category=db_product.category,
             price=db_product.price,
             description=db_product.description,
-            images=db_product.images,
+            images=list(db_product.images),
             created_at=db_product.created_at,
             updated_at=db_product.updated_at,
         )
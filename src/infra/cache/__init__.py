@@ -0,0 +1,13 @@
+"""In-process caches placed in front of the repositories."""
+
+from .caches import configure_caches, customer_cache, get_cache_stats, product_cache
+from .ttl_cache import CacheStats, TTLCache
+
+__all__ = [
+    "CacheStats",
+    "TTLCache",
+    "configure_caches",
+    "customer_cache",
+    "get_cache_stats",
+    "product_cache",
+]
@@ -0,0 +1,40 @@
+from typing import Hashable, Mapping
+
+from src.config import Settings, settings
+
+from .ttl_cache import CacheStats, TTLCache
+
+customer_cache: TTLCache[Hashable, object] = TTLCache(
+    max_size=settings.CUSTOMER_CACHE_SIZE,
+    ttl=settings.CUSTOMER_CACHE_TTL,
+    negative_ttl=settings.CUSTOMER_CACHE_NEGATIVE_TTL,
+)
+"""The customer lookups of this process, shared by the synchronous and asyncio repositories."""
+
+product_cache: TTLCache[str, object] = TTLCache(
+    max_size=1 if settings.PRODUCT_CACHE_TTL > 0 else 0, ttl=settings.PRODUCT_CACHE_TTL
+)
+"""The product catalog of this process, a single entry shared by every product repository."""
+
+
+def configure_caches(app_settings: Settings) -> None:
+    """Sizes the caches of this process after the given settings, instead of the environment's.
+
+    The caches are shared by every application of the process, so the last one to start wins.
+    """
+    customer_cache.configure(
+        max_size=app_settings.CUSTOMER_CACHE_SIZE,
+        ttl=app_settings.CUSTOMER_CACHE_TTL,
+        negative_ttl=app_settings.CUSTOMER_CACHE_NEGATIVE_TTL,
+    )
+    product_cache.configure(
+        max_size=1 if app_settings.PRODUCT_CACHE_TTL > 0 else 0, ttl=app_settings.PRODUCT_CACHE_TTL
+    )
+
+
+def get_cache_stats() -> Mapping[str, CacheStats]:
+    """Returns the counters of every cache of this process, keyed by cache name."""
+    return {"customer": customer_cache.stats(), "product": product_cache.stats()}
+
+
+__all__ = ["configure_caches", "customer_cache", "get_cache_stats", "product_cache"]
@@ -0,0 +1,236 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """The counters of a cache at a given moment.
+
+    Attributes:
+        size: The number of entries currently held, expired ones included until looked up.
+        max_size: The number of entries the cache holds before evicting the least recently used.
+        hits: The total number of lookups answered by the cache, negative entries included.
+        misses: The total number of lookups that found no live entry.
+        evictions: The total number of entries dropped to make room for new ones.
+        expirations: The total number of entries found expired on lookup.
+        coalesced: The total number of misses that waited for the load of another caller
+         instead of loading the value themselves.
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    coalesced: int = 0
+
+
+class TTLCache(Generic[K, V]):
+    """A thread-safe, size-bounded in-process cache whose entries expire after a while.
+
+    When full, the least recently used entry is evicted. A key may also be cached as absent (a
+    negative entry, stored as None), usually with a shorter time to live, so repeated lookups of
+    something that does not exist do not reach the database either.
+
+    `get_or_load` coalesces concurrent misses of a key into a single load. A value loaded while
+    the cache was invalidated is handed to its callers but not stored, so a load that raced with
+    a write never brings back what the write replaced.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        negative_ttl: float | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            max_size: The maximum number of entries, 0 disables the cache.
+            ttl: The number of seconds an entry lives.
+            negative_ttl: The number of seconds a negative entry lives, defaults to `ttl`.
+            clock: The source of the current time, in seconds.
+        """
+        self._entries: OrderedDict[K, Tuple[float, V | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self._clock = clock
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._coalesced = 0
+        self._generation = 0
+        self._flights: Dict[K, Future] = {}
+        self._async_flights: Dict[K, asyncio.Future] = {}
+
+    def get(self, key: K) -> Tuple[bool, V | None]:
+        """Looks a key up.
+
+        Returns:
+            Whether a live entry was found, and its value: None for a negative entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+
+                del self._entries[key]
+                self._expirations += 1
+
+            self._misses += 1
+            return False, None
+
+    def put(self, key: K, value: V | None) -> None:
+        """Stores the value of a key, None to record that the key does not exist."""
+        if not self._max_size:
+            return
+
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key: K, value: V | None) -> None:
+        ttl = self._ttl if value is not None else self._negative_ttl
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _store_if_current(self, key: K, value: V | None, generation: int) -> None:
+        with self._lock:
+            if self._max_size and generation == self._generation:
+                self._store(key, value)
+
+    def get_or_load(self, key: K, load: Callable[[], V | None]) -> V | None:
+        """Looks a key up, loading and storing its value on a miss.
+
+        Concurrent misses of the same key, from other threads, wait for the first one to load the
+        value instead of loading it again. If the load fails, they all get its error.
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+            else:
+                self._coalesced += 1
+            generation = self._generation
+
+        if not leader:
+            return flight.result()
+
+        try:
+            value = load()
+        except BaseException as error:
+            flight.set_exception(error)
+            raise
+        else:
+            self._store_if_current(key, value, generation)
+            flight.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+
+    async def get_or_load_async(self, key: K, load: Callable[[], Awaitable[V | None]]) -> V | None:
+        """Asyncio counterpart of `get_or_load`, coalescing the misses of concurrent tasks.
+
+        Tasks of the same event loop are coalesced with each other, but not with threads.
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+
+        flight = self._async_flights.get(key)
+        if flight is not None:
+            with self._lock:
+                self._coalesced += 1
+            return await asyncio.shield(flight)
+
+        flight = self._async_flights[key] = asyncio.get_running_loop().create_future()
+        generation = self._generation
+        try:
+            value = await load()
+        except BaseException as error:
+            flight.set_exception(error)
+            # Marks the error as retrieved when no other task waits for it.
+            flight.exception()
+            raise
+        else:
+            self._store_if_current(key, value, generation)
+            flight.set_result(value)
+            return value
+        finally:
+            del self._async_flights[key]
+
+    def invalidate(self, *keys: K) -> None:
+        """Drops the entries of the given keys, if cached, and discards the loads in flight."""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops every entry, keeping the counters, and discards the loads in flight."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def configure(self, max_size: int, ttl: float, negative_ttl: float | None = None) -> None:
+        """Changes the size and the times to live of the cache.
+
+        Entries stored under the previous configuration are dropped, as by `clear`; nothing
+        happens if the configuration is unchanged.
+
+        Args:
+            max_size: The maximum number of entries, 0 disables the cache.
+            ttl: The number of seconds an entry lives.
+            negative_ttl: The number of seconds a negative entry lives, defaults to `ttl`.
+        """
+        negative_ttl = ttl if negative_ttl is None else negative_ttl
+        with self._lock:
+            if (max_size, ttl, negative_ttl) == (self._max_size, self._ttl, self._negative_ttl):
+                return
+
+            self._max_size = max_size
+            self._ttl = ttl
+            self._negative_ttl = negative_ttl
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns the current counters of the cache."""
+        with self._lock:
+            return CacheStats(
+                size=len(self._entries),
+                max_size=self._max_size,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                coalesced=self._coalesced,
+            )
+
+
+__all__ = ["CacheStats", "TTLCache"]
@@ -1,3 +1,45 @@
-from .database import get_db_session
+from .async_database import (
+    dispose_async_engine,
+    get_async_engine,
+    get_async_reader_engine,
+    get_async_sessionmaker,
+    init_async_engines,
+)
+from .database import (
+    EngineSettingsConflictError,
+    SessionLocal,
+    dispose_engines,
+    get_db_session,
+    get_engine,
+    get_pool_metrics,
+    get_reader_engine,
+    init_engines,
+    leak_detector,
+)
+from .leak_detector import CheckedOutConnection, ConnectionLeakDetector
+from .pool_metrics import InstrumentedQueuePool, PoolMetrics, PoolMetricsSnapshot
+from .routing_session import RoutingSession, replica_read
 
-__all__ = ["get_db_session"]
+__all__ = [
+    "CheckedOutConnection",
+    "ConnectionLeakDetector",
+    "EngineSettingsConflictError",
+    "InstrumentedQueuePool",
+    "PoolMetrics",
+    "PoolMetricsSnapshot",
+    "RoutingSession",
+    "SessionLocal",
+    "dispose_async_engine",
+    "dispose_engines",
+    "get_async_engine",
+    "get_async_reader_engine",
+    "get_async_sessionmaker",
+    "get_db_session",
+    "get_engine",
+    "get_pool_metrics",
+    "get_reader_engine",
+    "init_async_engines",
+    "init_engines",
+    "leak_detector",
+    "replica_read",
+]
@@ -0,0 +1,124 @@
+import threading
+from functools import cache
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.config import Settings, settings
+
+from .database import EngineSettingsConflictError, _EngineOptions
+from .routing_session import RoutingSession
+
+_options: _EngineOptions | None = None
+_options_lock = threading.Lock()
+
+
+def init_async_engines(app_settings: Settings = settings) -> None:
+    """Sets the settings the asyncio engines are created with, once per process.
+
+    The engines themselves are only created once the asyncio stack is used, so the async driver
+    is not required to serve the synchronous endpoints. The application calls this function
+    from its lifespan, as it does `init_engines`; anything else that asks for an engine uses the
+    environment settings. The engines are shared by the whole process, so later calls only check
+    that their database settings agree with the first ones.
+
+    Args:
+        app_settings: The settings of the database and its pool.
+
+    Raises:
+        EngineSettingsConflictError: If the settings were set before with other database values.
+    """
+    global _options
+    options = _EngineOptions.of(app_settings, app_settings.DB_ASYNC_DRIVER)
+    with _options_lock:
+        if _options is not None and _options != options:
+            raise EngineSettingsConflictError
+        _options = options
+
+
+def _engine_options() -> _EngineOptions:
+    if _options is None:
+        init_async_engines()
+    return _options  # type: ignore[return-value]
+
+
+def _connect_init_sql(statements: str) -> Callable[..., None]:
+    """Returns a `connect` listener that runs the given statements on every new connection."""
+
+    def run(dbapi_connection: DBAPIConnection, *_: object) -> None:
+        dbapi_connection.run_async(lambda conn: conn.execute(statements))
+
+    return run
+
+
+def _create_async_engine(url: str, options: _EngineOptions) -> AsyncEngine:
+    """Creates an asyncio engine that follows the same pool options as the synchronous one."""
+    engine = create_async_engine(
+        url,
+        pool_size=options.pool_size,
+        max_overflow=options.max_overflow,
+        pool_timeout=options.pool_timeout,
+        pool_recycle=options.pool_recycle,
+        pool_pre_ping=options.pool_pre_ping,
+    )
+    if options.connect_init_sql:
+        event.listen(engine.sync_engine, "connect", _connect_init_sql(options.connect_init_sql))
+    return engine
+
+
+@cache
+def get_async_engine() -> AsyncEngine:
+    """Returns the asyncio engine of the primary database, creating it on first use."""
+    options = _engine_options()
+    return _create_async_engine(options.primary_url, options)
+
+
+@cache
+def get_async_reader_engine() -> AsyncEngine | None:
+    """Returns the asyncio engine of the read replica, None if no replica is configured."""
+    options = _engine_options()
+    if options.reader_url is None:
+        return None
+
+    return _create_async_engine(options.reader_url, options)
+
+
+@cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Returns the factory of asyncio sessions bound to the asyncio engine.
+
+    Attributes are not expired on commit: with asyncio they could only be reloaded by an
+    explicit `await session.refresh(...)`, never lazily.
+    """
+    reader = get_async_reader_engine()
+    return async_sessionmaker(
+        get_async_engine(),
+        sync_session_class=RoutingSession,
+        reader=reader.sync_engine if reader else None,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def dispose_async_engine() -> None:
+    """Closes the connections of the asyncio engines, if they were ever created."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_async_reader_engine.cache_info().currsize and (reader := get_async_reader_engine()):
+        await reader.dispose()
+
+
+__all__ = [
+    "dispose_async_engine",
+    "get_async_engine",
+    "get_async_reader_engine",
+    "get_async_sessionmaker",
+    "init_async_engines",
+]
@@ -1,18 +1,201 @@
-from typing import Generator
+import threading
+from typing import Any, Callable, Generator, NamedTuple
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.config import settings
+from src.config import Settings, settings
+from src.config.env_settings import Environment
 
-DATABASE_URL = (
-    f"{settings.DB_DRIVER}://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:"
-    f"{settings.DB_PORT}/{settings.DB_NAME}"
-)
+from .leak_detector import ConnectionLeakDetector
+from .pool_metrics import InstrumentedQueuePool, PoolMetricsSnapshot
+from .routing_session import RoutingSession
 
-engine = create_engine(DATABASE_URL)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _database_url(app_settings: Settings, driver: str, host: str, port: int) -> str:
+    return (
+        f"{driver}://{app_settings.DB_USER}:{app_settings.DB_PASSWORD}@"
+        f"{host}:{port}/{app_settings.DB_NAME}"
+    )
+
+
+def _connect_init_sql(statements: str) -> Callable[..., None]:
+    """Returns a `connect` listener that runs the given statements on every new connection.
+
+    The statements run in autocommit mode so session settings such as `SET statement_timeout`
+    are not discarded by the rollback issued when the connection is returned to the pool.
+    """
+
+    def run(dbapi_connection: DBAPIConnection, *_: object) -> None:
+        autocommit = dbapi_connection.autocommit
+        dbapi_connection.autocommit = True
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(statements)
+        finally:
+            cursor.close()
+            dbapi_connection.autocommit = autocommit
+
+    return run
+
+
+class EngineSettingsConflictError(RuntimeError):
+    """Raised when the engines are initialized again with different database settings."""
+
+    def __init__(self) -> None:
+        super().__init__("The engines of this process were created with other database settings.")
+
+
+class _EngineOptions(NamedTuple):
+    """The settings that shape the engines, which must agree across calls to `init_engines`."""
+
+    primary_url: str
+    reader_url: str | None
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+    connect_init_sql: str
+
+    @classmethod
+    def of(cls, app_settings: Settings, driver: str | None = None) -> "_EngineOptions":
+        """Extracts the engine options from the application settings.
+
+        Args:
+            app_settings: The settings of the database and its pool.
+            driver: The driver of the URLs, `DB_DRIVER` if None.
+        """
+        driver = driver or app_settings.DB_DRIVER
+        reader_port = app_settings.DB_READER_PORT or app_settings.DB_PORT
+        return cls(
+            primary_url=_database_url(
+                app_settings, driver, app_settings.DB_HOST, app_settings.DB_PORT
+            ),
+            reader_url=_database_url(app_settings, driver, app_settings.DB_READER_HOST, reader_port)
+            if app_settings.DB_READER_HOST
+            else None,
+            pool_size=app_settings.DB_POOL_SIZE or app_settings.WORKER_THREADS,
+            max_overflow=app_settings.DB_MAX_OVERFLOW,
+            pool_timeout=app_settings.DB_POOL_TIMEOUT,
+            pool_recycle=app_settings.DB_POOL_RECYCLE,
+            pool_pre_ping=app_settings.DB_POOL_PRE_PING,
+            connect_init_sql=app_settings.DB_CONNECT_INIT_SQL,
+        )
+
+
+class _Engines(NamedTuple):
+    """The engines of the process and the options they were created with."""
+
+    primary: Engine
+    reader: Engine | None
+    options: _EngineOptions
+
+
+def _create_engine(url: str, options: _EngineOptions) -> Engine:
+    """Creates an engine whose pool follows the given options."""
+    created = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=options.pool_size,
+        max_overflow=options.max_overflow,
+        pool_timeout=options.pool_timeout,
+        pool_recycle=options.pool_recycle,
+        pool_pre_ping=options.pool_pre_ping,
+    )
+    if options.connect_init_sql:
+        event.listen(created, "connect", _connect_init_sql(options.connect_init_sql))
+    return created
+
+
+class _SessionFactory(sessionmaker[RoutingSession]):
+    """A sessionmaker that creates the engines, if they were not yet, before its first session."""
+
+    def __call__(self, **local_kw: Any) -> RoutingSession:  # noqa: ANN401
+        if "bind" not in self.kw:
+            init_engines()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _SessionFactory(class_=RoutingSession, autocommit=False, autoflush=False)
+"""The factory of the sessions, bound to the engines by `init_engines`."""
+
+leak_detector = ConnectionLeakDetector()
+"""The detector of the connections leaked from the pool of the primary database."""
+
+_engines: _Engines | None = None
+_engines_lock = threading.Lock()
+
+
+def init_engines(app_settings: Settings = settings) -> None:
+    """Creates the engines of the primary database and of the read replica, once per process.
+
+    Importing this module creates no engine: the application calls this function from its
+    lifespan, so the pools exist before the first request is served, and anything else that
+    opens a session or asks for an engine creates them on first use from the environment
+    settings. The engines are shared by the whole process, so later calls only check that their
+    database settings agree with those the engines were created with.
+
+    Args:
+        app_settings: The settings of the database, its pool and the leak detector.
+
+    Raises:
+        EngineSettingsConflictError: If the engines exist with other database settings.
+    """
+    global _engines
+    options = _EngineOptions.of(app_settings)
+    with _engines_lock:
+        if _engines is not None:
+            if _engines.options != options:
+                raise EngineSettingsConflictError
+            return
+
+        primary = _create_engine(options.primary_url, options)
+        reader = _create_engine(options.reader_url, options) if options.reader_url else None
+        SessionLocal.configure(bind=primary, reader=reader)
+        leak_detector.capture_stack = app_settings.ENVIRONMENT != Environment.PRODUCTION
+        leak_detector.watch(primary)
+        _engines = _Engines(primary, reader, options)
+
+
+def dispose_engines() -> None:
+    """Closes the pooled connections of the engines, if they were ever created.
+
+    The engines stay usable: they open new connections on demand.
+    """
+    if _engines is not None:
+        _engines.primary.dispose()
+        if _engines.reader is not None:
+            _engines.reader.dispose()
+
+
+def get_engine() -> Engine:
+    """Returns the engine of the primary database, which runs every write."""
+    if _engines is None:
+        init_engines()
+    return _engines.primary  # type: ignore[union-attr]
+
+
+def get_reader_engine() -> Engine | None:
+    """Returns the engine of the read replica, None if no replica is configured."""
+    if _engines is None:
+        init_engines()
+    return _engines.reader  # type: ignore[union-attr]
+
+
+def __getattr__(name: str) -> Engine | None:
+    # `engine` and `reader_engine` used to be created on import, they are now created on access.
+    if name == "engine":
+        return get_engine()
+    if name == "reader_engine":
+        return get_reader_engine()
+    raise AttributeError(name)
+
+
+def get_pool_metrics() -> PoolMetricsSnapshot:
+    """Returns the current metrics of the engine connection pool."""
+    return get_engine().pool.metrics_snapshot()
 
 
 def get_db_session() -> Generator[Session, None, None]:
@@ -24,4 +207,14 @@ def get_db_session() -> Generator[Session, None, None]:
         session.close()
 
 
-__all__ = ["get_db_session"]
+__all__ = [
+    "EngineSettingsConflictError",
+    "SessionLocal",
+    "dispose_engines",
+    "get_db_session",
+    "get_engine",
+    "get_pool_metrics",
+    "get_reader_engine",
+    "init_engines",
+    "leak_detector",
+]
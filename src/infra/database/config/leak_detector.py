@@ -0,0 +1,110 @@
+import logging
+import time
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CheckedOutConnection:
+    """A pooled connection checked out while an owner was being tracked.
+
+    Attributes:
+        owner: The unit of work (e.g. an HTTP request) that checked the connection out.
+        checked_out_at: The `time.monotonic()` value at checkout.
+        stack: Where the connection was checked out from, empty if stacks are not captured.
+    """
+
+    owner: object
+    checked_out_at: float
+    stack: str
+
+
+class ConnectionLeakDetector:
+    """Reports pooled connections that outlive the unit of work that checked them out.
+
+    Every connection checked out from the engine pool inside `track(owner)` is recorded until it
+    is checked back in. Once the owner is done, `report(owner)` logs a warning for each of its
+    connections that is still held, which means some session or connection was never closed.
+    """
+
+    def __init__(self, engine: Engine | None = None, capture_stack: bool = False) -> None:
+        """Initializes the detector and starts listening to the engine pool events.
+
+        Args:
+            engine: The engine whose pool is watched, None to `watch` one once it is created.
+            capture_stack: Whether to record the stack of each checkout, so the leak report
+             points to the code that opened the connection. It adds a small cost to every
+             checkout.
+        """
+        self.capture_stack = capture_stack
+        self._owner: ContextVar[object | None] = ContextVar(
+            f"leak_detector_owner_{id(self)}", default=None
+        )
+        self._checked_out: Dict[int, CheckedOutConnection] = {}
+
+        if engine is not None:
+            self.watch(engine)
+
+    def watch(self, engine: Engine) -> None:
+        """Starts listening to the pool events of the given engine."""
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_checkout(self, dbapi_connection: DBAPIConnection, *_: object) -> None:
+        owner = self._owner.get()
+        if owner is None:
+            return
+
+        stack = "".join(traceback.format_stack()) if self.capture_stack else ""
+        self._checked_out[id(dbapi_connection)] = CheckedOutConnection(
+            owner=owner, checked_out_at=time.monotonic(), stack=stack
+        )
+
+    def _on_checkin(self, dbapi_connection: DBAPIConnection | None, *_: object) -> None:
+        self._checked_out.pop(id(dbapi_connection), None)
+
+    @contextmanager
+    def track(self, owner: object) -> Iterator[None]:
+        """Attributes the connections checked out inside the block to the given owner."""
+        token = self._owner.set(owner)
+        try:
+            yield
+        finally:
+            self._owner.reset(token)
+
+    def held_by(self, owner: object) -> List[CheckedOutConnection]:
+        """Returns the connections checked out by the given owner that are still held."""
+        return [held for held in list(self._checked_out.values()) if held.owner is owner]
+
+    def report(self, owner: object) -> int:
+        """Logs a warning for each connection the given owner still holds.
+
+        Args:
+            owner: The owner, already finished, whose connections should have been returned.
+
+        Returns:
+            The number of leaked connections.
+        """
+        leaked = self.held_by(owner)
+        now = time.monotonic()
+
+        for held in leaked:
+            logger.warning(
+                "Connection checked out by %s is still held %.1f ms after it finished.%s",
+                owner,
+                (now - held.checked_out_at) * 1000,
+                f"\nChecked out at:\n{held.stack}" if held.stack else "",
+            )
+
+        return len(leaked)
+
+
+__all__ = ["CheckedOutConnection", "ConnectionLeakDetector"]
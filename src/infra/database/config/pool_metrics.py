@@ -0,0 +1,128 @@
+import bisect
+import threading
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Tuple
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import PoolProxiedConnection, QueuePool
+
+CHECKOUT_WAIT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+"""The upper bounds, in seconds, of the checkout wait time histogram buckets."""
+
+
+@dataclass(frozen=True)
+class PoolMetricsSnapshot:
+    """The state of a connection pool at a given moment.
+
+    Attributes:
+        size: The number of connections the pool keeps open.
+        max_overflow: The number of extra connections the pool may open under load.
+        checked_out: The number of connections in use.
+        checkouts: The total number of checkouts.
+        timeouts: The total number of checkouts that gave up waiting for a connection.
+        wait_seconds_sum: The total time spent waiting for connections.
+        wait_buckets: The cumulative number of checkouts that waited up to each bound of
+         `CHECKOUT_WAIT_BUCKETS`.
+    """
+
+    size: int
+    max_overflow: int
+    checked_out: int
+    checkouts: int
+    timeouts: int
+    wait_seconds_sum: float
+    wait_buckets: Tuple[int, ...]
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of connections the pool may hand out at once."""
+        return self.size + max(self.max_overflow, 0)
+
+    @property
+    def saturation(self) -> float:
+        """The fraction of the pool capacity in use, 1.0 means new checkouts have to wait."""
+        return self.checked_out / self.capacity if self.capacity else 0.0
+
+
+class PoolMetrics:
+    """Thread-safe counters of the checkouts of a connection pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_sum = 0.0
+        self._wait_buckets = [0] * len(CHECKOUT_WAIT_BUCKETS)
+
+    def record_checkout(self, wait_seconds: float, timed_out: bool = False) -> None:
+        """Records a checkout and how long it waited for a connection."""
+        bucket = bisect.bisect_left(CHECKOUT_WAIT_BUCKETS, wait_seconds)
+        with self._lock:
+            self._checkouts += 1
+            self._timeouts += timed_out
+            self._wait_seconds_sum += wait_seconds
+            if bucket < len(self._wait_buckets):
+                self._wait_buckets[bucket] += 1
+
+    def snapshot(self, size: int, max_overflow: int, checked_out: int) -> PoolMetricsSnapshot:
+        """Returns the current counters along with the given occupation of the pool."""
+        with self._lock:
+            buckets, running = [], 0
+            for count in self._wait_buckets:
+                running += count
+                buckets.append(running)
+
+            return PoolMetricsSnapshot(
+                size=size,
+                max_overflow=max_overflow,
+                checked_out=checked_out,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                wait_seconds_sum=self._wait_seconds_sum,
+                wait_buckets=tuple(buckets),
+            )
+
+
+class InstrumentedQueuePool(QueuePool):
+    """A `QueuePool` that records how long each checkout waits for a connection.
+
+    The metrics are kept by the pool and carried over when the engine recreates it (e.g. on
+    `Engine.dispose`), so they cover the whole life of the engine.
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        """Creates a new pool with the same configuration that shares these metrics."""
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self) -> PoolProxiedConnection:
+        """Checks out a connection, recording the time spent waiting for it."""
+        started_at = perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_checkout(perf_counter() - started_at, timed_out=True)
+            raise
+
+        self.metrics.record_checkout(perf_counter() - started_at)
+        return connection
+
+    def metrics_snapshot(self) -> PoolMetricsSnapshot:
+        """Returns the current metrics of the pool."""
+        return self.metrics.snapshot(
+            size=self.size(), max_overflow=self._max_overflow, checked_out=self.checkedout()
+        )
+
+
+__all__ = [
+    "CHECKOUT_WAIT_BUCKETS",
+    "InstrumentedQueuePool",
+    "PoolMetrics",
+    "PoolMetricsSnapshot",
+]
@@ -0,0 +1,127 @@
+import functools
+import inspect
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+from sqlalchemy import ClauseElement, Connection, Engine, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class RoutingSession(Session):
+    """A session that sends the queries of read-only repository methods to a read replica.
+
+    Everything runs against the primary (the session bind) unless all of these hold:
+
+    - A reader engine is configured.
+    - The query is a plain `SELECT`, one that neither locks rows nor carries a data-modifying
+      CTE, issued inside `replica_reads()`, usually through a repository method decorated with
+      `replica_read`.
+    - The session is not pinned to the primary.
+
+    A session is pinned to the primary when it is created for a write unit, or as soon as it
+    writes anything. The session is scoped to the HTTP request, so once a request writes, every
+    later read of that request sees its own writes instead of a lagging replica.
+    The following requests of the same client are created pinned too, for the read-your-writes
+    window of `settings.DB_READ_YOUR_WRITES_WINDOW` seconds.
+    """
+
+    def __init__(
+        self, *args: object, reader: Engine | None = None, primary: bool = False, **kwargs: object
+    ) -> None:
+        """Initializes the session.
+
+        Args:
+            *args: Positional arguments of `Session`.
+            reader: The engine of the read replica, None to run everything on the primary.
+            primary: Whether the session is pinned to the primary from the start, e.g. because
+             it handles a write unit.
+            **kwargs: Keyword arguments of `Session`.
+        """
+        super().__init__(*args, **kwargs)
+        self._reader = reader
+        self._pinned_to_primary = primary
+        self._replica_reads = 0
+
+    @property
+    def pinned_to_primary(self) -> bool:
+        """Whether every query of this session runs on the primary."""
+        return self._reader is None or self._pinned_to_primary
+
+    def pin_to_primary(self) -> None:
+        """Sends every later query of this session to the primary."""
+        self._pinned_to_primary = True
+
+    @contextmanager
+    def replica_reads(self) -> Iterator[None]:
+        """Allows the `SELECT`s issued inside the block to run on the read replica."""
+        self._replica_reads += 1
+        try:
+            yield
+        finally:
+            self._replica_reads -= 1
+
+    def get_bind(
+        self, mapper: object = None, *, clause: ClauseElement | None = None, **kwargs: object
+    ) -> Engine | Connection:
+        """Returns the engine a statement runs on: the replica or the primary."""
+        is_plain_select = isinstance(clause, Select) and _is_plain_select(clause)
+
+        if self._flushing or (clause is not None and not is_plain_select):
+            self.pin_to_primary()
+        elif is_plain_select and self._replica_reads and not self.pinned_to_primary:
+            return self._reader
+
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def _is_plain_select(select: Select) -> bool:
+    """Whether a SELECT only reads: it does not lock rows, nor carries an `UPDATE` or `INSERT`.
+
+    Data-modifying CTEs must be attached with `Select.add_cte`, as only those are checked.
+    """
+    return select._for_update_arg is None and not any(  # noqa: SLF001
+        isinstance(cte.element, UpdateBase)
+        for cte in select._independent_ctes  # noqa: SLF001
+    )
+
+
+def _routing_session(session: Session | AsyncSession) -> RoutingSession | None:
+    if isinstance(session, AsyncSession):
+        session = session.sync_session
+    return session if isinstance(session, RoutingSession) else None
+
+
+def replica_read(method: F) -> F:
+    """Marks a repository method as read-only, so its queries may run on the read replica.
+
+    The repository must keep its session, synchronous or asyncio, in `self._session`. Sessions
+    that are not a `RoutingSession` are left untouched.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: object, *args: object, **kwargs: object) -> object:
+            session = _routing_session(self._session)  # noqa: SLF001
+            if session is None:
+                return await method(self, *args, **kwargs)
+            with session.replica_reads():
+                return await method(self, *args, **kwargs)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self: object, *args: object, **kwargs: object) -> object:
+        session = _routing_session(self._session)  # noqa: SLF001
+        if session is None:
+            return method(self, *args, **kwargs)
+        with session.replica_reads():
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+__all__ = ["RoutingSession", "replica_read"]
@@ -7,6 +7,7 @@ They provide a high-level API for SQL operations, abstracting the underlying dat
 """
 
 from .customer_persistent_model import CustomerPersistentModel
+from .hydrator import HydratableModel, Hydrator
 from .order_item_persistent_model import OrderItemPersistentModel
 from .order_persistent_model import OrderPersistentModel
 from .payment_persistent_model import PaymentPersistentModel
@@ -15,6 +16,8 @@ from .product_persistent_model import ProductPersistentModel
 
 __all__ = [
     "CustomerPersistentModel",
+    "HydratableModel",
+    "Hydrator",
     "OrderItemPersistentModel",
     "OrderPersistentModel",
     "PaymentPersistentModel",
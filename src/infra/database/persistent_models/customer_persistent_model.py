@@ -17,13 +17,13 @@ class CustomerPersistentModel(PersistentModel):
     email: Mapped[str] = Column(String(120), unique=True)
 
     def to_entity(self) -> Customer:
-        """Converts the persistent model to a Customer entity."""
-        return Customer(
+        """Converts the persistent model to a Customer entity, trusting the stored values."""
+        return Customer.restore(
             _id=self.id,
             uuid=self.uuid,
             name=self.name,
-            cpf=CPF(self.cpf),
-            email=Email(self.email),
+            cpf=CPF.restore(self.cpf),
+            email=Email.restore(self.email),
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
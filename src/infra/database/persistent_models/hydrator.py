@@ -0,0 +1,43 @@
+from typing import Dict, Protocol, Tuple, TypeVar
+
+from src.core.domain.base import FrozenAggregateRoot
+
+E = TypeVar("E", bound=FrozenAggregateRoot)
+E_co = TypeVar("E_co", bound=FrozenAggregateRoot, covariant=True)
+
+
+class HydratableModel(Protocol[E_co]):
+    """A persistent model that can be hydrated into an entity."""
+
+    id: int
+
+    def to_entity(self) -> E_co:
+        """Converts the persistent model to its entity."""
+        ...
+
+
+class Hydrator:
+    """Hydrates the rows of a query, building each distinct related entity once.
+
+    The rows of a listing reference the same few products and customers over and over; with a
+    hydrator, every row that references one shares the entity built for the first of them,
+    instead of each building its own. Products and customers are frozen, so a change made
+    through one order can never show through another.
+
+    A hydrator lives for a single query (or a single batch of a streamed one), so it never
+    holds more than the entities of that result.
+    """
+
+    def __init__(self) -> None:
+        self._entities: Dict[Tuple[type, int], FrozenAggregateRoot] = {}
+
+    def entity(self, model: HydratableModel[E]) -> E:
+        """Returns the entity of a row, hydrating it on its first lookup."""
+        key = (type(model), model.id)
+        entity = self._entities.get(key)
+        if entity is None:
+            entity = self._entities[key] = model.to_entity()
+        return entity  # type: ignore[return-value]
+
+
+__all__ = ["HydratableModel", "Hydrator"]
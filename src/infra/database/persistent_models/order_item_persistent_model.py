@@ -3,6 +3,7 @@ from sqlalchemy.orm import relationship
 
 from src.core.domain.entities.order_item import OrderItem
 
+from .hydrator import Hydrator
 from .persistent_model import PersistentModel
 
 
@@ -11,19 +12,26 @@ class OrderItemPersistentModel(PersistentModel):
 
     __tablename__ = "order_items"
 
-    order_id = Column(ForeignKey("orders.id"), nullable=False)
-    product_id = Column(ForeignKey("products.id"), nullable=False)
+    order_id = Column(ForeignKey("orders.id"), nullable=False, index=True)
+    product_id = Column(ForeignKey("products.id"), nullable=False, index=True)
     product = relationship("ProductPersistentModel")
     quantity = Column(Integer, nullable=False)
     unit_price = Column(Float, nullable=False)
     order = relationship("OrderPersistentModel", back_populates="items")
 
-    def to_entity(self) -> OrderItem:
-        """Converts the persistent model to an OrderItem entity."""
-        return OrderItem(
+    def to_entity(self, hydrator: Hydrator | None = None) -> OrderItem:
+        """Converts the persistent model to an OrderItem entity, trusting the stored values.
+
+        Args:
+            hydrator: The hydrator of the query that loaded the item, which shares the product
+             entity with the other items of the result. Without one, the item gets its own.
+        """
+        return OrderItem.restore(
             _id=self.id,
             uuid=self.uuid,
-            product=self.product.to_entity(),
+            product=hydrator.entity(self.product)
+            if hydrator is not None
+            else self.product.to_entity(),
             quantity=self.quantity,
             unit_price=self.unit_price,
             created_at=self.created_at,
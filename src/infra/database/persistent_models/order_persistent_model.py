@@ -1,12 +1,14 @@
-from typing import List
+from typing import Iterable, List
 
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer, text
+from sqlalchemy import Enum as SaEnum
 from sqlalchemy.orm import Mapped, relationship
 
 from src.core.domain.entities import Order as OrderEntity
 from src.core.domain.value_objects import OrderStatus
 
 from . import CustomerPersistentModel
+from .hydrator import Hydrator
 from .order_item_persistent_model import OrderItemPersistentModel
 from .persistent_model import PersistentModel
 
@@ -16,28 +18,59 @@ class OrderPersistentModel(PersistentModel):
 
     __tablename__ = "orders"
 
-    customer_id: Mapped[int] = Column(Integer, ForeignKey("customers.id"))
+    customer_id: Mapped[int] = Column(Integer, ForeignKey("customers.id"), index=True)
     customer: Mapped[CustomerPersistentModel] = relationship("CustomerPersistentModel")
     items: Mapped[List[OrderItemPersistentModel]] = relationship(
         "OrderItemPersistentModel", back_populates="order"
     )
 
     total_value: Mapped[float]
-    status: Mapped[OrderStatus]
+    status: Mapped[OrderStatus] = Column(SaEnum(OrderStatus, name="order_status"), nullable=False)
 
-    def to_entity(self) -> OrderEntity:
-        """Converts the persistent model to an Order entity."""
-        return OrderEntity(
+    __table_args__ = (
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        Index(
+            "ix_orders_kitchen_queue",
+            "status",
+            "created_at",
+            "id",
+            postgresql_where=text("status IN ('RECEIVED', 'PROCESSING', 'READY')"),
+        ),
+    )
+
+    def to_entity(self, hydrator: Hydrator | None = None) -> OrderEntity:
+        """Converts the persistent model to an Order entity, trusting the stored values.
+
+        The stored total value is kept as is, instead of being recalculated from the items.
+
+        Args:
+            hydrator: The hydrator of the query that loaded the order, which shares the customer
+             and product entities with the other orders of the result. Without one, the order
+             gets its own.
+        """
+        return OrderEntity.restore(
             _id=self.id,
-            _items=[item.to_entity() for item in self.items],
+            _items=tuple(item.to_entity(hydrator) for item in self.items),
             _total_value=self.total_value,
             _status=self.status,
-            _customer=self.customer.to_entity(),
+            _customer=hydrator.entity(self.customer)
+            if hydrator is not None
+            else self.customer.to_entity(),
             uuid=self.uuid,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
 
+    @staticmethod
+    def to_entities(rows: Iterable["OrderPersistentModel"]) -> List[OrderEntity]:
+        """Converts the orders loaded by a query to entities, trusting the stored values.
+
+        Each distinct customer and product is hydrated once and shared by every order of the
+        result that references it.
+        """
+        hydrator = Hydrator()
+        return [row.to_entity(hydrator) for row in rows]
+
     @staticmethod
     def from_entity(entity: OrderEntity) -> "OrderPersistentModel":
         """Converts an Order entity to the persistent model."""
@@ -1,4 +1,5 @@
 from sqlalchemy import JSON, Column, ForeignKey, Integer
+from sqlalchemy import Enum as SaEnum
 from sqlalchemy.orm import Mapped, relationship
 
 from src.core.domain.entities.payment import Payment, PaymentStatus
@@ -12,14 +13,16 @@ class PaymentPersistentModel(PersistentModel):
 
     __tablename__ = "payments"
 
-    order_id: Mapped[int] = Column(Integer, ForeignKey("orders.id"))
+    order_id: Mapped[int] = Column(Integer, ForeignKey("orders.id"), index=True)
     order: Mapped[OrderPersistentModel] = relationship("OrderPersistentModel")
-    status: Mapped[PaymentStatus]
+    status: Mapped[PaymentStatus] = Column(
+        SaEnum(PaymentStatus, name="payment_status"), nullable=False
+    )
     details: Mapped[dict] = Column(JSON)
 
     def to_entity(self) -> Payment:
-        """Converts the persistent model to an Order entity."""
-        return Payment(
+        """Converts the persistent model to a Payment entity, trusting the stored values."""
+        return Payment.restore(
             _id=self.id,
             status=self.status,
             uuid=self.uuid,
@@ -1,6 +1,6 @@
 from typing import List
 
-from sqlalchemy import ARRAY, Column, Float, String
+from sqlalchemy import ARRAY, Column, Float, Index, String, func
 from sqlalchemy import Enum as SaEnum
 from sqlalchemy.orm import Mapped
 
@@ -16,24 +16,26 @@ class ProductPersistentModel(PersistentModel):
     __tablename__ = "products"
 
     name: Mapped[str] = Column(String(100), nullable=False, unique=True)
-    category: Mapped[Category] = Column(SaEnum(Category), nullable=False)
+    category: Mapped[Category] = Column(SaEnum(Category), nullable=False, index=True)
     price: Mapped[float] = Column(Float, nullable=False)
     description: Mapped[str] = Column(String(255), nullable=False)
     images: Mapped[List[str]] = Column(ARRAY(String), nullable=False)
 
     def to_entity(self) -> Product:
-        """Converts the persistent model to a domain entity."""
-        return Product(
+        """Converts the persistent model to a domain entity, trusting the stored values."""
+        return Product.restore(
             _id=self.id,
             name=self.name,
             category=self.category,
             price=self.price,
             description=self.description,
-            images=self.images,
+            images=tuple(self.images),
             uuid=self.uuid,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
 
 
+Index("ix_products_lower_name", func.lower(ProductPersistentModel.name))
+
 __all__ = ["ProductPersistentModel"]
@@ -1,9 +1,27 @@
+from .async_cached_customer_repository import AsyncCachedCustomerRepository
+from .async_cached_product_repository import AsyncCachedProductRepository
+from .async_customer_repository_impl import AsyncSQLAlchemyCustomerRepository
+from .async_order_repository_impl import AsyncSQLAlchemyOrderRepository
+from .async_payment_repository_impl import AsyncSQLAlchemyPaymentRepository
+from .async_product_repository_impl import AsyncSQLAlchemyProductRepository
+from .cached_customer_repository import CachedCustomerRepository
+from .cached_product_repository import CachedProductRepository
 from .customer_repository_impl import SQlAlchemyCustomerRepository
+from .loading_strategies import LoadingStrategy
 from .order_repository_impl import SQLAlchemyOrderRepository
 from .payment_repository_impl import SQLAlchemyPaymentRepository
 from .product_repository_impl import SQLAlchemyProductRepository
 
 __all__ = [
+    "AsyncCachedCustomerRepository",
+    "AsyncCachedProductRepository",
+    "AsyncSQLAlchemyCustomerRepository",
+    "AsyncSQLAlchemyOrderRepository",
+    "AsyncSQLAlchemyPaymentRepository",
+    "AsyncSQLAlchemyProductRepository",
+    "CachedCustomerRepository",
+    "CachedProductRepository",
+    "LoadingStrategy",
     "SQLAlchemyOrderRepository",
     "SQLAlchemyPaymentRepository",
     "SQLAlchemyProductRepository",
@@ -0,0 +1,60 @@
+from typing import Hashable
+from uuid import UUID
+
+from src.core.domain.entities.customer import Customer
+from src.core.domain.repositories import AsyncCustomerRepository, CustomerView
+from src.core.domain.value_objects import CPF, Email
+from src.infra.cache import TTLCache
+
+from .cached_customer_repository import customer_cache_keys
+
+
+class AsyncCachedCustomerRepository(AsyncCustomerRepository):
+    """Asyncio counterpart of `CachedCustomerRepository`.
+
+    It may share its cache with the synchronous repositories: the cache never awaits while
+    holding its lock.
+    """
+
+    def __init__(
+        self, repository: AsyncCustomerRepository, cache: TTLCache[Hashable, object]
+    ) -> None:
+        """Initializes the repository.
+
+        Args:
+            repository: The repository that reads and writes the customers.
+            cache: The cache of the lookups, usually shared by every repository of the process.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def exists(self, cpf: CPF | None, email: Email | None) -> bool:
+        """Check if a customer already exists in the database either by cpf, email or both."""
+        return await self._repository.exists(cpf, email)
+
+    async def get_by_cpf(self, cpf: CPF) -> Customer | None:
+        """Get a customer by their CPF, from the cache when possible."""
+        return await self._cache.get_or_load_async(
+            ("cpf", cpf.number), lambda: self._repository.get_by_cpf(cpf)
+        )
+
+    async def get_view_by_cpf(self, cpf: CPF) -> CustomerView | None:
+        """Get the stored data of a customer by their CPF, from the cache when possible."""
+        return await self._cache.get_or_load_async(
+            ("view", cpf.number), lambda: self._repository.get_view_by_cpf(cpf)
+        )
+
+    async def get_by_uuid(self, uuid: UUID) -> Customer | None:
+        """Get a customer by their UUID, from the cache when possible."""
+        return await self._cache.get_or_load_async(
+            ("uuid", uuid), lambda: self._repository.get_by_uuid(uuid)
+        )
+
+    async def add(self, customer: Customer) -> Customer:
+        """Add a new customer to the database, dropping the cached lookups that may miss it."""
+        created = await self._repository.add(customer)
+        self._cache.invalidate(*customer_cache_keys(created))
+        return created
+
+
+__all__ = ["AsyncCachedCustomerRepository"]
@@ -0,0 +1,77 @@
+from typing import List, Set
+from uuid import UUID
+
+from src.core.domain.entities import Product
+from src.core.domain.repositories import AsyncProductRepository
+from src.core.domain.value_objects import Category
+from src.infra.cache import TTLCache
+
+from .cached_product_repository import CATALOG_KEY, ProductCatalog
+
+
+class AsyncCachedProductRepository(AsyncProductRepository):
+    """Asyncio counterpart of `CachedProductRepository`.
+
+    It may share its cache with the synchronous repositories. Concurrent misses of the tasks of
+    an event loop share a single load. As there, `get_by_uuids` always reads the database.
+    """
+
+    def __init__(self, repository: AsyncProductRepository, cache: TTLCache[str, object]) -> None:
+        """Initializes the repository.
+
+        Args:
+            repository: The repository that reads and writes the products.
+            cache: The cache of the catalog, usually shared by every repository of the process.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def _load_catalog(self) -> ProductCatalog:
+        return ProductCatalog.of(await self._repository.list_all())
+
+    async def _catalog(self) -> ProductCatalog:
+        return await self._cache.get_or_load_async(CATALOG_KEY, self._load_catalog)
+
+    async def create(self, product: Product) -> Product:
+        """Creates a new product, dropping the cached catalog."""
+        try:
+            return await self._repository.create(product)
+        finally:
+            self._cache.invalidate(CATALOG_KEY)
+
+    async def update(self, product_uuid: UUID, product: Product) -> Product | None:
+        """Updates an existing product, dropping the cached catalog."""
+        try:
+            return await self._repository.update(product_uuid, product)
+        finally:
+            self._cache.invalidate(CATALOG_KEY)
+
+    async def delete(self, product_uuid: UUID) -> None:
+        """Deletes a product, dropping the cached catalog."""
+        try:
+            await self._repository.delete(product_uuid)
+        finally:
+            self._cache.invalidate(CATALOG_KEY)
+
+    async def list_all(self) -> List[Product]:
+        """Retrieves every product, from the cached catalog when possible."""
+        return (await self._catalog()).list_all()
+
+    async def get_by_category(self, category: Category) -> List[Product]:
+        """Retrieves the products of a category, from the cached catalog when possible."""
+        return (await self._catalog()).get_by_category(category)
+
+    async def get_by_name(self, name: str) -> Product | None:
+        """Retrieves a product by its name, ignoring case, always from the database."""
+        return await self._repository.get_by_name(name)
+
+    async def get_by_uuids(self, product_uuids: Set[UUID]) -> List[Product]:
+        """Retrieves products by their UUIDs, always from the database."""
+        return await self._repository.get_by_uuids(product_uuids)
+
+    async def get_by_uuid(self, product_uuid: UUID) -> Product | None:
+        """Retrieves a product by its UUID, from the cached catalog when possible."""
+        return (await self._catalog()).get_by_uuid(product_uuid)
+
+
+__all__ = ["AsyncCachedProductRepository"]
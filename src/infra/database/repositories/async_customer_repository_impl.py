@@ -0,0 +1,84 @@
+from uuid import UUID
+
+from sqlalchemy import exists, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.entities.customer import Customer
+from src.core.domain.repositories import AsyncCustomerRepository, CustomerView
+from src.core.domain.value_objects import CPF, Email
+
+from ..config import replica_read
+from ..persistent_models import CustomerPersistentModel
+from .projections import select_view, to_view
+
+
+class AsyncSQLAlchemyCustomerRepository(AsyncCustomerRepository):
+    """Implementation of the AsyncCustomerRepository using an asyncio SQLAlchemy session.
+
+    Attributes:
+        _session (AsyncSession): The database session.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    @replica_read
+    async def exists(self, cpf: CPF | None, email: Email | None) -> bool:
+        """Check if a customer already exists in the database either by cpf, email or both."""
+        if not cpf and not email:  # Should not happen
+            return False
+
+        conditions = []
+        if cpf:
+            conditions.append(CustomerPersistentModel.cpf == cpf.number)
+        if email:
+            conditions.append(CustomerPersistentModel.email == email.address)
+
+        result = await self._session.execute(select(exists().where(or_(*conditions))))
+        return result.scalar()
+
+    async def add(self, customer: Customer) -> Customer:
+        """Add a new customer to the database."""
+        db_customer = CustomerPersistentModel(
+            name=customer.name,
+            cpf=customer.cpf.number,
+            email=customer.email.address,
+            uuid=customer.uuid,
+            created_at=customer.created_at,
+            updated_at=customer.updated_at,
+        )
+
+        self._session.add(db_customer)
+        await self._session.commit()
+        await self._session.refresh(db_customer)
+
+        return db_customer.to_entity()
+
+    @replica_read
+    async def get_by_cpf(self, cpf: CPF) -> Customer | None:
+        """Get a customer by their CPF."""
+        customer = await self._session.scalar(
+            select(CustomerPersistentModel).filter_by(cpf=cpf.number).limit(1)
+        )
+        return customer.to_entity() if customer else None
+
+    @replica_read
+    async def get_view_by_cpf(self, cpf: CPF) -> CustomerView | None:
+        """Get the stored data of a customer by their CPF, without building the entity."""
+        result = await self._session.execute(
+            select_view(CustomerView, CustomerPersistentModel).where(
+                CustomerPersistentModel.__table__.c.cpf == cpf.number
+            )
+        )
+        return to_view(CustomerView, result.first())
+
+    @replica_read
+    async def get_by_uuid(self, uuid: UUID) -> Customer | None:
+        """Get a customer by their UUID."""
+        customer = await self._session.scalar(
+            select(CustomerPersistentModel).filter_by(uuid=uuid).limit(1)
+        )
+        return customer.to_entity() if customer else None
+
+
+__all__ = ["AsyncSQLAlchemyCustomerRepository"]
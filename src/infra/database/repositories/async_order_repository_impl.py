@@ -0,0 +1,92 @@
+from typing import Collection, List, Mapping, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.entities.order import Order
+from src.core.domain.repositories import AsyncOrderRepository, OrderPageCursor
+from src.core.domain.value_objects.order_status import OrderStatus
+
+from ..config import replica_read
+from ..persistent_models import OrderPersistentModel
+from .loading_strategies import LoadingStrategy
+from .order_queries import OrderQueries
+
+
+class AsyncSQLAlchemyOrderRepository(AsyncOrderRepository):
+    """Implementation of the AsyncOrderRepository using an asyncio SQLAlchemy session.
+
+    It runs the same statements as `SQLAlchemyOrderRepository`. The whole order graph is always
+    loaded eagerly, since lazy loads are not possible with asyncio.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        loading_strategies: Mapping[str, LoadingStrategy] | None = None,
+    ) -> None:
+        """Initializes the AsyncSQLAlchemyOrderRepository with a given session.
+
+        Args:
+            session (AsyncSession): The asyncio SQLAlchemy session to use for database operations.
+            loading_strategies: Overrides the loading strategy of specific read methods, keyed by
+             method name. Methods not present use `DEFAULT_LOADING_STRATEGIES`.
+        """
+        self._session = session
+        self._queries = OrderQueries(loading_strategies)
+
+    async def create(self, order: Order) -> Order:
+        """Creates a new order in the repository."""
+        db_order = OrderPersistentModel.from_entity(order)
+
+        self._session.add(db_order)
+        await self._session.commit()
+
+        return db_order.to_entity()
+
+    async def update_status(
+        self, order_uuid: UUID, status: OrderStatus, from_statuses: Collection[OrderStatus]
+    ) -> Order | None:
+        """Updates the status of an existing order, if its current status is one of `from_statuses`."""
+        result = await self._session.execute(
+            self._queries.update_status(order_uuid, status, from_statuses)
+        )
+        updated_order = result.unique().scalar_one_or_none()
+        order = updated_order.to_entity() if updated_order else None
+        await self._session.commit()
+        return order
+
+    @replica_read
+    async def list_all(self) -> List[Order]:
+        """Retrieves all orders from the repository."""
+        result = await self._session.execute(self._queries.select_orders("list_all"))
+        return OrderPersistentModel.to_entities(result.unique().scalars().all())
+
+    @replica_read
+    async def list_page(self, page_size: int, after: OrderPageCursor | None = None) -> List[Order]:
+        """Retrieves a page of orders sorted by creation date, oldest first."""
+        result = await self._session.execute(self._queries.page(page_size, after))
+        return OrderPersistentModel.to_entities(result.unique().scalars().all())
+
+    @replica_read
+    async def get_by_uuid(self, order_uuid: UUID) -> Order | None:
+        """Retrieves an order by its uuid."""
+        result = await self._session.execute(self._queries.by_uuid("get_by_uuid", order_uuid))
+        order = result.unique().scalar_one_or_none()
+        return order.to_entity() if order else None
+
+    @replica_read
+    async def list_orders_sorted_by_status(
+        self,
+        statuses: Sequence[OrderStatus],
+        page_size: int | None = None,
+        after: OrderPageCursor | None = None,
+    ) -> List[Order]:
+        """Retrieves orders with the given statuses, sorted by status and creation date."""
+        result = await self._session.execute(
+            self._queries.sorted_by_status(statuses, page_size, after)
+        )
+        return OrderPersistentModel.to_entities(result.unique().scalars().all())
+
+
+__all__ = ["AsyncSQLAlchemyOrderRepository"]
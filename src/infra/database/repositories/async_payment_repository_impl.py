@@ -0,0 +1,72 @@
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.operators import eq
+
+from src.core.domain.entities import Payment
+from src.core.domain.repositories import AsyncPaymentRepository, PaymentStatusView
+from src.infra.database.persistent_models.order_persistent_model import OrderPersistentModel
+from src.infra.database.persistent_models.payment_persistent_model import PaymentPersistentModel
+
+from ..config import replica_read
+from .loading_strategies import LoadingStrategy, order_graph_options
+from .projections import select_view, to_view
+
+
+class AsyncSQLAlchemyPaymentRepository(AsyncPaymentRepository):
+    """Implementation of the AsyncPaymentRepository using an asyncio SQLAlchemy session.
+
+    Payments are always loaded along with their whole order graph, since lazy loads are not
+    possible with asyncio.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initializes the AsyncSQLAlchemyPaymentRepository with a given session.
+
+        Args:
+            session (AsyncSession): The asyncio SQLAlchemy session to use for database operations.
+        """
+        self._session = session
+
+    @staticmethod
+    def _select_payments() -> Select:
+        """Builds a payment SELECT that eagerly loads the whole order graph."""
+        return select(PaymentPersistentModel).options(
+            *order_graph_options(LoadingStrategy.JOINED, via=PaymentPersistentModel.order)
+        )
+
+    @replica_read
+    async def get_by_uuid(self, uuid: UUID) -> Payment | None:
+        """Retrieves a payment by its UUID, along with its whole order graph."""
+        result = await self._session.execute(
+            self._select_payments().where(eq(PaymentPersistentModel.uuid, uuid))
+        )
+        payment = result.unique().scalar_one_or_none()
+        return payment.to_entity() if payment else None
+
+    async def add(self, payment: Payment) -> Payment:
+        """Adds a new payment to the repository."""
+        db_payment = PaymentPersistentModel.from_entity(payment)
+
+        self._session.add(db_payment)
+        await self._session.commit()
+
+        return await self.get_by_uuid(db_payment.uuid)
+
+    @replica_read
+    async def get_status_view(self, order_uuid: UUID) -> PaymentStatusView | None:
+        """Get the status of the payment of an order, without loading the payment."""
+        result = await self._session.execute(
+            select_view(PaymentStatusView, PaymentPersistentModel)
+            .join_from(
+                PaymentPersistentModel.__table__,
+                OrderPersistentModel.__table__,
+                PaymentPersistentModel.__table__.c.order_id == OrderPersistentModel.__table__.c.id,
+            )
+            .where(OrderPersistentModel.__table__.c.uuid == order_uuid)
+        )
+        return to_view(PaymentStatusView, result.first())
+
+
+__all__ = ["AsyncSQLAlchemyPaymentRepository"]
@@ -0,0 +1,109 @@
+from typing import List, Set
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.operators import eq
+
+from src.core.domain.entities import Product
+from src.core.domain.repositories import AsyncProductRepository
+from src.core.domain.value_objects import Category
+
+from ..config import replica_read
+from ..persistent_models.product_persistent_model import ProductPersistentModel
+
+
+class AsyncSQLAlchemyProductRepository(AsyncProductRepository):
+    """Implementation of the AsyncProductRepository using an asyncio SQLAlchemy session."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initializes the AsyncSQLAlchemyProductRepository with a given session.
+
+        Args:
+            session (AsyncSession): The asyncio SQLAlchemy session to use for database operations.
+        """
+        self._session = session
+
+    async def _get_one(self, *criteria: object) -> ProductPersistentModel | None:
+        return await self._session.scalar(select(ProductPersistentModel).where(*criteria).limit(1))
+
+    async def create(self, product: Product) -> Product:
+        """Creates a new product in the repository."""
+        db_product = ProductPersistentModel(
+            name=product.name,
+            category=product.category,
+            price=product.price,
+            description=product.description,
+            images=list(product.images),
+        )
+
+        self._session.add(db_product)
+        await self._session.commit()
+        await self._session.refresh(db_product)
+
+        return db_product.to_entity()
+
+    async def update(self, product_uuid: UUID, product: Product) -> Product | None:
+        """Updates an existing product in the repository."""
+        db_product = await self._get_one(eq(ProductPersistentModel.uuid, product_uuid))
+
+        if db_product is None:
+            return None
+
+        db_product.name = product.name
+        db_product.category = product.category
+        db_product.price = product.price
+        db_product.description = product.description
+        db_product.images = list(product.images)
+
+        await self._session.commit()
+        await self._session.refresh(db_product)
+        return db_product.to_entity()
+
+    async def delete(self, product_uuid: UUID) -> None:
+        """Deletes a product from the repository."""
+        await self._session.execute(
+            delete(ProductPersistentModel).where(eq(ProductPersistentModel.uuid, product_uuid))
+        )
+        await self._session.commit()
+
+    async def list_all(self) -> List[Product]:
+        """Retrieves every product of the catalog, always from the primary.
+
+        See `SQLAlchemyProductRepository.list_all`.
+        """
+        result = await self._session.scalars(
+            select(ProductPersistentModel).order_by(ProductPersistentModel.id)
+        )
+        return [p.to_entity() for p in result.all()]
+
+    @replica_read
+    async def get_by_category(self, category: Category) -> List[Product]:
+        """Retrieves all products in a given category."""
+        result = await self._session.scalars(
+            select(ProductPersistentModel).where(eq(ProductPersistentModel.category, category))
+        )
+        return [p.to_entity() for p in result.all()]
+
+    @replica_read
+    async def get_by_name(self, name: str) -> Product | None:
+        """Retrieves a product by its name, ignoring case."""
+        result = await self._get_one(eq(func.lower(ProductPersistentModel.name), name.lower()))
+        return result.to_entity() if result else None
+
+    @replica_read
+    async def get_by_uuids(self, product_uuids: Set[UUID]) -> List[Product]:
+        """Retrieves products by their UUIDs."""
+        result = await self._session.scalars(
+            select(ProductPersistentModel).where(ProductPersistentModel.uuid.in_(product_uuids))
+        )
+        return [p.to_entity() for p in result.all()]
+
+    @replica_read
+    async def get_by_uuid(self, product_uuid: UUID) -> Product | None:
+        """Retrieves a product by its UUID."""
+        result = await self._get_one(eq(ProductPersistentModel.uuid, product_uuid))
+        return result.to_entity() if result else None
+
+
+__all__ = ["AsyncSQLAlchemyProductRepository"]
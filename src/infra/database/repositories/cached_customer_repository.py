@@ -0,0 +1,64 @@
+from typing import Hashable
+from uuid import UUID
+
+from src.core.domain.entities.customer import Customer
+from src.core.domain.repositories import CustomerRepository, CustomerView
+from src.core.domain.value_objects import CPF, Email
+from src.infra.cache import TTLCache
+
+
+def customer_cache_keys(customer: Customer) -> tuple[Hashable, ...]:
+    """Returns every cache key under which lookups of the given customer are stored."""
+    return ("cpf", customer.cpf.number), ("view", customer.cpf.number), ("uuid", customer.uuid)
+
+
+class CachedCustomerRepository(CustomerRepository):
+    """A CustomerRepository that answers the customer lookups from an in-process cache.
+
+    Lookups by CPF and by uuid are cached for a while, unknown customers included (as negative
+    entries); misses and writes go to the wrapped repository. Customers never change, so
+    callers share the cached entities. `add` drops the entries of the new customer, so this
+    process sees it right away, and a lookup that raced with it does not store what it missed.
+    Other processes keep their negative entries until they expire.
+
+    `exists` is never cached, as it guards the creation of customers.
+    """
+
+    def __init__(self, repository: CustomerRepository, cache: TTLCache[Hashable, object]) -> None:
+        """Initializes the repository.
+
+        Args:
+            repository: The repository that reads and writes the customers.
+            cache: The cache of the lookups, usually shared by every repository of the process.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    def exists(self, cpf: CPF | None, email: Email | None) -> bool:
+        """Check if a customer already exists in the database either by cpf, email or both."""
+        return self._repository.exists(cpf, email)
+
+    def get_by_cpf(self, cpf: CPF) -> Customer | None:
+        """Get a customer by their CPF, from the cache when possible."""
+        return self._cache.get_or_load(
+            ("cpf", cpf.number), lambda: self._repository.get_by_cpf(cpf)
+        )
+
+    def get_view_by_cpf(self, cpf: CPF) -> CustomerView | None:
+        """Get the stored data of a customer by their CPF, from the cache when possible."""
+        return self._cache.get_or_load(
+            ("view", cpf.number), lambda: self._repository.get_view_by_cpf(cpf)
+        )
+
+    def get_by_uuid(self, uuid: UUID) -> Customer | None:
+        """Get a customer by their UUID, from the cache when possible."""
+        return self._cache.get_or_load(("uuid", uuid), lambda: self._repository.get_by_uuid(uuid))
+
+    def add(self, customer: Customer) -> Customer:
+        """Add a new customer to the database, dropping the cached lookups that may miss it."""
+        created = self._repository.add(customer)
+        self._cache.invalidate(*customer_cache_keys(created))
+        return created
+
+
+__all__ = ["CachedCustomerRepository", "customer_cache_keys"]
@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Sequence, Set, Tuple
+from uuid import UUID
+
+from src.core.domain.entities import Product
+from src.core.domain.repositories import ProductRepository
+from src.core.domain.value_objects import Category
+from src.infra.cache import TTLCache
+
+CATALOG_KEY = "catalog"
+"""The key of the product catalog in its cache."""
+
+
+@dataclass(frozen=True)
+class ProductCatalog:
+    """A snapshot of every product, indexed for the lookups served from memory.
+
+    Products never change, so the lookups return the cached entities themselves.
+
+    Attributes:
+        by_uuid: The products, keyed by uuid.
+        by_category: The products of each category, in the order they were created.
+    """
+
+    by_uuid: Mapping[UUID, Product]
+    by_category: Mapping[Category, Tuple[Product, ...]]
+
+    @classmethod
+    def of(cls, products: Sequence[Product]) -> "ProductCatalog":
+        """Indexes the given products, in the order they were created."""
+        by_category: Dict[Category, List[Product]] = {}
+        for product in products:
+            by_category.setdefault(product.category, []).append(product)
+
+        return cls(
+            by_uuid={product.uuid: product for product in products},
+            by_category={category: tuple(group) for category, group in by_category.items()},
+        )
+
+    def list_all(self) -> List[Product]:
+        """Returns every product."""
+        return list(self.by_uuid.values())
+
+    def get_by_category(self, category: Category) -> List[Product]:
+        """Returns the products of a category."""
+        return list(self.by_category.get(category, ()))
+
+    def get_by_uuids(self, product_uuids: Set[UUID]) -> List[Product]:
+        """Returns the products with the given uuids, skipping the unknown ones."""
+        return [
+            self.by_uuid[product_uuid]
+            for product_uuid in product_uuids
+            if product_uuid in self.by_uuid
+        ]
+
+    def get_by_uuid(self, product_uuid: UUID) -> Product | None:
+        """Returns the product with the given uuid, None if unknown."""
+        return self.by_uuid.get(product_uuid)
+
+
+class CachedProductRepository(ProductRepository):
+    """A ProductRepository that serves the catalog lookups from an in-process snapshot.
+
+    The catalog of a restaurant is small and rarely written, so the whole of it is loaded by a
+    single query and kept as one cache entry, from which `list_all`, `get_by_category` and
+    `get_by_uuid` are answered. Concurrent misses share a single load.
+
+    Every write goes to the wrapped repository and then drops the snapshot, so this process
+    reads its own writes right away; a load that raced with the write is not kept. Other
+    processes see the write once their snapshot expires.
+
+    `get_by_name` is never cached, as it guards the creation of products, nor is
+    `get_by_uuids`, as checkout prices its items with it: an order must be charged the latest
+    price, including one changed by another process, and must not reference a deleted product.
+    """
+
+    def __init__(self, repository: ProductRepository, cache: TTLCache[str, object]) -> None:
+        """Initializes the repository.
+
+        Args:
+            repository: The repository that reads and writes the products.
+            cache: The cache of the catalog, usually shared by every repository of the process.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    def _catalog(self) -> ProductCatalog:
+        return self._cache.get_or_load(
+            CATALOG_KEY, lambda: ProductCatalog.of(self._repository.list_all())
+        )
+
+    def create(self, product: Product) -> Product:
+        """Creates a new product, dropping the cached catalog."""
+        try:
+            return self._repository.create(product)
+        finally:
+            self._cache.invalidate(CATALOG_KEY)
+
+    def update(self, product_uuid: UUID, product: Product) -> Product | None:
+        """Updates an existing product, dropping the cached catalog."""
+        try:
+            return self._repository.update(product_uuid, product)
+        finally:
+            self._cache.invalidate(CATALOG_KEY)
+
+    def delete(self, product_uuid: UUID) -> None:
+        """Deletes a product, dropping the cached catalog."""
+        try:
+            self._repository.delete(product_uuid)
+        finally:
+            self._cache.invalidate(CATALOG_KEY)
+
+    def list_all(self) -> List[Product]:
+        """Retrieves every product, from the cached catalog when possible."""
+        return self._catalog().list_all()
+
+    def get_by_category(self, category: Category) -> List[Product]:
+        """Retrieves the products of a category, from the cached catalog when possible."""
+        return self._catalog().get_by_category(category)
+
+    def get_by_name(self, name: str) -> Product | None:
+        """Retrieves a product by its name, ignoring case, always from the database."""
+        return self._repository.get_by_name(name)
+
+    def get_by_uuids(self, product_uuids: Set[UUID]) -> List[Product]:
+        """Retrieves products by their UUIDs, always from the database."""
+        return self._repository.get_by_uuids(product_uuids)
+
+    def get_by_uuid(self, product_uuid: UUID) -> Product | None:
+        """Retrieves a product by its UUID, from the cached catalog when possible."""
+        return self._catalog().get_by_uuid(product_uuid)
+
+    def upsert_by_name(self, products: Sequence[Product]) -> List[Product]:
+        """Creates or updates the given products, dropping the cached catalog."""
+        try:
+            return self._repository.upsert_by_name(products)
+        finally:
+            self._cache.invalidate(CATALOG_KEY)
+
+    def change_prices_by_category(self, category: Category, factor: float) -> List[Product]:
+        """Reprices the products of a category, dropping the cached catalog."""
+        try:
+            return self._repository.change_prices_by_category(category, factor)
+        finally:
+            self._cache.invalidate(CATALOG_KEY)
+
+
+__all__ = ["CATALOG_KEY", "CachedProductRepository", "ProductCatalog"]
@@ -4,10 +4,12 @@ from sqlalchemy import exists, or_, select
 from sqlalchemy.orm import Session
 
 from src.core.domain.entities.customer import Customer
-from src.core.domain.repositories import CustomerRepository
+from src.core.domain.repositories import CustomerRepository, CustomerView
 from src.core.domain.value_objects import CPF, Email
 
+from ..config import replica_read
 from ..persistent_models import CustomerPersistentModel
+from .projections import select_view, to_view
 
 
 class SQlAlchemyCustomerRepository(CustomerRepository):
@@ -20,6 +22,7 @@ class SQlAlchemyCustomerRepository(CustomerRepository):
     def __init__(self, session: Session) -> None:
         self._session = session
 
+    @replica_read
     def exists(self, cpf: CPF | None, email: Email | None) -> bool:
         """Check if a customer already exists in the database either by cpf, email or both.
 
@@ -66,6 +69,7 @@ class SQlAlchemyCustomerRepository(CustomerRepository):
 
         return db_customer.to_entity()
 
+    @replica_read
     def get_by_cpf(self, cpf: CPF) -> Customer | None:
         """Get a customer by their CPF.
 
@@ -81,6 +85,25 @@ class SQlAlchemyCustomerRepository(CustomerRepository):
 
         return customer.to_entity() if customer else None
 
+    @replica_read
+    def get_view_by_cpf(self, cpf: CPF) -> CustomerView | None:
+        """Get the stored data of a customer by their CPF, without building the entity.
+
+        Args:
+            cpf (CPF): The customer's CPF.
+
+        Returns:
+            CustomerView: The customer data if found, None otherwise.
+        """
+        row = self._session.execute(
+            select_view(CustomerView, CustomerPersistentModel).where(
+                CustomerPersistentModel.__table__.c.cpf == cpf.number
+            )
+        ).first()
+
+        return to_view(CustomerView, row)
+
+    @replica_read
     def get_by_uuid(self, uuid: UUID) -> Customer | None:
         """Get a customer by their UUID.
 
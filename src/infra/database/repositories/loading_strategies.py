@@ -0,0 +1,57 @@
+from enum import StrEnum, auto
+from typing import Tuple, Type
+
+from sqlalchemy.orm import QueryableAttribute, joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.orm.util import AliasedClass
+
+from ..persistent_models import OrderItemPersistentModel, OrderPersistentModel
+
+
+class LoadingStrategy(StrEnum):
+    """The strategy used to eagerly load the relationships of an aggregate.
+
+    - SELECTIN: one extra `SELECT ... WHERE id IN (...)` per relationship level. The number of
+      queries is fixed and independent of the number of rows, which suits list queries.
+    - JOINED: a single query with `LEFT OUTER JOIN`s. Best for single-row lookups, where the
+      row multiplication caused by the joined collections is negligible.
+    """
+
+    SELECTIN = auto()
+    JOINED = auto()
+
+
+def order_graph_options(
+    strategy: LoadingStrategy,
+    via: QueryableAttribute | None = None,
+    order: Type[OrderPersistentModel] | AliasedClass[OrderPersistentModel] = OrderPersistentModel,
+) -> Tuple[LoaderOption, ...]:
+    """Builds the loader options that fetch a whole order graph up front.
+
+    The graph is the order customer, its items and the product of each item, which is
+    everything `OrderPersistentModel.to_entity` touches.
+
+    Args:
+        strategy: The loading strategy to use for every relationship of the graph.
+        via: An optional relationship that leads to the order (e.g. `PaymentPersistentModel.order`)
+         when the order is not the root entity of the query.
+        order: The entity the orders are loaded as, e.g. an alias of `OrderPersistentModel` over
+         a CTE. Ignored when `via` is given.
+
+    Returns:
+        The loader options to be passed to `Select.options`.
+    """
+    loader = selectinload if strategy is LoadingStrategy.SELECTIN else joinedload
+
+    graph = (
+        loader(order.customer),
+        loader(order.items).options(loader(OrderItemPersistentModel.product)),
+    )
+
+    if via is None:
+        return graph
+
+    return (loader(via).options(*graph),)
+
+
+__all__ = ["LoadingStrategy", "order_graph_options"]
@@ -0,0 +1,175 @@
+from types import MappingProxyType
+from typing import Collection, Mapping, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, Update, case, literal, select, tuple_, update
+from sqlalchemy.orm import aliased
+
+from src.core.domain.repositories.order_repository import OrderPageCursor
+from src.core.domain.value_objects.order_status import OrderStatus
+
+from ..persistent_models import OrderPersistentModel
+from .loading_strategies import LoadingStrategy, order_graph_options
+
+DEFAULT_LOADING_STRATEGIES: Mapping[str, LoadingStrategy] = MappingProxyType({
+    "update_status": LoadingStrategy.JOINED,
+    "list_all": LoadingStrategy.SELECTIN,
+    "stream_all": LoadingStrategy.SELECTIN,
+    "list_page": LoadingStrategy.SELECTIN,
+    "get_by_uuid": LoadingStrategy.JOINED,
+    "list_orders_sorted_by_status": LoadingStrategy.SELECTIN,
+})
+"""The loading strategy used by each read path when none is configured."""
+
+
+class OrderQueries:
+    """Builds the statements of the order repositories.
+
+    The statements are shared by the synchronous and the asyncio repositories, which only
+    differ in how they execute them.
+    """
+
+    def __init__(self, loading_strategies: Mapping[str, LoadingStrategy] | None = None) -> None:
+        """Initializes the builder with the loading strategy of each read method.
+
+        Args:
+            loading_strategies: Overrides the loading strategy of specific read methods, keyed by
+             method name. Methods not present use `DEFAULT_LOADING_STRATEGIES`.
+        """
+        self._loading_strategies = {**DEFAULT_LOADING_STRATEGIES, **(loading_strategies or {})}
+
+    def select_orders(self, method: str) -> Select:
+        """Builds an order SELECT with the loading strategy configured for the given method."""
+        strategy = self._loading_strategies[method]
+        return select(OrderPersistentModel).options(*order_graph_options(strategy))
+
+    def by_uuid(self, method: str, order_uuid: UUID) -> Select:
+        """Builds the SELECT of the order with the given uuid."""
+        return self.select_orders(method).where(OrderPersistentModel.uuid == order_uuid)
+
+    def update_status(
+        self, order_uuid: UUID, status: OrderStatus, from_statuses: Collection[OrderStatus]
+    ) -> Select:
+        """Builds the compare-and-set status update of the order with the given uuid.
+
+        The `UPDATE` only matches the order while its status is one of `from_statuses`, and
+        runs as a CTE of the `SELECT` that loads the updated order graph, so checking the
+        transition, updating and reading the result back take a single round trip. The
+        statement returns no row when the order does not exist or is in any other status.
+        """
+        updated = (
+            update(OrderPersistentModel)
+            .where(
+                OrderPersistentModel.uuid == order_uuid,
+                OrderPersistentModel.status.in_(from_statuses),
+            )
+            .values(status=status)
+            .returning(*OrderPersistentModel.__table__.c)
+            .cte("updated_order")
+        )
+        order = aliased(OrderPersistentModel, updated)
+        strategy = self._loading_strategies["update_status"]
+
+        return (
+            select(order)
+            .add_cte(updated)
+            .options(*order_graph_options(strategy, order=order))
+            .execution_options(populate_existing=True)
+        )
+
+    @staticmethod
+    def update_statuses(
+        order_uuids: Sequence[UUID], status: OrderStatus, from_statuses: Sequence[OrderStatus]
+    ) -> Update:
+        """Builds the UPDATE that moves the given orders from any of `from_statuses` to `status`.
+
+        It returns the uuid of each updated order.
+        """
+        return (
+            update(OrderPersistentModel)
+            .where(
+                OrderPersistentModel.uuid.in_(order_uuids),
+                OrderPersistentModel.status.in_(from_statuses),
+            )
+            .values(status=status)
+            .returning(OrderPersistentModel.uuid)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def statuses(order_uuids: Sequence[UUID]) -> Select:
+        """Builds the SELECT of the uuid and status of the given orders."""
+        return select(OrderPersistentModel.uuid, OrderPersistentModel.status).where(
+            OrderPersistentModel.uuid.in_(order_uuids)
+        )
+
+    def stream(self, batch_size: int) -> Select:
+        """Builds the SELECT of every order, sorted by `(created_at, id)`, fetched in batches.
+
+        The rows are read through a server-side cursor, `batch_size` at a time (`yield_per`).
+        The graph of each batch is then loaded by `SELECT ... IN`s, as joined eager loading of
+        collections cannot be combined with `yield_per`.
+        """
+        return (
+            self.select_orders("stream_all")
+            .order_by(OrderPersistentModel.created_at, OrderPersistentModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+    def page(self, page_size: int, after: OrderPageCursor | None = None) -> Select:
+        """Builds the SELECT of a page of orders sorted by `(created_at, id)`.
+
+        Uses keyset pagination, backed by the `ix_orders_created_at_id` index, so any page costs
+        the same as the first one regardless of the table size.
+        """
+        stmt = (
+            self.select_orders("list_page")
+            .order_by(OrderPersistentModel.created_at, OrderPersistentModel.id)
+            .limit(page_size)
+        )
+
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(OrderPersistentModel.created_at, OrderPersistentModel.id)
+                > tuple_(after.created_at, after.id)
+            )
+
+        return stmt
+
+    def sorted_by_status(
+        self,
+        statuses: Sequence[OrderStatus],
+        page_size: int | None = None,
+        after: OrderPageCursor | None = None,
+    ) -> Select:
+        """Builds the SELECT of the orders with the given statuses, sorted by status.
+
+        Filtering and sorting both happen in the database: the statuses are ranked with a
+        `CASE` expression following their position in `statuses`, and ties are broken by
+        `(created_at, id)`. For the kitchen queue statuses the filter is served by the partial
+        `ix_orders_kitchen_queue` index, so finished orders are never read.
+        """
+        ranks = {status: rank for rank, status in enumerate(statuses)}
+        status_rank = case(
+            *((OrderPersistentModel.status == status, rank) for status, rank in ranks.items())
+        )
+
+        stmt = (
+            self.select_orders("list_orders_sorted_by_status")
+            .where(OrderPersistentModel.status.in_(statuses))
+            .order_by(status_rank, OrderPersistentModel.created_at, OrderPersistentModel.id)
+        )
+
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(status_rank, OrderPersistentModel.created_at, OrderPersistentModel.id)
+                > tuple_(literal(ranks[after.status]), after.created_at, after.id)
+            )
+
+        if page_size is not None:
+            stmt = stmt.limit(page_size)
+
+        return stmt
+
+
+__all__ = ["DEFAULT_LOADING_STRATEGIES", "OrderQueries"]
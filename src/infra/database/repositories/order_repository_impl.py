@@ -1,30 +1,41 @@
-from typing import List
+from typing import Collection, Dict, Iterator, List, Mapping, Sequence
 from uuid import UUID
 
-from sqlalchemy import update
-from sqlalchemy.future import select
 from sqlalchemy.orm import Session
 
 from src.core.domain.entities.order import Order
-from src.core.domain.repositories.order_repository import OrderRepository
+from src.core.domain.repositories.order_repository import OrderPageCursor, OrderRepository
 from src.core.domain.value_objects.order_status import OrderStatus
 
+from ..config import replica_read
 from ..persistent_models import OrderPersistentModel
+from .loading_strategies import LoadingStrategy
+from .order_queries import OrderQueries
 
 
 class SQLAlchemyOrderRepository(OrderRepository):
     """Implementation of the OrderRepository using SQLAlchemy.
 
     This repository uses an SQLAlchemy session to perform CRUD operations on orders.
+
+    Every read path eagerly loads the whole order graph (customer, items and item products),
+    so the number of queries issued is fixed no matter how many orders are returned.
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self,
+        session: Session,
+        loading_strategies: Mapping[str, LoadingStrategy] | None = None,
+    ) -> None:
         """Initializes the SQLAlchemyOrderRepository with a given session.
 
         Args:
             session (Session): The SQLAlchemy session to use for database operations.
+            loading_strategies: Overrides the loading strategy of specific read methods, keyed by
+             method name. Methods not present use `DEFAULT_LOADING_STRATEGIES`.
         """
         self._session = session
+        self._queries = OrderQueries(loading_strategies)
 
     def create(self, order: Order) -> Order:
         """Creates a new order in the repository.
@@ -42,44 +53,115 @@ class SQLAlchemyOrderRepository(OrderRepository):
 
         return db_order.to_entity()
 
-    def update_status(self, order_uuid: UUID, status: OrderStatus) -> Order:
-        """Updates the status of an existing order in the repository.
+    def update_status(
+        self, order_uuid: UUID, status: OrderStatus, from_statuses: Collection[OrderStatus]
+    ) -> Order | None:
+        """Updates the status of an existing order, if its current status is one of `from_statuses`.
+
+        The transition check, the update and the load of the updated order graph are a single
+        statement, see `OrderQueries.update_status`.
 
         Args:
             order_uuid (UUID): The uuid of the order to be updated.
             status (OrderStatus): The new status for the order.
+            from_statuses (Collection[OrderStatus]): The statuses the order may be moved from.
+
+        Returns:
+            Order | None: The updated order, or None if the order does not exist or is in any
+             other status.
+        """
+        updated_order = (
+            self._session.execute(self._queries.update_status(order_uuid, status, from_statuses))
+            .unique()
+            .scalar_one_or_none()
+        )
+        order = updated_order.to_entity() if updated_order else None
+        self._session.commit()
+        return order
+
+    def update_statuses(
+        self,
+        order_uuids: Sequence[UUID],
+        status: OrderStatus,
+        from_statuses: Sequence[OrderStatus],
+    ) -> List[UUID]:
+        """Sets the status of many orders at once, skipping the orders in any other status.
+
+        A single `UPDATE ... RETURNING` filters on the current status, so the transition check
+        and the update are atomic and no order is loaded.
+
+        Args:
+            order_uuids (Sequence[UUID]): The uuids of the orders to be updated.
+            status (OrderStatus): The new status for the orders.
+            from_statuses (Sequence[OrderStatus]): The statuses an order may be moved from.
 
         Returns:
-            Order: The updated order.
+            List[UUID]: The uuids of the updated orders.
         """
-        with self._session as session:
-            session.execute(
-                update(OrderPersistentModel)
-                .where(OrderPersistentModel.uuid == order_uuid)
-                .values(status=status)
-            )
-            session.commit()
-            updated_order = session.execute(
-                select(OrderPersistentModel).where(OrderPersistentModel.uuid == order_uuid)
-            ).scalar_one()
-            return updated_order.to_entity()
+        updated = self._session.scalars(
+            self._queries.update_statuses(order_uuids, status, from_statuses)
+        ).all()
+        self._session.commit()
+        return list(updated)
+
+    @replica_read
+    def get_statuses(self, order_uuids: Sequence[UUID]) -> Dict[UUID, OrderStatus]:
+        """Retrieves the current status of the given orders, keyed by uuid."""
+        return dict(self._session.execute(self._queries.statuses(order_uuids)).tuples().all())
 
+    @replica_read
     def list_all(self) -> List[Order]:
         """Retrieves all orders from the repository.
 
         Returns:
             List[Order]: A list of all orders.
         """
-        with self._session as session:
-            result = session.execute(select(OrderPersistentModel))
-            return [row.to_entity() for row in result.scalars().all()]
+        result = self._session.execute(self._queries.select_orders("list_all"))
+        return OrderPersistentModel.to_entities(result.unique().scalars().all())
+
+    def stream_all(self, batch_size: int) -> Iterator[Order]:
+        """Yields every order, oldest first, holding a single batch of rows at a time.
+
+        It reads from the primary: `replica_read` would only cover the call that creates the
+        generator, not the batches fetched while it is consumed. The session must stay open,
+        and should not be used for anything else, until the iterator is exhausted or closed.
+
+        Args:
+            batch_size (int): The number of orders fetched from the server-side cursor at a time.
+
+        Returns:
+            Iterator[Order]: The orders, read lazily as the iterator is consumed.
+        """
+        result = self._session.scalars(self._queries.stream(batch_size))
+        # The identity map only holds weak references to unmodified rows, so the rows of a
+        # batch are released once its entities are built.
+        for batch in result.partitions():
+            yield from OrderPersistentModel.to_entities(batch)
+
+    @replica_read
+    def list_page(self, page_size: int, after: OrderPageCursor | None = None) -> List[Order]:
+        """Retrieves a page of orders sorted by creation date, oldest first.
+
+        Uses keyset pagination over `(created_at, id)`, backed by the `ix_orders_created_at_id`
+        index, so any page costs the same as the first one regardless of the table size.
+
+        Args:
+            page_size (int): The maximum number of orders to return.
+            after (OrderPageCursor | None): The position of the last order of the previous page.
+
+        Returns:
+            List[Order]: Up to `page_size` orders placed after the given cursor.
+        """
+        result = self._session.execute(self._queries.page(page_size, after))
+        return OrderPersistentModel.to_entities(result.unique().scalars().all())
 
+    @replica_read
     def get_by_uuid(self, order_uuid: UUID) -> Order | None:
         """Retrieves an order by its uuid."""
         order = (
-            self._session.query(OrderPersistentModel)
-            .filter(OrderPersistentModel.uuid == order_uuid)
-            .first()
+            self._session.execute(self._queries.by_uuid("get_by_uuid", order_uuid))
+            .unique()
+            .scalar_one_or_none()
         )
 
         if order is None:
@@ -87,17 +169,28 @@ class SQLAlchemyOrderRepository(OrderRepository):
 
         return order.to_entity()
 
-    def list_orders_sorted_by_status(self, statuses: List[str]) -> List[Order]:
+    @replica_read
+    def list_orders_sorted_by_status(
+        self,
+        statuses: Sequence[OrderStatus],
+        page_size: int | None = None,
+        after: OrderPageCursor | None = None,
+    ) -> List[Order]:
         """Retrieves orders sorted by status.
 
+        Filtering and sorting both happen in the database: the statuses are ranked with a
+        `CASE` expression following their position in `statuses`, and ties are broken by
+        `(created_at, id)`. For the kitchen queue statuses the filter is served by the partial
+        `ix_orders_kitchen_queue` index, so finished orders are never read.
+
         Args:
-            statuses (List[str]): A list of order statuses to filter by.
+            statuses (Sequence[OrderStatus]): The statuses to filter by, in the order they
+             should be sorted.
+            page_size (int | None): The maximum number of orders to return, or None for all.
+            after (OrderPageCursor | None): The position of the last order of the previous page.
 
         Returns:
             List[Order]: A list of orders sorted by the given statuses.
         """
-        with self._session as session:
-            result = session.execute(
-                select(OrderPersistentModel).where(OrderPersistentModel.status.in_(statuses))
-            )
-            return [row.to_entity() for row in result.scalars().all()]
+        result = self._session.execute(self._queries.sorted_by_status(statuses, page_size, after))
+        return OrderPersistentModel.to_entities(result.unique().scalars().all())
@@ -1,15 +1,21 @@
+from typing import Collection, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.operators import eq
 
 from src.core.domain.entities import Payment
 from src.core.domain.entities.payment import PaymentStatus
-from src.core.domain.repositories import PaymentRepository
+from src.core.domain.repositories import PaymentRepository, PaymentStatusView
+from src.core.domain.value_objects import OrderStatus
 from src.infra.database.persistent_models.order_persistent_model import OrderPersistentModel
 from src.infra.database.persistent_models.payment_persistent_model import PaymentPersistentModel
 
+from ..config import replica_read
+from .loading_strategies import LoadingStrategy, order_graph_options
+from .projections import select_view, to_view
+
 
 class SQLAlchemyPaymentRepository(PaymentRepository):
     """Implementation of the PaymentRepository using SQLAlchemy."""
@@ -22,10 +28,19 @@ class SQLAlchemyPaymentRepository(PaymentRepository):
         """
         self._session = session
 
+    @replica_read
     def get_by_uuid(self, uuid: UUID) -> Payment | None:
-        """Retrieves a payment by its UUID."""
+        """Retrieves a payment by its UUID, along with its whole order graph."""
         result: PaymentPersistentModel | None = (
-            self._session.query(PaymentPersistentModel).filter_by(uuid=uuid).first()
+            self._session.execute(
+                select(PaymentPersistentModel)
+                .options(
+                    *order_graph_options(LoadingStrategy.JOINED, via=PaymentPersistentModel.order)
+                )
+                .where(eq(PaymentPersistentModel.uuid, uuid))
+            )
+            .unique()
+            .scalar_one_or_none()
         )
 
         return result.to_entity() if result else None
@@ -40,36 +55,83 @@ class SQLAlchemyPaymentRepository(PaymentRepository):
 
         return db_payment.to_entity()
 
-    def get_payment_details(self, order_uuid: UUID) -> Payment | None:
-        """Get a payment by Order UUID.
+    @replica_read
+    def get_status_view(self, order_uuid: UUID) -> PaymentStatusView | None:
+        """Get the status of the payment of an order, without loading the payment.
 
         Args:
             order_uuid: The order's UUID.
 
         Returns:
-            Payment if found, None otherwise.
+            PaymentStatusView if found, None otherwise.
         """
-        stmt = (
-            select(PaymentPersistentModel)
-            .join(OrderPersistentModel, PaymentPersistentModel.order_id == OrderPersistentModel.id)
-            .where(eq(OrderPersistentModel.uuid, order_uuid))
-        )
-        return self._session.execute(stmt).scalar_one_or_none()
-
-    def update_status(self, payment_id: int, status: PaymentStatus) -> Payment | None:
-        """Updates the status of an existing payment in the repository."""
-        db_payment: PaymentPersistentModel | None = (
-            self._session.query(PaymentPersistentModel).filter_by(id=payment_id).first()
+        row = self._session.execute(
+            select_view(PaymentStatusView, PaymentPersistentModel)
+            .join_from(
+                PaymentPersistentModel.__table__,
+                OrderPersistentModel.__table__,
+                PaymentPersistentModel.__table__.c.order_id == OrderPersistentModel.__table__.c.id,
+            )
+            .where(OrderPersistentModel.__table__.c.uuid == order_uuid)
+        ).first()
+        return to_view(PaymentStatusView, row)
+
+    def confirm(
+        self,
+        uuid: UUID,
+        status: PaymentStatus,
+        from_statuses: Collection[PaymentStatus],
+        order_status: OrderStatus | None = None,
+        order_from_statuses: Collection[OrderStatus] = (),
+    ) -> bool:
+        """Sets the status of a payment and, optionally, the status of its order.
+
+        Each update is a single compare-and-set `UPDATE ... RETURNING` that filters on the
+        current status, so at most two statements run before the commit, and the transaction
+        is rolled back if any of them matches no row.
+        """
+        order_id = self._session.scalar(
+            update(PaymentPersistentModel)
+            .where(
+                eq(PaymentPersistentModel.uuid, uuid),
+                PaymentPersistentModel.status.in_(from_statuses),
+            )
+            .values(status=status)
+            .returning(PaymentPersistentModel.order_id)
+            .execution_options(synchronize_session=False)
         )
 
-        if db_payment is None:
-            return None
+        if order_id is not None and order_status is not None:
+            order_id = self._session.scalar(
+                update(OrderPersistentModel)
+                .where(
+                    eq(OrderPersistentModel.id, order_id),
+                    OrderPersistentModel.status.in_(order_from_statuses),
+                )
+                .values(status=order_status)
+                .returning(OrderPersistentModel.id)
+                .execution_options(synchronize_session=False)
+            )
+
+        if order_id is None:
+            self._session.rollback()
+            return False
 
-        db_payment.status = status
         self._session.commit()
-        self._session.refresh(db_payment)
-
-        return db_payment.to_entity()
+        return True
+
+    @replica_read
+    def get_statuses(self, uuid: UUID) -> Tuple[PaymentStatus, OrderStatus] | None:
+        """Get the current status of a payment and the one of its order, without loading them."""
+        return (
+            self._session.execute(
+                select(PaymentPersistentModel.status, OrderPersistentModel.status)
+                .join(PaymentPersistentModel.order)
+                .where(eq(PaymentPersistentModel.uuid, uuid))
+            )
+            .tuples()
+            .one_or_none()
+        )
 
 
 __all__ = ["SQLAlchemyPaymentRepository"]
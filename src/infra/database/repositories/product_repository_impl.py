@@ -1,14 +1,18 @@
-from typing import Iterable, Set
-from uuid import UUID
+from itertools import batched
+from typing import Iterable, List, Sequence, Set
+from uuid import UUID, uuid4
 
-from sqlalchemy import delete
+from sqlalchemy import Numeric, cast, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.operators import eq
 
 from src.core.domain.entities import Product
+from src.core.domain.exceptions import InvalidPriceChangeError
 from src.core.domain.repositories.product_repository import ProductRepository
 from src.core.domain.value_objects import Category
 
+from ..config import replica_read
 from ..persistent_models.product_persistent_model import ProductPersistentModel
 
 
@@ -18,6 +22,9 @@ class SQLAlchemyProductRepository(ProductRepository):
     This repository uses an SQLAlchemy session to perform CRUD operations on products.
     """
 
+    UPSERT_BATCH_SIZE = 1000
+    """The number of rows written by each multi-row `INSERT` of `upsert_by_name`."""
+
     def __init__(self, session: Session) -> None:
         """Initializes the SQLAlchemyProductRepository with a given session.
 
@@ -40,7 +47,7 @@ class SQLAlchemyProductRepository(ProductRepository):
             category=product.category,
             price=product.price,
             description=product.description,
-            images=product.images,
+            images=list(product.images),
         )
 
         self._session.add(db_product)
@@ -70,7 +77,7 @@ class SQLAlchemyProductRepository(ProductRepository):
         db_product.category = product.category
         db_product.price = product.price
         db_product.description = product.description
-        db_product.images = product.images
+        db_product.images = list(product.images)
 
         self._session.commit()
         self._session.refresh(db_product)
@@ -90,6 +97,21 @@ class SQLAlchemyProductRepository(ProductRepository):
         )
         self._session.commit()
 
+    def list_all(self) -> List[Product]:
+        """Retrieves every product of the catalog, in the order they were created.
+
+        Unlike the other lookups, it always reads from the primary: it loads the catalog cache,
+        which a lagging replica would fill with data older than the last write.
+
+        Returns:
+            List[Product]: All the products.
+        """
+        result = self._session.scalars(
+            select(ProductPersistentModel).order_by(ProductPersistentModel.id)
+        )
+        return [p.to_entity() for p in result]
+
+    @replica_read
     def get_by_category(self, category: Category) -> Iterable[Product]:
         """Retrieves all products in a given category.
 
@@ -107,8 +129,12 @@ class SQLAlchemyProductRepository(ProductRepository):
 
         return [p.to_entity() for p in result]
 
+    @replica_read
     def get_by_name(self, name: str) -> Product | None:
-        """Retrieves a product by its name.
+        """Retrieves a product by its name, ignoring case.
+
+        The lookup compares `lower(name)` so it can be served by the `ix_products_lower_name`
+        index; unlike `ILIKE`, `%` and `_` in the name are not treated as wildcards.
 
         Args:
             name (str): The name of the product to retrieve.
@@ -118,7 +144,7 @@ class SQLAlchemyProductRepository(ProductRepository):
         """
         result: ProductPersistentModel | None = (
             self._session.query(ProductPersistentModel)
-            .filter(ProductPersistentModel.name.ilike(name))
+            .filter(eq(func.lower(ProductPersistentModel.name), name.lower()))
             .first()
         )
 
@@ -127,6 +153,7 @@ class SQLAlchemyProductRepository(ProductRepository):
 
         return result.to_entity()
 
+    @replica_read
     def get_by_uuids(self, product_uuids: Set[UUID]) -> Iterable[Product]:
         """Retrieves products by their UUIDs.
 
@@ -143,6 +170,7 @@ class SQLAlchemyProductRepository(ProductRepository):
         )
         return [p.to_entity() for p in result]
 
+    @replica_read
     def get_by_uuid(self, product_uuid: UUID) -> Product | None:
         """Retrieves a product by its UUID.
 
@@ -163,5 +191,99 @@ class SQLAlchemyProductRepository(ProductRepository):
 
         return result.to_entity()
 
+    def upsert_by_name(self, products: Sequence[Product]) -> List[Product]:
+        """Creates the given products, or updates the existing ones with the same name.
+
+        Products are written with multi-row `INSERT ... ON CONFLICT (name) DO UPDATE`
+        statements, `UPSERT_BATCH_SIZE` rows at a time, and committed once. Since the unique
+        constraint on `name` is case-sensitive, the names of the existing products are looked up
+        first, ignoring case, so an update keeps the stored spelling.
+
+        Args:
+            products: The products to create or update. Their names must be unique, ignoring
+             case.
+
+        Returns:
+            List[Product]: The stored products, in the same order as `products`.
+        """
+        if not products:
+            return []
+
+        lower_names = [product.name.lower() for product in products]
+        stored_names = dict(
+            self._session.execute(
+                select(func.lower(ProductPersistentModel.name), ProductPersistentModel.name).where(
+                    func.lower(ProductPersistentModel.name).in_(lower_names)
+                )
+            ).all()
+        )
+
+        rows = [
+            {
+                "uuid": uuid4(),
+                "name": stored_names.get(lower_name, product.name),
+                "category": product.category,
+                "price": product.price,
+                "description": product.description,
+                "images": list(product.images),
+            }
+            for product, lower_name in zip(products, lower_names, strict=True)
+        ]
+
+        by_name = {}
+        for batch in batched(rows, self.UPSERT_BATCH_SIZE):
+            stmt = insert(ProductPersistentModel).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ProductPersistentModel.name],
+                set_={
+                    "category": stmt.excluded.category,
+                    "price": stmt.excluded.price,
+                    "description": stmt.excluded.description,
+                    "images": stmt.excluded.images,
+                    "updated_at": func.now(),
+                },
+            ).returning(ProductPersistentModel)
+            for db_product in self._session.scalars(
+                stmt, execution_options={"populate_existing": True}
+            ):
+                by_name[db_product.name] = db_product.to_entity()
+
+        self._session.commit()
+        return [by_name[row["name"]] for row in rows]
+
+    def change_prices_by_category(self, category: Category, factor: float) -> List[Product]:
+        """Multiplies the price of every product in a category by the given factor.
+
+        The whole category is repriced by a single `UPDATE ... RETURNING`, which is rolled back
+        if any new price is not positive: the stored prices are restored without validation, so
+        a zero price would reach the clients.
+
+        Args:
+            category: The category whose products are repriced.
+            factor: The factor applied to each price, e.g. 1.1 for a 10% increase. New prices are
+             rounded to cents.
+
+        Returns:
+            List[Product]: The repriced products.
+
+        Raises:
+            InvalidPriceChangeError: If a new price would round to zero or less, in which case no
+             price changes.
+        """
+        result = self._session.scalars(
+            update(ProductPersistentModel)
+            .where(eq(ProductPersistentModel.category, category))
+            .values(price=func.round(cast(ProductPersistentModel.price * factor, Numeric), 2))
+            .returning(ProductPersistentModel),
+            execution_options={"populate_existing": True, "synchronize_session": False},
+        )
+        products = [db_product.to_entity() for db_product in result]
+        if any(product.price <= 0 for product in products):
+            self._session.rollback()
+            raise InvalidPriceChangeError(factor)
+
+        self._session.commit()
+        return products
+
 
 __all__ = ["SQLAlchemyProductRepository"]
@@ -0,0 +1,36 @@
+from dataclasses import fields
+from functools import cache
+from typing import Callable, Sequence, Type, TypeVar
+
+from sqlalchemy import Column, Row, Select, select
+
+from ..persistent_models.persistent_model import PersistentModel
+
+V = TypeVar("V")
+
+
+@cache
+def view_columns(view: Type[V], model: Type[PersistentModel]) -> Sequence[Column]:
+    """Returns the table columns of `model` that fill the fields of the `view` dataclass.
+
+    Columns are matched to fields by name and follow the order of the fields, so a row selected
+    from them can be passed positionally to the view.
+    """
+    return tuple(model.__table__.c[field.name] for field in fields(view))
+
+
+def select_view(view: Type[V], model: Type[PersistentModel]) -> Select:
+    """Builds a SELECT of the columns that fill the `view` dataclass.
+
+    The statement targets table columns, not mapped entities: rows are plain tuples, never added
+    to the session identity map, and no entity nor value object is built from them.
+    """
+    return select(*view_columns(view, model))
+
+
+def to_view(view: Callable[..., V], row: Row | None) -> V | None:
+    """Builds a view from a row selected by `select_view`, None if there is no row."""
+    return view(*row) if row is not None else None
+
+
+__all__ = ["select_view", "to_view", "view_columns"]
@@ -0,0 +1,86 @@
+from typing import Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import create_app
+from src.api.schemas import CustomerCreationIn
+from src.config import settings
+from src.core.domain.entities import Customer, Product
+from src.infra.database.config.database import Session
+from tests.factories.adapter.driver.api.schemas import CustomerCreationInFactory
+from tests.infra.database.repositories.test_payment_repository_impl import _create_payment
+
+
+@pytest.fixture
+def async_client() -> Iterator[TestClient]:
+    """A client of an app serving the read endpoints with the asyncio stack."""
+    app = create_app(settings.model_copy(update={"ASYNC_ENDPOINTS": True}))
+
+    with TestClient(app) as c:
+        yield c
+
+
+def test_get_customer_returns_the_customer_created_by_the_sync_endpoint(
+    client: TestClient, async_client: TestClient
+) -> None:
+    customer_data: CustomerCreationIn = CustomerCreationInFactory()
+    created = client.post("/api/customer", json=customer_data.model_dump())
+
+    response = async_client.get(f"/api/customer/{customer_data.cpf}")
+
+    assert response.status_code == 200
+    assert response.json() == created.json()
+
+
+def test_get_unknown_customer_returns_not_found(async_client: TestClient) -> None:
+    customer_data: CustomerCreationIn = CustomerCreationInFactory()
+
+    response = async_client.get(f"/api/customer/{customer_data.cpf}")
+
+    assert response.status_code == 404
+
+
+def test_list_orders_matches_the_sync_endpoint(
+    client: TestClient, async_client: TestClient
+) -> None:
+    response = async_client.get("/api/orders", params={"page_size": 5})
+
+    assert response.status_code == 200
+    assert response.json() == client.get("/api/orders", params={"page_size": 5}).json()
+
+
+def test_invalid_cursor_returns_bad_request(async_client: TestClient) -> None:
+    response = async_client.get("/api/orders/orders-sorted-by-status", params={"cursor": "nope"})
+
+    assert response.status_code == 400
+
+
+def test_get_payment_status_matches_the_sync_endpoint(
+    client: TestClient,
+    async_client: TestClient,
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    payment = _create_payment(db_session, create_customer_in_db, create_products_in_db)
+    url = f"/api/payment/{payment.uuid}/status"
+    params = {"order_uuid": str(payment.order.uuid)}
+
+    response = async_client.get(url, params=params)
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "pending", "number": str(payment.uuid)}
+    assert response.json() == client.get(url, params=params).json()
+
+
+def test_get_products_by_category_shares_its_validators_with_the_sync_endpoint(
+    client: TestClient, async_client: TestClient, create_products_in_db: List[Product]
+) -> None:
+    params = {"category": create_products_in_db[0].category}
+    etag = client.get("/api/products", params=params).headers["etag"]
+
+    response = async_client.get("/api/products", params=params, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
@@ -0,0 +1,14 @@
+from fastapi.testclient import TestClient
+
+
+def test_metrics_exposes_the_pool_metrics(client: TestClient) -> None:
+    client.get("/api/orders")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "db_pool_saturation " in response.text
+    assert 'cache_hits_total{cache="customer"} ' in response.text
+    assert 'cache_coalesced_total{cache="product"} ' in response.text
+    assert 'db_pool_checkout_wait_seconds_bucket{le="+Inf"} ' in response.text
@@ -0,0 +1,93 @@
+import json
+from typing import List
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from src.core.domain.entities import Customer, Product
+from src.core.domain.value_objects import OrderStatus
+from src.infra.database.config.database import Session, engine
+from src.infra.database.repositories import SQLAlchemyOrderRepository
+from tests.infra.database.repositories.test_order_repository_impl import _create_orders
+
+
+def test_update_order_statuses_reports_the_rejected_orders(
+    client: TestClient,
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(
+        db_session, create_customer_in_db, create_products_in_db, 2, OrderStatus.RECEIVED
+    )
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 1, OrderStatus.READY)
+    received, ready = [], []
+    for order in SQLAlchemyOrderRepository(db_session).list_all():
+        (received if order.status == OrderStatus.RECEIVED else ready).append(str(order.uuid))
+    unknown = str(uuid4())
+
+    response = client.put(
+        "/api/orders/status",
+        json={"order_uuids": [*received, *ready, unknown], "status": "processing"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "processing",
+        "updated": received,
+        "rejected": [
+            {"uuid": ready[0], "reason": "Invalid status transition from ready to processing"},
+            {"uuid": unknown, "reason": f"Order with uuid '{unknown}' not found."},
+        ],
+    }
+
+
+def test_stream_orders_sends_a_json_array(
+    client: TestClient,
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 3)
+    orders = SQLAlchemyOrderRepository(db_session).list_all()
+    expected = [str(o.uuid) for o in sorted(orders, key=lambda o: (o.created_at, o.id))]
+    db_session.close()
+
+    response = client.get("/api/orders/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    orders = response.json()
+    assert [order["number"] for order in orders] == expected
+    assert all(len(order["items"]) == len(create_products_in_db) for order in orders)
+    assert engine.pool.checkedout() == 0
+
+
+def test_stream_orders_sends_one_order_per_line(
+    client: TestClient,
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 3)
+    orders = SQLAlchemyOrderRepository(db_session).list_all()
+    expected = [str(o.uuid) for o in sorted(orders, key=lambda o: (o.created_at, o.id))]
+    db_session.close()
+
+    response = client.get("/api/orders/stream", params={"format": "ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line)["number"] for line in lines] == expected
+    assert engine.pool.checkedout() == 0
+
+
+def test_stream_orders_sends_an_empty_array_without_orders(
+    client: TestClient,
+    db_session: Session,  # noqa: ARG001
+) -> None:
+    response = client.get("/api/orders/stream")
+
+    assert response.status_code == 200
+    assert response.json() == []
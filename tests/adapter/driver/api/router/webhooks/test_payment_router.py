@@ -0,0 +1,51 @@
+from http import HTTPStatus
+from typing import List
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from src.core.domain.entities import Customer, Product
+from src.core.domain.entities.payment import PaymentStatus
+from src.core.domain.value_objects import OrderStatus
+from src.infra.database.config.database import Session
+from src.infra.database.repositories import SQLAlchemyPaymentRepository
+from tests.infra.database.repositories.test_payment_repository_impl import _create_payment
+
+
+def test_an_approved_payment_moves_its_order_to_received(
+    client: TestClient,
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    payment = _create_payment(db_session, create_customer_in_db, create_products_in_db)
+
+    response = client.post(f"/webhooks/payment/{payment.uuid}/result", json={"status": "approved"})
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert SQLAlchemyPaymentRepository(db_session).get_statuses(payment.uuid) == (
+        PaymentStatus.APPROVED,
+        OrderStatus.RECEIVED,
+    )
+
+
+def test_a_payment_cannot_be_confirmed_twice(
+    client: TestClient,
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    payment = _create_payment(db_session, create_customer_in_db, create_products_in_db)
+    url = f"/webhooks/payment/{payment.uuid}/result"
+    client.post(url, json={"status": "approved"})
+
+    response = client.post(url, json={"status": "rejected"})
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()["detail"] == "Invalid status transition from approved to rejected"
+
+
+def test_confirming_an_unknown_payment_is_not_found(client: TestClient) -> None:
+    response = client.post(f"/webhooks/payment/{uuid4()}/result", json={"status": "approved"})
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,123 @@
+import re
+import subprocess  # noqa: S404
+import sys
+from typing import Dict
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import create_app
+from src.config import settings
+from src.core.domain.value_objects import Category
+from src.infra.cache import customer_cache
+from src.infra.database.config import (
+    EngineSettingsConflictError,
+    get_async_engine,
+    get_engine,
+    init_async_engines,
+)
+
+IMPORT_BUDGET_US = 1_000_000
+"""The cumulative import time of `src.api` allowed, about twice what it takes on a laptop.
+
+It took over a second when importing the package built the application and its engines.
+"""
+
+_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)")
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """Runs the code in a fresh interpreter and returns the import time of each module, in us."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        match[2]: int(match[1])
+        for match in map(_LINE.match, completed.stderr.splitlines())
+        if match
+    }
+
+
+def test_importing_the_package_stays_within_budget() -> None:
+    times = _import_times("import src.api")
+
+    assert times["src.api"] < IMPORT_BUDGET_US
+
+
+def test_importing_the_package_builds_nothing() -> None:
+    times = _import_times("import src.api")
+
+    assert "src.api.routers" not in times
+    assert "src.infra.database.config" not in times
+    assert "sqlalchemy" not in times
+
+
+def test_building_the_app_creates_no_engine() -> None:
+    code = (
+        "import src.api; src.api.create_app();"
+        "from src.infra.database.config import database;"
+        "assert database._engines is None"
+    )
+
+    _import_times(code)
+
+
+def test_create_app_follows_the_given_settings() -> None:
+    app = create_app(
+        settings.model_copy(
+            update={
+                "DOCS_URL": "/documentation",
+                "PRODUCT_LIST_MAX_AGE": 42,
+                "CUSTOMER_CACHE_SIZE": 7,
+            }
+        )
+    )
+
+    try:
+        with TestClient(app) as client:
+            assert client.get("/documentation").status_code == 200
+            products = client.get("/api/products", params={"category": Category.LANCHE.value})
+            assert products.headers["Cache-Control"] == "public, max-age=42"
+            assert customer_cache.stats().max_size == 7
+    finally:
+        with TestClient(create_app()):
+            pass
+
+    assert customer_cache.stats().max_size == settings.CUSTOMER_CACHE_SIZE
+
+
+def test_an_app_with_other_database_settings_fails_to_start() -> None:
+    app = create_app(settings.model_copy(update={"DB_POOL_SIZE": 1}))
+
+    with pytest.raises(EngineSettingsConflictError), TestClient(app):
+        pass
+
+
+def test_shutting_down_closes_the_pooled_connections() -> None:
+    with TestClient(create_app()):
+        get_engine().connect().close()
+        assert get_engine().pool.checkedin() > 0
+
+    assert get_engine().pool.checkedin() == 0
+
+
+def test_an_app_with_other_async_database_settings_fails_to_start() -> None:
+    init_async_engines(settings)
+    app = create_app(settings.model_copy(update={"DB_ASYNC_DRIVER": "postgresql+psycopg"}))
+
+    with pytest.raises(EngineSettingsConflictError), TestClient(app):
+        pass
+
+
+def test_the_async_engine_follows_the_settings_of_the_app() -> None:
+    with TestClient(create_app()):
+        url = get_async_engine().url
+
+    assert (url.drivername, url.host, url.database) == (
+        settings.DB_ASYNC_DRIVER,
+        settings.DB_HOST,
+        settings.DB_NAME,
+    )
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+
+from src.api.conditional_requests import Validators, cache_control
+
+UPDATED_AT = datetime(2024, 5, 1, 12, 30, 15, 250_000, tzinfo=timezone.utc)
+
+
+def test_the_etag_changes_with_the_number_and_the_update_time_of_the_items() -> None:
+    validators = Validators.of_listing([UPDATED_AT, UPDATED_AT - timedelta(days=1)])
+
+    assert validators.last_modified == UPDATED_AT
+    assert validators != Validators.of_listing([UPDATED_AT])
+    assert validators != Validators.of_listing([UPDATED_AT + timedelta(microseconds=1), None])
+    assert Validators.of_listing([]) == Validators(etag='"0-0"', last_modified=None)
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since() -> None:
+    validators = Validators.of_listing([UPDATED_AT])
+    last_modified = validators.headers("no-cache")["Last-Modified"]
+
+    assert validators.is_not_modified({"if-none-match": f'"other", W/{validators.etag}'})
+    assert validators.is_not_modified({"if-modified-since": last_modified})
+    assert not validators.is_not_modified({
+        "if-none-match": '"other"',
+        "if-modified-since": last_modified,
+    })
+    assert not validators.is_not_modified({"if-modified-since": "Tue, 30 Apr 2024 00:00:00 GMT"})
+    assert not validators.is_not_modified({"if-modified-since": "yesterday"})
+
+
+def test_a_non_utc_last_modified_is_sent_and_compared_in_gmt() -> None:
+    sao_paulo = timezone(timedelta(hours=-3))
+    validators = Validators.of_listing([UPDATED_AT.astimezone(sao_paulo)])
+
+    headers = validators.headers("no-cache")
+
+    assert headers["Last-Modified"] == "Wed, 01 May 2024 12:30:15 GMT"
+    assert validators.is_not_modified({"if-modified-since": headers["Last-Modified"]})
+    assert not validators.is_not_modified({"if-modified-since": "Wed, 01 May 2024 12:30:14 GMT"})
+
+
+def test_cache_control_revalidates_when_max_age_is_zero() -> None:
+    assert cache_control(5) == "public, max-age=5"
+    assert cache_control(0) == "public, no-cache"
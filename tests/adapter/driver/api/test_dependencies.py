@@ -0,0 +1,26 @@
+import asyncio
+from typing import Tuple
+
+from src.api.controllers import OrderController
+from src.api.dependencies import injector
+from src.api.request_scope import request_scope
+from src.core.domain.repositories import OrderRepository
+from src.core.use_cases import ListOrdersUseCase
+
+
+def test_controllers_are_shared_and_resolved_outside_a_request() -> None:
+    assert injector.get(OrderController) is injector.get(OrderController)
+
+
+def test_repositories_are_shared_within_a_request_only() -> None:
+    async def resolve() -> Tuple[ListOrdersUseCase, ListOrdersUseCase]:
+        async with request_scope("GET /test"):
+            return injector.get(ListOrdersUseCase), injector.get(ListOrdersUseCase)
+
+    first, second = asyncio.run(resolve())
+    other, _ = asyncio.run(resolve())
+
+    assert first is not second
+    assert first.repository is second.repository
+    assert isinstance(first.repository, OrderRepository)
+    assert other.repository is not first.repository
@@ -0,0 +1,71 @@
+from typing import Dict, Iterator
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.api import create_app
+from src.api.read_your_writes import PRIMARY_READS_COOKIE, reads_from_primary
+from src.api.request_scope import current_request
+from src.config import settings
+
+
+def _app(window: float) -> FastAPI:
+    """An app with probes that report whether their request may read from the replica."""
+    app = create_app(settings.model_copy(update={"DB_READ_YOUR_WRITES_WINDOW": window}))
+
+    @app.get("/probe")
+    def read() -> Dict[str, bool]:
+        return {"read_only": current_request().read_only}
+
+    @app.post("/probe")
+    def write(fail: bool = False) -> Dict[str, bool]:
+        if fail:
+            raise HTTPException(status_code=400)
+        return {"read_only": current_request().read_only}
+
+    return app
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with TestClient(_app(window=5)) as c:
+        yield c
+
+
+def test_reads_stay_on_the_primary_after_the_client_writes(client: TestClient) -> None:
+    assert client.get("/probe").json() == {"read_only": True}
+
+    written = client.post("/probe")
+
+    assert written.json() == {"read_only": False}
+    assert PRIMARY_READS_COOKIE in written.cookies
+    assert client.get("/probe").json() == {"read_only": False}
+
+
+def test_other_clients_keep_reading_from_the_replica(client: TestClient) -> None:
+    client.post("/probe")
+
+    with TestClient(client.app) as other:
+        assert other.get("/probe").json() == {"read_only": True}
+
+
+def test_failed_writes_open_no_window(client: TestClient) -> None:
+    assert PRIMARY_READS_COOKIE not in client.post("/probe", params={"fail": True}).cookies
+    assert client.get("/probe").json() == {"read_only": True}
+
+
+def test_a_zero_window_is_disabled() -> None:
+    with TestClient(_app(window=0)) as client:
+        assert PRIMARY_READS_COOKIE not in client.post("/probe").cookies
+        client.cookies.set(PRIMARY_READS_COOKIE, "9999999999")
+        assert client.get("/probe").json() == {"read_only": True}
+
+
+def test_the_window_closes_after_its_end() -> None:
+    cookies = {PRIMARY_READS_COOKIE: "1000.000"}
+
+    assert reads_from_primary(cookies, now=999.9)
+    assert not reads_from_primary(cookies, now=1000.0)
+    assert not reads_from_primary({PRIMARY_READS_COOKIE: "soon"}, now=0)
+    assert not reads_from_primary({}, now=0)
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from src.api.dependencies import injector
+from src.api.request_scope import OutsideRequestError, request_scope
+from src.infra.database.config import leak_detector
+from src.infra.database.config.database import engine
+
+
+def test_session_is_shared_within_a_request_and_closed_at_its_end() -> None:
+    checked_out_before = engine.pool.checkedout()
+
+    async def handle_request() -> None:
+        async with request_scope("GET /test") as context:
+            first = await run_in_threadpool(injector.get, Session)
+            second = await run_in_threadpool(injector.get, Session)
+            first.execute(text("SELECT 1"))
+
+            assert first is second
+            assert engine.pool.checkedout() == checked_out_before + 1
+
+        assert leak_detector.held_by(context) == []
+
+    asyncio.run(handle_request())
+
+    assert engine.pool.checkedout() == checked_out_before
+
+
+def test_each_request_gets_its_own_session() -> None:
+    async def resolve_session() -> Session:
+        async with request_scope("GET /test"):
+            return injector.get(Session)
+
+    assert asyncio.run(resolve_session()) is not asyncio.run(resolve_session())
+
+
+def test_request_scoped_dependency_outside_a_request_fails() -> None:
+    with pytest.raises(OutsideRequestError):
+        injector.get(Session)
@@ -0,0 +1,43 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.api.presenters import OrderDetailsPresenter
+from src.api.responses import TrustedJSONResponse
+from src.api.schemas import OrderPageOut
+from src.core.domain.value_objects import OrderStatus
+from src.core.use_cases.order import CustomerSummaryResult, OrderItemResult, OrderResult
+
+
+def _order_result(customer: CustomerSummaryResult) -> OrderResult:
+    now = datetime.now(timezone.utc)
+    return OrderResult(
+        uuid=uuid4(),
+        created_at=now,
+        updated_at=now,
+        status=OrderStatus.PROCESSING,
+        total_value=12.5,
+        customer=customer,
+        items=[OrderItemResult(product_name="X-Burger", quantity=2, unit_price=6.25)],
+    )
+
+
+def test_trusted_response_matches_the_validated_fastapi_response() -> None:
+    customer = CustomerSummaryResult(name="João", email="joao@example.com", cpf="52998224725")
+    page = OrderPageOut(
+        items=OrderDetailsPresenter().present_many([_order_result(customer) for _ in range(3)]),
+        next_cursor=None,
+    )
+    field = create_response_field(name="Response", type_=OrderPageOut)
+
+    validated = asyncio.run(serialize_response(field=field, response_content=page))
+    trusted = TrustedJSONResponse(page, OrderPageOut)
+
+    assert trusted.body == JSONResponse(validated).body
+    assert trusted.headers["content-type"] == "application/json"
+    assert json.loads(trusted.body)["items"][0]["customer"]["cpf"] == "52998224725"
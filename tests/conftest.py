@@ -4,6 +4,7 @@ from sqlalchemy import MetaData, delete
 
 from src.api import app
 from src.core.domain.entities import Customer, Product
+from src.infra.cache import customer_cache, product_cache
 from src.infra.database.config.database import Session, engine, get_db_session
 from src.infra.database.repositories import (
     SQlAlchemyCustomerRepository,
@@ -28,6 +29,8 @@ def db_session() -> Session:
         if table.name != "alembic_version":
             session.execute(delete(table))
     session.commit()
+    customer_cache.clear()
+    product_cache.clear()
 
     yield session
     session.close()
@@ -0,0 +1,28 @@
+from src.core.domain.base import InternCache
+
+
+def test_intern_keeps_the_first_value() -> None:
+    cache: InternCache[str, object] = InternCache(max_size=2)
+    first = object()
+
+    assert cache.intern("key", first) is first
+    assert cache.intern("key", object()) is first
+    assert cache.get("key") is first
+
+
+def test_intern_evicts_the_oldest_value_once_full() -> None:
+    cache: InternCache[str, int] = InternCache(max_size=2)
+
+    for key, value in (("a", 1), ("b", 2), ("c", 3)):
+        cache.intern(key, value)
+
+    assert cache.get("a") is None
+    assert (cache.get("b"), cache.get("c")) == (2, 3)
+    assert len(cache) == 2
+
+
+def test_intern_with_no_room_interns_nothing() -> None:
+    cache: InternCache[str, int] = InternCache(max_size=0)
+
+    assert cache.intern("a", 1) == 1
+    assert cache.get("a") is None
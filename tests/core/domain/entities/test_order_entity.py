@@ -0,0 +1,110 @@
+import copy
+from dataclasses import FrozenInstanceError
+from typing import List
+
+import pytest
+
+from src.core.domain.entities import Customer, Order, OrderItem
+from src.core.domain.exceptions import DomainError
+from src.core.domain.value_objects import CPF, Email
+from tests.factories import CPFProvider
+from tests.factories.core.domain.entities.product_factory import ProductFactory
+
+
+def _items() -> List[OrderItem]:
+    return [
+        OrderItem(product=product, quantity=2, unit_price=float(product.price))
+        for product in ProductFactory.build_batch(2)
+    ]
+
+
+def _customer() -> Customer:
+    return Customer(
+        name="John Doe",
+        cpf=CPF(CPFProvider.generate_cpf_number()),
+        email=Email("john.doe@example.com"),
+    )
+
+
+def test_order_items_are_read_without_being_copied() -> None:
+    """Test that the items of an order are an immutable tuple shared by every read."""
+    items = _items()
+
+    order = Order(_customer=_customer(), _items=items)
+
+    assert order.items == tuple(items)
+    assert order.items is order.items
+    assert order.items[0] is items[0]
+    assert order.total_value == sum(item.unit_price * 2 for item in items)
+
+
+def test_order_items_cannot_be_changed_through_the_given_list() -> None:
+    """Test that the list given on creation no longer changes the order."""
+    items = _items()
+    order = Order(_customer=_customer(), _items=items)
+
+    items.clear()
+
+    assert len(order.items) == 2
+
+
+def test_order_items_cannot_be_changed_through_items() -> None:
+    """Test that neither an item nor its product can be changed, so the total never goes stale."""
+    order = Order(_customer=_customer(), _items=_items())
+    total_value = order.total_value
+
+    with pytest.raises(FrozenInstanceError):
+        order.items[0].quantity = 99
+    with pytest.raises(FrozenInstanceError):
+        order.items[0].product.price = 0.01
+    with pytest.raises(FrozenInstanceError):
+        del order.items[0].unit_price
+    with pytest.raises(AttributeError):
+        order.items[0].product.images.append("https://example.com/changed.png")
+
+    assert order.total_value == total_value
+
+
+def test_frozen_entities_can_be_copied_and_restored() -> None:
+    """Test that copies and restored entities are built once, then frozen as well."""
+    item = _items()[0]
+
+    copied = copy.deepcopy(item)
+    restored = OrderItem.restore(product=item.product, quantity=1, unit_price=2.0)
+
+    assert copied == item
+    assert isinstance(item.product.images, tuple)
+    with pytest.raises(FrozenInstanceError):
+        restored.quantity = 2
+
+
+def test_order_without_items_is_invalid() -> None:
+    """Test that an order must have items."""
+    with pytest.raises(DomainError, match="Items are required"):
+        Order(_customer=_customer(), _items=[])
+
+
+def test_order_is_slotted_and_keeps_its_id() -> None:
+    """Test that orders and their items hold no per-instance dictionary."""
+    order = Order(_id=7, _customer=_customer(), _items=_items())
+
+    assert order.id == 7
+    assert not hasattr(order, "__dict__")
+    assert not hasattr(order.items[0], "__dict__")
+    assert not hasattr(order.customer, "__dict__")
+
+
+def test_restore_keeps_the_stored_state_without_validating_it() -> None:
+    """Test that a restored order keeps its stored total and skips validation."""
+    order = Order.restore(_id=7, _customer=_customer(), _items=(), _total_value=12.5)
+
+    assert order.id == 7
+    assert order.items == ()
+    assert order.total_value == 12.5
+    assert order.uuid is None
+
+
+def test_restore_requires_the_fields_without_a_default() -> None:
+    """Test that restoring an order without its customer fails."""
+    with pytest.raises(KeyError, match="_customer"):
+        Order.restore(_items=tuple(_items()))
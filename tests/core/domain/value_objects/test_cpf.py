@@ -95,3 +95,29 @@ def test_clean_cpf() -> None:
 def test_str(cpf_number: str, expected: str) -> None:
     cpf = CPF(cpf_number)
     assert str(cpf) == expected
+
+
+def test_restore_equals_the_validated_cpf() -> None:
+    """Test that a restored CPF equals the same CPF built by the constructor."""
+    restored = CPF.restore("10856446696")
+
+    assert restored == CPF("108.564.466-96")
+    assert hash(restored) == hash(CPF("10856446696"))
+    assert str(restored) == "10856446696"
+
+
+def test_repeated_cpfs_are_interned() -> None:
+    """Test that the same CPF, masked or not, is built once and shared."""
+    cpf = CPF("248.993.065-63")
+
+    assert CPF("248.993.065-63") is cpf
+    assert CPF("24899306563") is cpf
+    assert CPF.restore("24899306563") is cpf
+
+
+def test_a_restored_cpf_is_still_validated_by_the_constructor() -> None:
+    """Test that restoring an invalid CPF does not let the constructor skip its validation."""
+    CPF.restore("00000000001")
+
+    with pytest.raises(InvalidCpfError):
+        CPF("00000000001")
@@ -75,3 +75,18 @@ def test_static_method_is_valid(email: str, expected: bool) -> None:
 def test_str(email_address: str) -> None:
     email = Email(email_address)
     assert str(email) == email_address
+
+
+def test_repeated_emails_are_interned() -> None:
+    email = Email("interned@example.com")
+
+    assert Email("interned@example.com") is email
+    assert Email.restore("interned@example.com") is email
+    assert hash(email) == hash(Email("interned@example.com"))
+
+
+def test_a_restored_email_is_still_validated_by_the_constructor() -> None:
+    Email.restore("restored@invalid")
+
+    with pytest.raises(DomainError):
+        Email("restored@invalid")
@@ -0,0 +1,45 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.domain.entities import Order, OrderItem
+from src.core.domain.exceptions import InvalidCursorError
+from src.core.domain.value_objects import OrderStatus
+from src.core.use_cases.order.list.order_cursor import (
+    MAX_PAGE_SIZE,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+)
+from tests.factories.core.domain.entities.customer_factory import CustomerFactory
+from tests.factories.core.domain.entities.product_factory import ProductFactory
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2024, 5, 17, 12, 30, tzinfo=timezone.utc)
+    order = Order(
+        _id=42,
+        created_at=created_at,
+        _customer=CustomerFactory(),
+        _items=[OrderItem(product=ProductFactory(), quantity=1, unit_price=10.0)],
+        _status=OrderStatus.READY,
+    )
+
+    cursor = decode_cursor(encode_cursor(order))
+
+    assert cursor.created_at == created_at
+    assert cursor.id == 42
+    assert cursor.status == OrderStatus.READY
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "W10", "WyJ4IiwgMSwgInJlYWR5Il0"])
+def test_decode_cursor_rejects_malformed_tokens(token: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+@pytest.mark.parametrize(
+    "page_size, expected", [(0, 1), (-5, 1), (10, 10), (MAX_PAGE_SIZE + 1, MAX_PAGE_SIZE)]
+)
+def test_clamp_page_size(page_size: int, expected: int) -> None:
+    assert clamp_page_size(page_size) == expected
@@ -0,0 +1,117 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import Dict, List
+from uuid import UUID
+
+import pytest
+
+from src.core.domain.entities import Customer, Product
+from src.core.domain.exceptions import InvalidStatusTransitionError, OrderNotFoundError
+from src.core.domain.value_objects import OrderStatus
+from src.core.use_cases import UpdateOrderStatusUseCase
+from src.infra.database.config.database import Session, SessionLocal
+from src.infra.database.repositories import SQLAlchemyOrderRepository
+from tests.infra.database.repositories.test_order_repository_impl import _create_orders
+
+STATUS_CHAIN = list(OrderStatus)
+THREADS = 8
+
+
+def _order_uuids(session: Session) -> List[UUID]:
+    return [order.uuid for order in SQLAlchemyOrderRepository(session).list_all()]
+
+
+def _update_concurrently(attempts: Dict[int, List[tuple]]) -> Dict[int, List[tuple]]:
+    """Runs the status updates of each thread, all threads starting at the same time.
+
+    Returns the updates that succeeded, per thread.
+    """
+    barrier = Barrier(len(attempts))
+
+    def _run(thread_attempts: List[tuple]) -> List[tuple]:
+        session = SessionLocal()
+        use_case = UpdateOrderStatusUseCase(SQLAlchemyOrderRepository(session))
+        succeeded = []
+        barrier.wait()
+        try:
+            for order_uuid, status in thread_attempts:
+                try:
+                    use_case.update_status(order_uuid, status)
+                except InvalidStatusTransitionError:
+                    continue
+                succeeded.append((order_uuid, status))
+        finally:
+            session.close()
+        return succeeded
+
+    with ThreadPoolExecutor(max_workers=len(attempts)) as executor:
+        results = executor.map(_run, attempts.values())
+        return dict(zip(attempts, results, strict=True))
+
+
+def test_update_status_raises_when_the_transition_is_not_allowed(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 1)
+    use_case = UpdateOrderStatusUseCase(SQLAlchemyOrderRepository(db_session))
+    (order_uuid,) = _order_uuids(db_session)
+
+    with pytest.raises(InvalidStatusTransitionError):
+        use_case.update_status(order_uuid, OrderStatus.COMPLETED)
+
+
+def test_update_status_raises_when_the_order_does_not_exist(db_session: Session) -> None:
+    use_case = UpdateOrderStatusUseCase(SQLAlchemyOrderRepository(db_session))
+
+    with pytest.raises(OrderNotFoundError):
+        use_case.update_status(UUID(int=0), OrderStatus.RECEIVED)
+
+
+def test_only_one_of_concurrent_identical_transitions_succeeds(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(
+        db_session, create_customer_in_db, create_products_in_db, 1, OrderStatus.RECEIVED
+    )
+    (order_uuid,) = _order_uuids(db_session)
+
+    succeeded = _update_concurrently({
+        thread: [(order_uuid, OrderStatus.PROCESSING)] for thread in range(THREADS)
+    })
+
+    assert sum(len(updates) for updates in succeeded.values()) == 1
+
+
+def test_no_invalid_transition_happens_under_contention(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 5)
+    order_uuids = _order_uuids(db_session)
+    rng = random.Random(11)  # noqa: S311
+
+    succeeded = _update_concurrently({
+        thread: [(rng.choice(order_uuids), rng.choice(STATUS_CHAIN[1:])) for _ in range(40)]
+        for thread in range(THREADS)
+    })
+
+    statuses = SQLAlchemyOrderRepository(db_session).get_statuses(order_uuids)
+    for order_uuid in order_uuids:
+        applied = sorted(
+            (
+                status
+                for updates in succeeded.values()
+                for uuid, status in updates
+                if uuid == order_uuid
+            ),
+            key=STATUS_CHAIN.index,
+        )
+        # The chain is linear: every transition applied exactly once, in order, up to the
+        # current status.
+        assert applied == STATUS_CHAIN[1 : STATUS_CHAIN.index(statuses[order_uuid]) + 1]
@@ -41,7 +41,7 @@ def test_list_orders(
 
     response = client.get("/api/orders")
     assert response.status_code == 200
-    assert len(response.json()) > 0
+    assert len(response.json()["items"]) > 0
 
 
 def test_update_order_status(
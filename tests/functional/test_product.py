@@ -65,3 +65,98 @@ def test_get_products_by_category(client: TestClient) -> None:
     assert response.status_code == 200
     assert len(response.json()) > 0
     assert response.json()[0]["category"] == product_data.category
+
+
+@pytest.mark.usefixtures("db_session")
+def test_get_products_by_category_answers_unchanged_lists_with_304(client: TestClient) -> None:
+    product_data: ProductCreationIn = ProductCreationInFactory()
+    created = client.post("/api/products", json=product_data.model_dump()).json()
+    params = {"category": product_data.category}
+    first = client.get("/api/products", params=params)
+    etag = first.headers["etag"]
+
+    unchanged = client.get("/api/products", params=params, headers={"If-None-Match": etag})
+    not_modified_since = client.get(
+        "/api/products",
+        params=params,
+        headers={"If-Modified-Since": first.headers["last-modified"]},
+    )
+    client.put(f"/api/products/{created['uuid']}", json={**product_data.model_dump(), "price": 9})
+    changed = client.get("/api/products", params=params, headers={"If-None-Match": etag})
+
+    assert first.headers["cache-control"].startswith("public")
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["etag"] == etag
+    assert not_modified_since.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()[0]["price"] == 9
+
+
+@pytest.mark.usefixtures("db_session")
+def test_import_products_upserts_by_name_and_reports_invalid_rows(client: TestClient) -> None:
+    existing: ProductCreationIn = ProductCreationInFactory()
+    client.post("/api/products", json=existing.model_dump())
+    new: ProductCreationIn = ProductCreationInFactory()
+    update = {**existing.model_dump(), "name": existing.name.upper(), "price": 12.5}
+
+    response = client.post(
+        "/api/products/bulk",
+        json=[new.model_dump(), update, {**new.model_dump(), "price": -1}, new.model_dump()],
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [(p["name"], p["price"]) for p in body["products"]] == [
+        (new.name, new.price),
+        (existing.name, 12.5),
+    ]
+    assert [error["row"] for error in body["errors"]] == [3, 4]
+    assert body["errors"][1]["detail"] == "Product name already used by row 1"
+
+
+@pytest.mark.usefixtures("db_session")
+def test_import_products_accepts_csv(client: TestClient) -> None:
+    csv = (
+        "name,category,price,description,images\n"
+        "Burger,lanche,25.9,A juicy burger,https://img/1.png|https://img/2.png\n"
+        "Fries,acompanhamento,not a price,Crispy fries,https://img/3.png\n"
+    )
+
+    response = client.post("/api/products/bulk", content=csv, headers={"content-type": "text/csv"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [p["images"] for p in body["products"]] == [["https://img/1.png", "https://img/2.png"]]
+    assert [error["row"] for error in body["errors"]] == [2]
+
+
+def test_import_products_rejects_a_malformed_body(client: TestClient) -> None:
+    response = client.post("/api/products/bulk", json={"name": "not a list"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.usefixtures("db_session")
+def test_change_category_prices(client: TestClient) -> None:
+    product_data: ProductCreationIn = ProductCreationInFactory(category="bebida", price=10)
+    client.post("/api/products", json=product_data.model_dump())
+
+    response = client.patch("/api/products/categories/bebida/prices", json={"percentage": 15})
+
+    assert response.status_code == 200
+    assert [product["price"] for product in response.json()] == [11.5]
+
+
+@pytest.mark.usefixtures("db_session")
+def test_change_category_prices_rejects_a_price_rounded_to_zero(client: TestClient) -> None:
+    for price in (1, 100):
+        product_data: ProductCreationIn = ProductCreationInFactory(category="bebida", price=price)
+        client.post("/api/products", json=product_data.model_dump())
+
+    response = client.patch("/api/products/categories/bebida/prices", json={"percentage": -99.9})
+
+    assert response.status_code == 400
+    products = client.get("/api/products", params={"category": "bebida"}).json()
+    assert sorted(product["price"] for product in products) == [1, 100]
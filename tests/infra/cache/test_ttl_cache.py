@@ -0,0 +1,144 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import List
+
+from src.infra.cache import CacheStats, TTLCache
+
+THREADS = 8
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Returns the current fake time."""
+        return self.now
+
+
+def _cache(clock: FakeClock, max_size: int = 2) -> TTLCache[str, str]:
+    return TTLCache(max_size=max_size, ttl=10, negative_ttl=1, clock=clock)
+
+
+def test_entries_expire_after_their_ttl() -> None:
+    clock = FakeClock()
+    cache = _cache(clock)
+    cache.put("known", "value")
+    cache.put("unknown", None)
+
+    clock.now = 5
+    assert cache.get("known") == (True, "value")
+    assert cache.get("unknown") == (False, None)
+
+    clock.now = 10
+    assert cache.get("known") == (False, None)
+    assert cache.stats() == CacheStats(
+        size=0, max_size=2, hits=1, misses=2, evictions=0, expirations=2
+    )
+
+
+def test_the_least_recently_used_entry_is_evicted() -> None:
+    cache = _cache(FakeClock())
+    cache.put("a", "a")
+    cache.put("b", "b")
+    cache.get("a")
+
+    cache.put("c", "c")
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, "a")
+    assert cache.stats().evictions == 1
+
+
+def test_negative_entries_are_hits() -> None:
+    cache = _cache(FakeClock())
+    cache.put("unknown", None)
+
+    assert cache.get("unknown") == (True, None)
+
+
+def test_invalidated_entries_are_missed() -> None:
+    cache = _cache(FakeClock())
+    cache.put("a", "a")
+
+    cache.invalidate("a", "b")
+
+    assert cache.get("a") == (False, None)
+
+
+def test_a_cache_without_size_stores_nothing() -> None:
+    cache = _cache(FakeClock(), max_size=0)
+    cache.put("a", "a")
+
+    assert cache.get("a") == (False, None)
+
+
+def test_configuring_a_cache_drops_its_entries_only_when_it_changes() -> None:
+    clock = FakeClock()
+    cache = _cache(clock)
+    cache.put("a", "a")
+
+    cache.configure(max_size=2, ttl=10, negative_ttl=1)
+    assert cache.get("a") == (True, "a")
+
+    cache.configure(max_size=5, ttl=1)
+    cache.put("b", "b")
+    clock.now = 1
+
+    assert cache.get("a") == (False, None)
+    assert cache.get("b") == (False, None)
+    assert cache.stats().max_size == 5
+
+
+def test_concurrent_misses_share_a_single_load() -> None:
+    cache = _cache(FakeClock())
+    loads = []
+    barrier = Barrier(THREADS)
+
+    def _load() -> str:
+        loads.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    def _get() -> str | None:
+        barrier.wait()
+        return cache.get_or_load("key", _load)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(lambda _: _get(), range(THREADS)))
+
+    assert results == ["value"] * THREADS
+    assert len(loads) == 1
+    assert cache.stats().coalesced == THREADS - 1
+
+
+def test_a_load_that_raced_with_an_invalidation_is_not_stored() -> None:
+    cache = _cache(FakeClock())
+
+    def _load() -> str:
+        cache.invalidate("key")
+        return "stale"
+
+    assert cache.get_or_load("key", _load) == "stale"
+    assert cache.get_or_load("key", lambda: "fresh") == "fresh"
+    assert cache.get("key") == (True, "fresh")
+
+
+def test_concurrent_async_misses_share_a_single_load() -> None:
+    cache = _cache(FakeClock())
+    loads = []
+
+    async def _load() -> str:
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def _get_all() -> List[str | None]:
+        return await asyncio.gather(*(cache.get_or_load_async("key", _load) for _ in range(4)))
+
+    assert asyncio.run(_get_all()) == ["value"] * 4
+    assert len(loads) == 1
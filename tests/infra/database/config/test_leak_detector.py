@@ -0,0 +1,50 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+
+from src.infra.database.config import ConnectionLeakDetector
+from src.infra.database.config.database import engine
+
+
+def test_report_logs_connections_still_held(caplog: pytest.LogCaptureFixture) -> None:
+    detector = ConnectionLeakDetector(engine, capture_stack=True)
+    owner = object()
+
+    with detector.track(owner):
+        leaked = engine.connect()
+        leaked.execute(text("SELECT 1"))
+
+    try:
+        with caplog.at_level(logging.WARNING):
+            assert detector.report(owner) == 1
+        assert "test_leak_detector.py" in caplog.text
+    finally:
+        leaked.close()
+
+    assert detector.report(owner) == 0
+
+
+def test_report_ignores_returned_connections() -> None:
+    detector = ConnectionLeakDetector(engine)
+    owner = object()
+
+    with detector.track(owner), engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert detector.held_by(owner) == []
+    assert detector.report(owner) == 0
+
+
+def test_connections_checked_out_outside_track_are_ignored() -> None:
+    detector = ConnectionLeakDetector(engine)
+    owner = object()
+
+    with detector.track(owner):
+        pass
+    connection = engine.connect()
+
+    try:
+        assert detector.report(owner) == 0
+    finally:
+        connection.close()
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.infra.database.config import InstrumentedQueuePool, get_engine
+
+
+def test_checkouts_and_timeouts_are_recorded() -> None:
+    engine = create_engine(
+        get_engine().url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+    try:
+        with engine.connect():
+            busy = engine.pool.metrics_snapshot()
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        metrics = engine.pool.metrics_snapshot()
+    finally:
+        engine.dispose()
+
+    assert busy.checked_out == 1
+    assert busy.saturation == 1.0
+    assert metrics.checked_out == 0
+    assert metrics.checkouts == 2
+    assert metrics.timeouts == 1
+    assert metrics.wait_seconds_sum >= 0.05
+    assert metrics.wait_buckets[-1] == 2
+
+
+def test_metrics_survive_pool_recreation() -> None:
+    engine = create_engine(get_engine().url, poolclass=InstrumentedQueuePool)
+
+    try:
+        with engine.connect():
+            pass
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert engine.pool.metrics_snapshot().checkouts == 2
+    finally:
+        engine.dispose()
@@ -0,0 +1,72 @@
+from typing import Iterator, List
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Engine, create_engine, event
+
+from src.core.domain.entities import Customer
+from src.core.domain.value_objects import Category, OrderStatus
+from src.infra.database.config import RoutingSession
+from src.infra.database.config.database import engine
+from src.infra.database.repositories import (
+    SQlAlchemyCustomerRepository,
+    SQLAlchemyOrderRepository,
+    SQLAlchemyProductRepository,
+)
+from tests.factories.core.domain.entities.customer_factory import CustomerFactory
+
+
+@pytest.fixture
+def reader() -> Iterator[Engine]:
+    """A second engine standing in for the read replica."""
+    reader = create_engine(engine.url)
+    yield reader
+    reader.dispose()
+
+
+def _statements_on(bind: Engine) -> List[str]:
+    statements: List[str] = []
+    event.listen(bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_read_only_methods_run_on_the_replica(reader: Engine) -> None:
+    on_reader = _statements_on(reader)
+
+    with RoutingSession(bind=engine, reader=reader) as session:
+        SQLAlchemyProductRepository(session).get_by_category(Category.LANCHE)
+
+    assert len(on_reader) == 1
+
+
+def test_reads_after_a_write_stay_on_the_primary(reader: Engine) -> None:
+    on_reader = _statements_on(reader)
+    customer = CustomerFactory()
+
+    with RoutingSession(bind=engine, reader=reader) as session:
+        repository = SQlAlchemyCustomerRepository(session)
+        repository.add(Customer(name=customer.name, email=customer.email, cpf=customer.cpf))
+        found = repository.get_by_cpf(customer.cpf)
+
+        assert session.pinned_to_primary
+
+    assert found is not None
+    assert on_reader == []
+
+
+def test_selects_that_update_through_a_cte_pin_to_the_primary(reader: Engine) -> None:
+    with RoutingSession(bind=engine, reader=reader) as session:
+        SQLAlchemyOrderRepository(session).update_status(
+            uuid4(), OrderStatus.RECEIVED, OrderStatus.RECEIVED.allowed_sources()
+        )
+
+        assert session.pinned_to_primary
+
+
+def test_write_units_run_on_the_primary(reader: Engine) -> None:
+    on_reader = _statements_on(reader)
+
+    with RoutingSession(bind=engine, reader=reader, primary=True) as session:
+        SQLAlchemyProductRepository(session).get_by_category(Category.LANCHE)
+
+    assert on_reader == []
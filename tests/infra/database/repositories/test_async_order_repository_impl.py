@@ -0,0 +1,84 @@
+import asyncio
+from typing import Awaitable, Callable, List, TypeVar
+
+from src.core.domain.entities import Customer, Order, Product
+from src.core.domain.repositories import OrderPageCursor
+from src.core.domain.value_objects import OrderStatus
+from src.infra.database.config import dispose_async_engine, get_async_sessionmaker
+from src.infra.database.config.database import Session
+from src.infra.database.repositories import (
+    AsyncSQLAlchemyOrderRepository,
+    SQLAlchemyOrderRepository,
+)
+from tests.infra.database.repositories.test_order_repository_impl import _create_orders
+
+T = TypeVar("T")
+
+
+def _run(query: Callable[[AsyncSQLAlchemyOrderRepository], Awaitable[T]]) -> T:
+    """Runs the query on its own event loop, closing the asyncio connections afterwards."""
+
+    async def run() -> T:
+        try:
+            async with get_async_sessionmaker()() as session:
+                return await query(AsyncSQLAlchemyOrderRepository(session))
+        finally:
+            await dispose_async_engine()
+
+    return asyncio.run(run())
+
+
+def test_list_page_matches_the_synchronous_repository(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 7)
+
+    async def walk(repository: AsyncSQLAlchemyOrderRepository) -> List[Order]:
+        seen: List[Order] = []
+        after = None
+        while page := await repository.list_page(3, after):
+            seen.extend(page)
+            last = page[-1]
+            after = OrderPageCursor(created_at=last.created_at, id=last.id, status=last.status)
+        return seen
+
+    orders = _run(walk)
+
+    assert [order.uuid for order in orders] == [
+        order.uuid for order in SQLAlchemyOrderRepository(db_session).list_page(10)
+    ]
+    assert all(len(order.items) == len(create_products_in_db) for order in orders)
+
+
+def test_list_orders_sorted_by_status_filters_and_sorts_in_the_database(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    for status in OrderStatus:
+        _create_orders(db_session, create_customer_in_db, create_products_in_db, 2, status)
+    statuses = OrderStatus.kitchen_queue()
+
+    orders = _run(lambda repository: repository.list_orders_sorted_by_status(statuses))
+
+    assert [order.status for order in orders] == [status for status in statuses for _ in range(2)]
+
+
+def test_update_status_returns_the_updated_order(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 1)
+    order_uuid = SQLAlchemyOrderRepository(db_session).list_all()[0].uuid
+
+    updated = _run(
+        lambda repository: repository.update_status(
+            order_uuid, OrderStatus.RECEIVED, [OrderStatus.PAYMENT_PENDING]
+        )
+    )
+
+    assert updated.uuid == order_uuid
+    assert updated.status == OrderStatus.RECEIVED
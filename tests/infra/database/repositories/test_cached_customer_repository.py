@@ -0,0 +1,74 @@
+from dataclasses import FrozenInstanceError
+from typing import Hashable
+
+import pytest
+
+from src.core.domain.entities import Customer
+from src.core.domain.repositories import CustomerView
+from src.core.domain.value_objects import CPF
+from src.infra.cache import TTLCache
+from src.infra.database.config.database import Session
+from src.infra.database.repositories import CachedCustomerRepository, SQlAlchemyCustomerRepository
+from tests.factories.core.domain.entities.customer_factory import CustomerFactory
+from tests.infra.database.repositories.test_order_repository_impl import count_queries
+
+
+@pytest.fixture
+def repository(db_session: Session) -> CachedCustomerRepository:
+    cache: TTLCache[Hashable, object] = TTLCache(max_size=10, ttl=60)
+    return CachedCustomerRepository(SQlAlchemyCustomerRepository(db_session), cache)
+
+
+def test_repeated_lookups_are_served_from_the_cache(
+    repository: CachedCustomerRepository, create_customer_in_db: Customer
+) -> None:
+    repository.get_by_uuid(create_customer_in_db.uuid)
+
+    with count_queries() as statements:
+        found = repository.get_by_uuid(create_customer_in_db.uuid)
+
+    assert found == create_customer_in_db
+    assert statements == []
+
+
+def test_cached_customers_cannot_be_changed(
+    repository: CachedCustomerRepository, create_customer_in_db: Customer
+) -> None:
+    first = repository.get_by_cpf(create_customer_in_db.cpf)
+
+    with pytest.raises(FrozenInstanceError):
+        first.name = "Changed"
+
+    assert repository.get_by_cpf(create_customer_in_db.cpf).name == create_customer_in_db.name
+
+
+def test_adding_a_customer_drops_its_negative_entries(
+    repository: CachedCustomerRepository,
+) -> None:
+    data = CustomerFactory()
+    cpf = data.cpf
+    assert repository.get_view_by_cpf(cpf) is None
+
+    repository.add(Customer(name=data.name, email=data.email, cpf=data.cpf))
+
+    assert repository.get_view_by_cpf(cpf) is not None
+
+
+def test_a_lookup_that_races_an_add_does_not_cache_its_miss(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = CustomerFactory()
+    customers = SQlAlchemyCustomerRepository(db_session)
+    repository = CachedCustomerRepository(customers, TTLCache(max_size=10, ttl=60))
+    get_view_by_cpf = customers.get_view_by_cpf
+
+    def add_during_the_lookup(cpf: CPF) -> CustomerView | None:
+        missing = get_view_by_cpf(cpf)
+        repository.add(Customer(name=data.name, email=data.email, cpf=data.cpf))
+        return missing
+
+    monkeypatch.setattr(customers, "get_view_by_cpf", add_during_the_lookup)
+    assert repository.get_view_by_cpf(data.cpf) is None
+    monkeypatch.undo()
+
+    assert repository.get_view_by_cpf(data.cpf) is not None
@@ -0,0 +1,76 @@
+from dataclasses import FrozenInstanceError, replace
+from typing import List
+
+import pytest
+
+from src.core.domain.entities import Product
+from src.infra.cache import TTLCache
+from src.infra.database.config.database import Session
+from src.infra.database.repositories import CachedProductRepository, SQLAlchemyProductRepository
+from tests.infra.database.repositories.test_order_repository_impl import count_queries
+
+
+@pytest.fixture
+def repository(db_session: Session) -> CachedProductRepository:
+    cache: TTLCache[str, object] = TTLCache(max_size=1, ttl=60)
+    return CachedProductRepository(SQLAlchemyProductRepository(db_session), cache)
+
+
+def test_lookups_are_served_from_a_single_catalog_load(
+    repository: CachedProductRepository, create_products_in_db: List[Product]
+) -> None:
+    product = create_products_in_db[0]
+
+    with count_queries() as statements:
+        by_uuid = repository.get_by_uuid(product.uuid)
+        by_category = repository.get_by_category(product.category)
+
+    assert len(statements) == 1
+    assert by_uuid == product
+    assert product in by_category
+
+
+def test_cached_products_cannot_be_changed(
+    repository: CachedProductRepository, create_products_in_db: List[Product]
+) -> None:
+    product = create_products_in_db[0]
+    first = repository.get_by_uuid(product.uuid)
+
+    with pytest.raises(FrozenInstanceError):
+        first.price = 99.9
+    with pytest.raises(AttributeError):
+        first.images.append("https://example.com/changed.png")
+
+    assert repository.get_by_uuid(product.uuid) == product
+
+
+def test_writes_drop_the_cached_catalog(
+    repository: CachedProductRepository, create_products_in_db: List[Product]
+) -> None:
+    product = create_products_in_db[0]
+    repository.get_by_uuid(product.uuid)
+
+    product = replace(product, price=99.9)
+    repository.update(product.uuid, product)
+    assert repository.get_by_uuid(product.uuid).price == 99.9
+
+    repository.change_prices_by_category(product.category, 2)
+    assert repository.get_by_uuid(product.uuid).price == 199.8
+
+    repository.delete(product.uuid)
+    assert repository.get_by_uuid(product.uuid) is None
+
+
+def test_checkout_lookups_see_the_writes_of_other_processes(
+    repository: CachedProductRepository, db_session: Session, create_products_in_db: List[Product]
+) -> None:
+    product, deleted = create_products_in_db[:2]
+    repository.get_by_uuid(product.uuid)
+    other_process = SQLAlchemyProductRepository(db_session)
+
+    other_process.update(product.uuid, replace(product, price=99.9))
+    other_process.delete(deleted.uuid)
+
+    products = repository.get_by_uuids({product.uuid, deleted.uuid})
+
+    assert [(p.uuid, p.price) for p in products] == [(product.uuid, 99.9)]
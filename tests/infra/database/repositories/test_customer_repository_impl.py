@@ -0,0 +1,22 @@
+from src.core.domain.entities import Customer
+from src.core.domain.repositories import CustomerView
+from src.infra.database.config.database import Session
+from src.infra.database.repositories import SQlAlchemyCustomerRepository
+
+
+def test_get_view_by_cpf_reads_the_customer_without_loading_it(
+    db_session: Session, create_customer_in_db: Customer
+) -> None:
+    db_session.expunge_all()
+
+    view = SQlAlchemyCustomerRepository(db_session).get_view_by_cpf(create_customer_in_db.cpf)
+
+    assert view == CustomerView(
+        uuid=create_customer_in_db.uuid,
+        name=create_customer_in_db.name,
+        cpf=create_customer_in_db.cpf.number,
+        email=create_customer_in_db.email.address,
+        created_at=create_customer_in_db.created_at,
+        updated_at=create_customer_in_db.updated_at,
+    )
+    assert len(db_session.identity_map) == 0
@@ -0,0 +1,251 @@
+from contextlib import contextmanager
+from dataclasses import FrozenInstanceError
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event
+
+from src.core.domain.entities import Customer, Order, OrderItem, Product
+from src.core.domain.repositories import OrderPageCursor
+from src.core.domain.value_objects import OrderStatus
+from src.infra.database.config.database import Session, engine
+from src.infra.database.repositories import LoadingStrategy, SQLAlchemyOrderRepository
+
+
+@contextmanager
+def count_queries() -> Iterator[List[str]]:
+    statements: List[str] = []
+
+    def _on_execute(_conn, _cursor, statement, *_args) -> None:  # noqa: ANN001, ANN002
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _on_execute)
+
+
+def _create_orders(
+    session: Session,
+    customer: Customer,
+    products: List[Product],
+    amount: int,
+    status: OrderStatus = OrderStatus.PAYMENT_PENDING,
+) -> None:
+    repository = SQLAlchemyOrderRepository(session)
+    for _ in range(amount):
+        repository.create(
+            Order(
+                _customer=customer,
+                _status=status,
+                _items=[
+                    OrderItem(product=product, quantity=2, unit_price=product.price)
+                    for product in products
+                ],
+            )
+        )
+    session.expunge_all()
+
+
+@pytest.mark.parametrize(
+    "strategy, expected_queries",
+    [(LoadingStrategy.SELECTIN, 4), (LoadingStrategy.JOINED, 1)],
+)
+@pytest.mark.parametrize("amount", [1, 5, 20])
+def test_list_all_issues_a_fixed_number_of_queries(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+    strategy: LoadingStrategy,
+    expected_queries: int,
+    amount: int,
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, amount)
+    repository = SQLAlchemyOrderRepository(db_session, {"list_all": strategy})
+
+    with count_queries() as statements:
+        orders = repository.list_all()
+
+    assert len(orders) == amount
+    assert all(len(order.items) == len(create_products_in_db) for order in orders)
+    assert len(statements) == expected_queries
+
+
+def test_list_all_shares_the_customer_and_products_across_orders(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 3)
+
+    orders = SQLAlchemyOrderRepository(db_session).list_all()
+
+    assert len({id(order.customer) for order in orders}) == 1
+    assert len({id(item.product) for order in orders for item in order.items}) == len(
+        create_products_in_db
+    )
+
+
+def test_shared_entities_cannot_be_changed_through_one_order(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 2)
+
+    first, second = SQLAlchemyOrderRepository(db_session).list_all()
+
+    assert first.customer is second.customer
+    assert first.items[0].product is second.items[0].product
+    with pytest.raises(FrozenInstanceError):
+        first.customer.name = "Changed"
+    with pytest.raises(FrozenInstanceError):
+        first.items[0].product.price = 0.01
+    assert second.customer.name == create_customer_in_db.name
+    assert second.items[0].product.price == create_products_in_db[0].price
+
+
+@pytest.mark.parametrize(
+    "strategy, expected_queries",
+    [(LoadingStrategy.SELECTIN, 4), (LoadingStrategy.JOINED, 1)],
+)
+def test_get_by_uuid_loads_the_whole_order_graph(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+    strategy: LoadingStrategy,
+    expected_queries: int,
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 1)
+    order_uuid = SQLAlchemyOrderRepository(db_session).list_all()[0].uuid
+    db_session.expunge_all()
+    repository = SQLAlchemyOrderRepository(db_session, {"get_by_uuid": strategy})
+
+    with count_queries() as statements:
+        order = repository.get_by_uuid(order_uuid)
+
+    assert order.customer.uuid == create_customer_in_db.uuid
+    assert {item.product.uuid for item in order.items} == {
+        product.uuid for product in create_products_in_db
+    }
+    assert len(statements) == expected_queries
+
+
+def test_list_page_walks_every_order_exactly_once(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 7)
+    repository = SQLAlchemyOrderRepository(db_session)
+
+    seen: List[int] = []
+    after = None
+    while page := repository.list_page(3, after):
+        seen.extend(order.id for order in page)
+        last = page[-1]
+        after = OrderPageCursor(created_at=last.created_at, id=last.id, status=last.status)
+
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_stream_all_yields_every_order_oldest_first_one_batch_at_a_time(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 5)
+    orders = SQLAlchemyOrderRepository(db_session).list_all()
+    expected = [order.id for order in sorted(orders, key=lambda o: (o.created_at, o.id))]
+    db_session.expunge_all()
+    repository = SQLAlchemyOrderRepository(db_session)
+
+    with count_queries() as statements:
+        streamed = list(repository.stream_all(batch_size=2))
+
+    # One query for the orders, then the related rows of each of the three batches.
+    assert len(statements) == 1 + 3 * 3
+    assert [order.id for order in streamed] == expected
+    assert all(len(order.items) == len(create_products_in_db) for order in streamed)
+
+
+def test_list_orders_sorted_by_status_filters_and_sorts_in_the_database(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    for status in OrderStatus:
+        _create_orders(db_session, create_customer_in_db, create_products_in_db, 2, status)
+    repository = SQLAlchemyOrderRepository(db_session)
+    statuses = OrderStatus.kitchen_queue()
+
+    seen: List[Order] = []
+    after = None
+    while page := repository.list_orders_sorted_by_status(statuses, 4, after):
+        seen.extend(page)
+        last = page[-1]
+        after = OrderPageCursor(created_at=last.created_at, id=last.id, status=last.status)
+
+    assert [order.status for order in seen] == [status for status in statuses for _ in range(2)]
+    assert len({order.id for order in seen}) == len(seen)
+
+
+def test_update_statuses_moves_only_the_orders_in_an_allowed_status(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(
+        db_session, create_customer_in_db, create_products_in_db, 2, OrderStatus.RECEIVED
+    )
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 1, OrderStatus.READY)
+    repository = SQLAlchemyOrderRepository(db_session)
+    uuids = [order.uuid for order in repository.list_all()]
+
+    with count_queries() as statements:
+        updated = repository.update_statuses(uuids, OrderStatus.PROCESSING, [OrderStatus.RECEIVED])
+
+    assert len(statements) == 1
+    assert len(updated) == 2
+    assert sorted(repository.get_statuses(uuids).values()) == sorted([
+        OrderStatus.PROCESSING,
+        OrderStatus.PROCESSING,
+        OrderStatus.READY,
+    ])
+
+
+def test_update_status_checks_updates_and_loads_the_order_in_one_statement(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 1)
+    repository = SQLAlchemyOrderRepository(db_session)
+    order_uuid = repository.list_all()[0].uuid
+
+    with count_queries() as statements:
+        updated = repository.update_status(
+            order_uuid, OrderStatus.RECEIVED, OrderStatus.RECEIVED.allowed_sources()
+        )
+
+    assert len(statements) == 1
+    assert updated.status == OrderStatus.RECEIVED
+    assert len(updated.items) == len(create_products_in_db)
+
+
+def test_update_status_skips_an_order_in_another_status(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    _create_orders(db_session, create_customer_in_db, create_products_in_db, 1)
+    repository = SQLAlchemyOrderRepository(db_session)
+    order_uuid = repository.list_all()[0].uuid
+
+    updated = repository.update_status(
+        order_uuid, OrderStatus.READY, OrderStatus.READY.allowed_sources()
+    )
+
+    assert updated is None
+    assert repository.get_statuses([order_uuid]) == {order_uuid: OrderStatus.PAYMENT_PENDING}
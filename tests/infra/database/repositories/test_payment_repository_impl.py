@@ -0,0 +1,82 @@
+from typing import List
+
+from src.core.domain.entities import Customer, Payment, Product
+from src.core.domain.entities.payment import PaymentStatus
+from src.core.domain.repositories import PaymentStatusView
+from src.core.domain.value_objects import OrderStatus
+from src.infra.database.config.database import Session
+from src.infra.database.repositories import (
+    SQLAlchemyOrderRepository,
+    SQLAlchemyPaymentRepository,
+)
+from tests.infra.database.repositories.test_order_repository_impl import (
+    _create_orders,
+    count_queries,
+)
+
+
+def _create_payment(
+    session: Session,
+    customer: Customer,
+    products: List[Product],
+    order_status: OrderStatus = OrderStatus.PAYMENT_PENDING,
+) -> Payment:
+    _create_orders(session, customer, products, 1, order_status)
+    (order,) = SQLAlchemyOrderRepository(session).list_all()
+    return SQLAlchemyPaymentRepository(session).add(Payment(order=order, details={"id": "1"}))
+
+
+def _approve(repository: SQLAlchemyPaymentRepository, payment: Payment) -> bool:
+    return repository.confirm(
+        payment.uuid,
+        PaymentStatus.APPROVED,
+        PaymentStatus.APPROVED.allowed_sources(),
+        OrderStatus.RECEIVED,
+        OrderStatus.RECEIVED.allowed_sources(),
+    )
+
+
+def test_confirm_updates_the_payment_and_its_order_with_two_statements(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    payment = _create_payment(db_session, create_customer_in_db, create_products_in_db)
+    repository = SQLAlchemyPaymentRepository(db_session)
+
+    with count_queries() as statements:
+        confirmed = _approve(repository, payment)
+
+    assert confirmed
+    assert len(statements) == 2
+    assert repository.get_statuses(payment.uuid) == (PaymentStatus.APPROVED, OrderStatus.RECEIVED)
+
+
+def test_confirm_leaves_the_payment_untouched_when_the_order_cannot_move(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    payment = _create_payment(
+        db_session, create_customer_in_db, create_products_in_db, OrderStatus.COMPLETED
+    )
+    repository = SQLAlchemyPaymentRepository(db_session)
+
+    assert not _approve(repository, payment)
+    assert repository.get_statuses(payment.uuid) == (PaymentStatus.PENDING, OrderStatus.COMPLETED)
+
+
+def test_get_status_view_reads_the_status_without_loading_the_payment(
+    db_session: Session,
+    create_customer_in_db: Customer,
+    create_products_in_db: List[Product],
+) -> None:
+    payment = _create_payment(db_session, create_customer_in_db, create_products_in_db)
+    db_session.expunge_all()
+
+    with count_queries() as statements:
+        view = SQLAlchemyPaymentRepository(db_session).get_status_view(payment.order.uuid)
+
+    assert view == PaymentStatusView(uuid=payment.uuid, status=PaymentStatus.PENDING)
+    assert len(statements) == 1
+    assert len(db_session.identity_map) == 0